@@ -1,21 +1,15 @@
 import Link from 'next/link'
-import { getTeamResults, calculateStreakAndLast10 } from '../lib/teamStreakUtils'
 
-export default function StandingsTable({ standings, teams, schedule = [], useFullName = false, hideLeagueHeaders = false, enhanced = false }) {
+export default function StandingsTable({ standings, teams, streaks = {}, useFullName = false, hideLeagueHeaders = false, enhanced = false }) {
   // Create a lookup for team ID to team name
   const teamMap = {}
   const teamInfoMap = {}
-  const teamExtras = {}
   if (Array.isArray(teams)) teams.forEach(team => {
     teamMap[team.id] = team.name
     teamInfoMap[team.id] = {
       logo: team.logo || `/logos/${team.id}.png`,
       color: team.color || '#ccc'
     }
-    if (enhanced) {
-      const results = getTeamResults(schedule, team.id)
-      teamExtras[team.id] = calculateStreakAndLast10(results)
-    }
   })
 
   return (
@@ -50,7 +44,7 @@ export default function StandingsTable({ standings, teams, schedule = [], useFul
                 </thead>
                 <tbody>
                   {divisionTeams.map((team) => {
-                    const extras = teamExtras[team.team] || {}
+                    const extras = (enhanced && streaks[team.team]) || {}
                     const streak = extras.streak || '—'
                     const last10 = extras.last10 || '—'
                     const streakClass =
@@ -0,0 +1,47 @@
+// Box scores for getStaticProps, from data/boxscores/<Game ID>.json or, when
+// a game has no file there, the data/boxscores.jsonl archive (format
+// described in scripts/boxscore_archive.py).
+import fs from 'fs'
+import path from 'path'
+
+const boxscoreDir = path.join(process.cwd(), 'data', 'boxscores')
+const archivePath = `${boxscoreDir}.jsonl`
+const indexPath = `${boxscoreDir}.index.json`
+
+let archiveIndex
+
+function loadArchiveIndex() {
+  if (archiveIndex === undefined) {
+    archiveIndex = fs.existsSync(indexPath) ? JSON.parse(fs.readFileSync(indexPath, 'utf8')).games : {}
+  }
+  return archiveIndex
+}
+
+function readFromArchive(gameId) {
+  const entry = loadArchiveIndex()[gameId]
+  if (!entry) return null
+  const [offset, length] = entry
+  const buffer = Buffer.alloc(length)
+  const fd = fs.openSync(archivePath, 'r')
+  try {
+    fs.readSync(fd, buffer, 0, length, offset)
+  } finally {
+    fs.closeSync(fd)
+  }
+  return JSON.parse(buffer.toString('utf8'))
+}
+
+// Every Game ID with a box score, from either layout.
+export function boxscoreIds() {
+  const files = fs.existsSync(boxscoreDir)
+    ? fs.readdirSync(boxscoreDir).filter(f => f.endsWith('.json')).map(f => f.replace('.json', ''))
+    : []
+  return [...new Set([...files, ...Object.keys(loadArchiveIndex())])]
+}
+
+// One game's box score, or null if neither layout has it.
+export function readBoxscore(gameId) {
+  const filePath = path.join(boxscoreDir, `${gameId}.json`)
+  if (fs.existsSync(filePath)) return JSON.parse(fs.readFileSync(filePath, 'utf8'))
+  return readFromArchive(gameId)
+}
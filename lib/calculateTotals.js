@@ -1,5 +1,10 @@
+// typed rows (the *.typed.json files) are added as they are; display strings are parsed
+function toNumber(value) {
+  return typeof value === 'number' ? value : parseFloat(value) || 0
+}
+
 export function sum(stats, key) {
-  return stats.reduce((acc, obj) => acc + (parseFloat(obj[key]) || 0), 0)
+  return stats.reduce((acc, obj) => acc + toNumber(obj[key]), 0)
 }
 
 export function calculateBattingTotals(players) {
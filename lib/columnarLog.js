@@ -0,0 +1,91 @@
+// Readers for the *_log.columnar.json files written by scripts/generate_stats.py
+// (format described in scripts/columnar_log.py).
+
+function decodeColumn(log, name, values) {
+  if (!Array.isArray(values)) {
+    const full = new Array(log.rows).fill(null)
+    let row = -1
+    values.gaps.forEach((gap, i) => {
+      row += gap
+      full[row] = values.values[i]
+    })
+    return full
+  }
+  const dictionary = log.dictionaries[name]
+  return dictionary ? values.map(code => dictionary[code]) : values
+}
+
+// Decoded once per log, so pulling many players' rows out of one log
+// (a page per player) doesn't decode every column (or rebuild the sparse
+// set) each time.
+const decoded = new WeakMap()
+
+function decodeColumns(log) {
+  if (!decoded.has(log)) {
+    decoded.set(log, {
+      columns: log.columns.map((name, i) => decodeColumn(log, name, log.values[i])),
+      sparse: new Set(log.sparse),
+    })
+  }
+  return decoded.get(log)
+}
+
+function buildRow(log, { columns, sparse }, i) {
+  const row = {}
+  log.columns.forEach((name, c) => {
+    const value = columns[c][i]
+    if (value == null && sparse.has(name)) return
+    row[name] = value
+  })
+  return row
+}
+
+// Every row as the object the row-format log (e.g. batting_log.json) holds.
+export function expandRows(log) {
+  const decodedLog = decodeColumns(log)
+  return Array.from({ length: log.rows }, (_, i) => buildRow(log, decodedLog, i))
+}
+
+// Rows whose dictionary-encoded column equals value (e.g. one player's games),
+// found by comparing codes rather than expanding the whole log.
+export function rowsWhere(log, column, value) {
+  const c = log.columns.indexOf(column)
+  const code = (log.dictionaries[column] || []).indexOf(value)
+  if (c === -1 || code === -1) return []
+
+  const decodedLog = decodeColumns(log)
+  const rows = []
+  log.values[c].forEach((v, i) => {
+    if (v === code) rows.push(buildRow(log, decodedLog, i))
+  })
+  return rows
+}
+
+// A columnar log holding the same rows as a row-format log, with the
+// dictionary columns encoded; every column is sparse since rows leave out
+// the keys they don't have.
+export function fromRows(rows, dictionary = ['Player ID']) {
+  const columns = [...new Set(rows.flatMap(Object.keys))]
+  const log = { version: 1, rows: rows.length, columns, dictionaries: {}, sparse: columns, values: [] }
+  for (const name of columns) {
+    const values = rows.map(row => row[name] ?? null)
+    if (dictionary.includes(name)) {
+      const uniques = [...new Set(values)]
+      const codes = new Map(uniques.map((v, i) => [v, i]))
+      log.dictionaries[name] = uniques
+      log.values.push(values.map(v => codes.get(v)))
+    } else {
+      log.values.push(values)
+    }
+  }
+  return log
+}
+
+// <name>.columnar.json from statsDir, or the committed row-format <name>.json
+// until scripts/build.py has written the columnar file. fs/path are passed
+// in from getStaticProps.
+export function readLog(fs, path, statsDir, name) {
+  const columnarPath = path.join(statsDir, `${name}.columnar.json`)
+  if (fs.existsSync(columnarPath)) return JSON.parse(fs.readFileSync(columnarPath, 'utf8'))
+  return fromRows(JSON.parse(fs.readFileSync(path.join(statsDir, `${name}.json`), 'utf8')))
+}
@@ -0,0 +1,57 @@
+// Readers for data/stats/standings_by_date.json written by scripts/build.py
+// (format described in scripts/standings.py).
+
+const LEAGUES = ['AL', 'NL']
+const DIVISIONS = ['East', 'Central', 'West']
+
+// Index of the last snapshot on or before date (YYYY-MM-DD), or -1 if the
+// season hadn't started yet.
+export function dateIndex(byDate, date) {
+  let lo = 0
+  let hi = byDate.dates.length - 1
+  let found = -1
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1
+    if (byDate.dates[mid] <= date) {
+      found = mid
+      lo = mid + 1
+    } else {
+      hi = mid - 1
+    }
+  }
+  return found
+}
+
+function formatPct(w, l) {
+  const pct = w + l > 0 ? w / (w + l) : 0
+  return pct === 1 ? '1.000' : `.${String(Math.round(pct * 1000)).padStart(3, '0')}`
+}
+
+// Standings as of date, in the same shape as standings.json.
+export function standingsAsOf(byDate, teams, date) {
+  const d = dateIndex(byDate, date)
+  const column = name => (d === -1 ? byDate.teams.map(() => 0) : byDate[name][d])
+  const [W, L, GB, rank] = ['W', 'L', 'GB', 'rank'].map(column)
+  const meta = Object.fromEntries(teams.map(t => [t.id, t]))
+
+  const standings = {}
+  LEAGUES.forEach(league => {
+    DIVISIONS.forEach(division => {
+      const members = byDate.teams
+        .map((id, i) => i)
+        .filter(i => meta[byDate.teams[i]]?.league === league && meta[byDate.teams[i]]?.division === division)
+        .sort((a, b) => rank[a] - rank[b])
+      if (!members.length) return
+      const leader = members[0]
+      standings[league] = standings[league] || {}
+      standings[league][division] = members.map(i => ({
+        team: byDate.teams[i],
+        W: W[i],
+        L: L[i],
+        'W-L%': formatPct(W[i], L[i]),
+        GB: W[i] === W[leader] && L[i] === L[leader] ? '--' : GB[i],
+      }))
+    })
+  })
+  return standings
+}
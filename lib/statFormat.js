@@ -0,0 +1,53 @@
+// Display formatting for the typed stat files (data/stats/<section>.typed.json),
+// driven by data/stats/stat_formats.json (the schema in scripts/stat_format.py).
+
+function formatOuts(outs) {
+  return `${Math.floor(outs / 3)}.${outs % 3}`
+}
+
+// Python's f"{x:.nf}" and toFixed agree here: the typed values are already
+// rounded to the places they are shown at.
+export function formatValue(value, spec) {
+  if (value === null || value === undefined) return spec.missing ?? ''
+  switch (spec.kind) {
+    case 'rate':
+      return value.toFixed(spec.decimals).replace(/^0+/, '')
+    case 'fixed':
+      return value.toFixed(spec.decimals)
+    case 'outs':
+      return formatOuts(value)
+    case 'percent':
+      return `${value}%`
+    case 'count':
+      return value || spec.zero
+    default:
+      return value
+  }
+}
+
+export function formatRecord(record, fields) {
+  const row = {}
+  for (const [key, value] of Object.entries(record)) {
+    row[key] = key in fields ? formatValue(value, fields[key]) : value
+  }
+  return row
+}
+
+// formats is stat_formats.json, section one of its keys ('batting', 'pitching', ...)
+export function formatRecords(records, formats, section) {
+  const fields = formats[section] || {}
+  return records.map(record => formatRecord(record, fields))
+}
+
+// <section>.typed.json formatted for display, or the already formatted
+// <section>.json until scripts/build.py has written the typed file and
+// stat_formats.json. fs/path are passed in from getStaticProps.
+export function readSection(fs, path, statsDir, section) {
+  const typedPath = path.join(statsDir, `${section}.typed.json`)
+  const formatsPath = path.join(statsDir, 'stat_formats.json')
+  if (!fs.existsSync(typedPath) || !fs.existsSync(formatsPath)) {
+    return JSON.parse(fs.readFileSync(path.join(statsDir, `${section}.json`), 'utf8'))
+  }
+  const formats = JSON.parse(fs.readFileSync(formatsPath, 'utf8'))
+  return formatRecords(JSON.parse(fs.readFileSync(typedPath, 'utf8')), formats, section)
+}
@@ -2,13 +2,17 @@
 import { useState } from 'react'
 import { getTeamToLeagueMap } from '../lib/teamUtils'
 import SortableTable from '../components/SortableTable'
+import { readSection } from '../lib/statFormat'
 import { getQualificationThresholds } from '../components/getQualificationThresholds'
 
 export async function getStaticProps() {
   const fs = await import('fs')
   const path = await import('path')
 
-  const data = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'stats', 'batting.json'), 'utf8'))
+  // the typed file (numbers, null for undefined rates) formatted the way batting.json is,
+  // or batting.json itself before the typed file has been built
+  const statsDir = path.join(process.cwd(), 'data', 'stats')
+  const data = readSection(fs, path, statsDir, 'batting')
   const teams = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'teams.json'), 'utf8'))
 
   const teamToLeague = getTeamToLeagueMap(teams)
@@ -22,12 +26,6 @@ export default function BattingPage({ data, teamToLeague }) {
   const [league, setLeague] = useState('All')
   const thresholds = getQualificationThresholds()
 
-  const formatRate = (val) => {
-    const num = parseFloat(val)
-    if (isNaN(num)) return val
-    return num === 1 ? "1.000" : num.toFixed(3).replace(/^0\./, '.')
-  }
-
   const filteredData = data.filter(player => {
     const pa = parseInt(player.PA || 0, 10)
     const team = player.team
@@ -41,13 +39,6 @@ export default function BattingPage({ data, teamToLeague }) {
       league === 'All' ||
       (player.team in teamToLeague && teamToLeague[player.team] === league)
     return isQualified && isSplitOK && isLeagueMatch
-  }).map(row => {
-    const formatted = { ...row }
-    formatted.AVG = formatRate(row.AVG)
-    formatted.OBP = formatRate(row.OBP)
-    formatted.SLG = formatRate(row.SLG)
-    formatted.OPS = formatRate(row.OPS)
-    return formatted
   })
 
   const displayedColumns = [
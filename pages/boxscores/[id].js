@@ -1,25 +1,37 @@
-import fs from 'fs'
-import path from 'path'
 import teams from '../../data/teams.json'
 import schedule from '../../data/stats/schedule.json'
 import linescores from '../../data/stats/linescores.json'
 import Link from 'next/link'
+import { boxscoreIds, readBoxscore } from '../../lib/boxscores'
 
 export async function getStaticPaths() {
-  const dir = path.join(process.cwd(), 'data/boxscores')
-  if (!fs.existsSync(dir)) return { paths: [], fallback: false }
-  const files = fs.readdirSync(dir)
-  const paths = files.map(file => ({
-    params: { id: file.replace('.json', '') }
+  const paths = boxscoreIds().map(id => ({
+    params: { id }
   }))
   return { paths, fallback: false }
 }
 
+// The committed linescores.json predates scripts/build.py's format: each team
+// holds twenty inning strings, blank after its last time up, and no R/H/E.
+// Such a game is converted to {innings, team: [R, H, E, ...runs]}, with H and
+// E summed from the box score's lines as the build sums them from the GameLog.
+function fromOldLinescore(old, boxscore) {
+  const linescore = { innings: 0 }
+  for (const [team, cells] of Object.entries(old)) {
+    const last = cells.reduce((n, cell, i) => (cell !== '' ? i + 1 : n), 0)
+    const runs = cells.slice(0, last).map(cell => (cell === '' ? null : Number(cell)))
+    const lines = Object.values(boxscore?.batting?.[team] || {})
+    const total = key => lines.reduce((sum, line) => sum + (Number(line[key]) || 0), 0)
+    linescore[team] = [runs.reduce((sum, r) => sum + (r || 0), 0), total('H'), total('ERR'), ...runs]
+    linescore.innings = Math.max(linescore.innings, runs.length)
+  }
+  return linescore
+}
+
 export async function getStaticProps({ params }) {
-  const filePath = path.join(process.cwd(), 'data/boxscores', `${params.id}.json`)
-  const raw = fs.readFileSync(filePath, 'utf8')
-  const boxscore = JSON.parse(raw)
-  const linescore = linescores[params.id] || null
+  const boxscore = readBoxscore(params.id)
+  const game = linescores[params.id]
+  const linescore = !game ? null : 'innings' in game ? game : fromOldLinescore(game, boxscore)
   return { props: { boxscore, linescore } }
 }
 
@@ -258,43 +270,14 @@ const renderPitching = team => {
         </div>
         {linescore && (
           (() => {
-            const away = linescore[meta.away] || []
-            const home = linescore[meta.home] || []
-
-    // Find the last inning index where at least one team has a value
-            const lastUsedInning = Math.max(
-              ...away.map((val, i) => val && val !== "" ? i : -1),
-              ...home.map((val, i) => val && val !== "" ? i : -1)
-            ) + 1 // +1 to include that inning
-            const trimmedAway = away.slice(0, lastUsedInning)
-            const trimmedHome = home.slice(0, lastUsedInning)
-            const paddedHome = trimmedHome.map((val, i) => {
-              const isLast = i === lastUsedInning - 1
-              const awayHasScore = trimmedAway[i] && trimmedAway[i] !== ""
-              return (val && val !== "") ? val : (isLast && awayHasScore ? "X" : "")
-            })
-
-            const sumInning = arr =>
-              arr.reduce((sum, val) => sum + (parseInt(val) || 0), 0)
-
-            const getHits = team => {
-              return Object.values(boxscore.batting?.[team] || {}).reduce(
-                (sum, player) => sum + (player.H || 0), 0
-              )
-            }
-
-            const getErrors = team => {
-              return Object.values(boxscore.batting?.[team] || {}).reduce(
-                (sum, player) => sum + (player.ERR || 0), 0
-              )
-            }
-
-            const R_away = sumInning(trimmedAway)
-            const R_home = sumInning(paddedHome)
-            const H_away = getHits(meta.away)
-            const H_home = getHits(meta.home)
-            const E_away = getErrors(meta.away)
-            const E_home = getErrors(meta.home)
+            // each team: [R, H, E, ...runs per inning], innings stop after its last time up
+            const [R_away = 0, H_away = 0, E_away = 0, ...away] = linescore[meta.away] || []
+            const [R_home = 0, H_home = 0, E_home = 0, ...home] = linescore[meta.home] || []
+            const innings = Array.from({ length: linescore.innings }, (_, i) => i)
+            const trimmedAway = innings.map(i => away[i] ?? "")
+            const paddedHome = innings.map(i =>
+              i < home.length ? (home[i] ?? "") : (i === innings.length - 1 ? "X" : "")
+            )
 
             return (
               <>
@@ -2,6 +2,7 @@
 import { useState } from 'react'
 import { getTeamToLeagueMap, getTeamGamesPlayedFromSchedule } from '../lib/teamUtils'
 import SortableTable from '../components/SortableTable'
+import { readSection } from '../lib/statFormat'
 import { getQualificationThresholds } from '../components/getQualificationThresholds'
 
 
@@ -9,12 +10,18 @@ export async function getStaticProps() {
   const fs = await import('fs')
   const path = await import('path')
 
-  const fieldingData = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'stats', 'fielding.json'), 'utf8'))
-  const schedule = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'stats', 'schedule.json'), 'utf8'))
+  // the typed file (numbers, null for undefined rates) formatted the way fielding.json is,
+  // or fielding.json itself before the typed file has been built
+  const statsDir = path.join(process.cwd(), 'data', 'stats')
+  const fieldingData = readSection(fs, path, statsDir, 'fielding')
+  const streaksPath = path.join(process.cwd(), 'data', 'stats', 'team_streaks.json')
   const teams = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'teams.json'), 'utf8'))
 
   const teamToLeague = getTeamToLeagueMap(teams)
-  const teamGames = getTeamGamesPlayedFromSchedule(schedule)
+  // team_streaks.json is written by scripts/build.py; fall back to counting the schedule until it exists
+  const teamGames = fs.existsSync(streaksPath)
+    ? Object.fromEntries(Object.entries(JSON.parse(fs.readFileSync(streaksPath, 'utf8'))).map(([team, s]) => [team, s.G]))
+    : getTeamGamesPlayedFromSchedule(JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'stats', 'schedule.json'), 'utf8')))
 
   return { props: { data: fieldingData, teamToLeague, teamGames } }
 }
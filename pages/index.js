@@ -6,6 +6,7 @@ import StandingsTable from '../components/StandingsTable'
 import { getQualificationThresholds } from '../components/getQualificationThresholds'
 import { getTeamToLeagueMap } from '../lib/teamUtils'
 import playerPhotos from '../data/player_photos.json'
+import { readBoxscore } from '../lib/boxscores'
 
 function safeLoad(filePath) {
   try {
@@ -18,23 +19,34 @@ function safeLoad(filePath) {
 
 export async function getStaticProps() {
   const dataDir = path.join(process.cwd(), 'data', 'stats')
-  const boxscoreDir = path.join(process.cwd(), 'data', 'boxscores')
   const standings = safeLoad(path.join(dataDir, 'standings.json'))
   const schedule = safeLoad(path.join(dataDir, 'schedule.json'))
-  const batting = safeLoad(path.join(dataDir, 'batting.json'))
-  const pitching = safeLoad(path.join(dataDir, 'pitching.json'))
   const teams = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'teams.json'), 'utf8'))
   const teamToLeague = getTeamToLeagueMap(teams)
+  const leaderData = fs.existsSync(path.join(dataDir, 'leaders.json'))
+    ? safeLoad(path.join(dataDir, 'leaders.json'))
+    : leadersFromSections({
+        batting: safeLoad(path.join(dataDir, 'batting.json')),
+        pitching: safeLoad(path.join(dataDir, 'pitching.json')),
+      }, teamToLeague)
+  // the last 7/15 days and each month, from the build's windows stage; none
+  // (and no window selector) until the build has written data/stats/windows
+  const windowsDir = path.join(dataDir, 'windows')
+  const windows = fs.existsSync(path.join(windowsDir, 'index.json'))
+    ? safeLoad(path.join(windowsDir, 'index.json')).filter(w => fs.existsSync(path.join(windowsDir, `${w.key}.json`)))
+    : []
+  const leaders = { season: pickLeaders(leaderData) }
+  for (const w of windows) {
+    leaders[w.key] = pickLeaders(safeLoad(path.join(windowsDir, `${w.key}.json`)).leaders)
+  }
   const teamMap = Object.fromEntries(teams.map(t => [t.id, t]))
   const completedGames = schedule
     .filter(g => g.completed && g['simDate'])
     .sort((a, b) => new Date(b['simDate']) - new Date(a['simDate']))
     .slice(0, 3)
   const recentGames = completedGames.map(game => {
-    const fileName = `${game.id}.json`
-    const filePath = path.join(boxscoreDir, fileName)
-    if (!fs.existsSync(filePath)) return null
-    const box = JSON.parse(fs.readFileSync(filePath, 'utf8')) 
+    const box = readBoxscore(game.id)
+    if (!box) return null
     const home_team = box.meta.home_team || box.meta.home
     const away_team = box.meta.away_team || box.meta.away
     const home_score = box.meta.home_score
@@ -89,8 +101,8 @@ export async function getStaticProps() {
     props: {
       standings,
       schedule,
-      batting,
-      pitching,
+      leaders,
+      leaderWindows: windows.map(w => ({ key: w.key, label: w.label })),
       teams,
       recentGames,
       upcomingGames,
@@ -100,10 +112,62 @@ export async function getStaticProps() {
   }
 }
 
-function getLeaders(data, key, top = 5) {
-  const filtered = data.filter(p => parseFloat(p[key]) > 0)
-  const sorted = filtered.sort((a, b) => parseFloat(b[key]) - parseFloat(a[key]))
-  return sorted.slice(0, top).map(p => ({ ...p, id: p["Player ID"] }))
+// [section, stat] in leaders.json (written by scripts/build.py) for each list on the page
+const LEADER_BOARDS = {
+  avg: ['batting', 'AVG'],
+  hr: ['batting', 'HR'],
+  rbi: ['batting', 'RBI'],
+  sb: ['batting', 'SB'],
+  ops: ['batting', 'OPS'],
+  wins: ['pitching', 'W'],
+  era: ['pitching', 'ERA'],
+  so: ['pitching', 'SO'],
+  sv: ['pitching', 'SV'],
+}
+
+// leaders.json's boards for LEADER_BOARDS from the formatted batting/pitching.json,
+// for a tree where scripts/build.py hasn't written leaders.json yet. Rates
+// only rank lines over the getQualificationThresholds minimums; ERA is
+// lowest first.
+const QUALIFYING = { AVG: 'PA', OPS: 'PA', ERA: 'IP' }
+const innings = ip => {
+  const [whole, thirds = 0] = String(ip || 0).split('.').map(Number)
+  return whole + thirds / 3
+}
+
+function leadersFromSections(sections, teamToLeague) {
+  const thresholds = getQualificationThresholds()
+  const leaderData = {}
+  for (const [section, stat] of Object.values(LEADER_BOARDS)) {
+    const minimum = QUALIFYING[stat]
+    const lines = sections[section]
+      .filter(p => minimum
+        ? (minimum === 'IP' ? innings(p.IP) : parseFloat(p.PA || 0)) >= (thresholds[p.team]?.[minimum] ?? Infinity)
+          && !isNaN(parseFloat(p[stat]))
+        : parseFloat(p[stat]) > 0)
+      .sort((a, b) => stat === 'ERA' ? parseFloat(a[stat]) - parseFloat(b[stat]) : parseFloat(b[stat]) - parseFloat(a[stat]))
+    for (const scope of ['MLB', 'AL', 'NL']) {
+      const board = lines
+        .filter(p => scope === 'MLB' || teamToLeague[p.team] === scope)
+        .map(p => ({ 'Player ID': p['Player ID'], Player: p.Player, team: p.team, value: p[stat] }))
+      leaderData[section] ??= {}
+      leaderData[section][scope] ??= {}
+      leaderData[section][scope][stat] = board
+    }
+  }
+  return leaderData
+}
+
+function pickLeaders(leaderData, top = 5) {
+  const picked = {}
+  for (const scope of ['MLB', 'AL', 'NL']) {
+    picked[scope] = {}
+    for (const [name, [section, stat]] of Object.entries(LEADER_BOARDS)) {
+      const board = leaderData?.[section]?.[scope]?.[stat] || []
+      picked[scope][name] = board.slice(0, top).map(p => ({ ...p, id: p['Player ID'], [stat]: p.value }))
+    }
+  }
+  return picked
 }
 
 function LeaderList({ title, players, statKey }) {
@@ -147,43 +211,10 @@ function parseDateAsLocal(dateString) {
   return new Date(year, month - 1, day)  // JS Date months are zero-based
 }
 
-export default function Home({ standings, batting, pitching, recentGames, latestDateFormatted, teamToLeague, upcomingGames }) {
-  const thresholds = getQualificationThresholds()
+export default function Home({ standings, leaders: leaderBoards, leaderWindows, recentGames, latestDateFormatted, teamToLeague, upcomingGames }) {
   const [leaderLeague, setLeaderLeague] = useState('MLB')
-  const isInLeague = (team) => {
-    if (leaderLeague === 'MLB') return true
-    return teamToLeague[team] === leaderLeague
-  }
-  const battingFiltered = batting.filter(p => isInLeague(p.team))
-  const pitchingFiltered = pitching.filter(p => isInLeague(p.team))
-    
-  const avgQualified = battingFiltered.filter(p => {
-    const pa = parseFloat(p.PA || 0)
-    const threshold = thresholds[p.team]?.PA || Infinity
-    return pa >= threshold
-  })
-
-  const eraQualified = pitchingFiltered.filter(p => {
-    const ip = parseFloat(p.IP || 0)
-    const threshold = thresholds[p.team]?.IP || Infinity
-    return ip >= threshold
-  })
-  
-  const leaders = {
-    avg: getLeaders(avgQualified, 'AVG'),
-    hr: getLeaders(battingFiltered, 'HR'),
-    rbi: getLeaders(battingFiltered, 'RBI'),
-    sb: getLeaders(battingFiltered, 'SB'),
-    ops: getLeaders(avgQualified, 'OPS'),
-    wins: getLeaders(pitchingFiltered, 'W'),
-    era: eraQualified
-      .filter(p => !isNaN(parseFloat(p.ERA)))
-      .sort((a, b) => parseFloat(a.ERA) - parseFloat(b.ERA))
-      .slice(0, 5)
-      .map(p => ({ ...p, id: p["Player ID"] })),
-    so: getLeaders(pitchingFiltered, 'SO'),
-    sv: getLeaders(pitchingFiltered, 'SV'),
-  }
+  const [leaderWindow, setLeaderWindow] = useState('season')
+  const leaders = leaderBoards[leaderWindow][leaderLeague]
 
   return (
     <div className="p-4 space-y-8">
@@ -243,6 +274,14 @@ export default function Home({ standings, batting, pitching, recentGames, latest
           <option value="AL">American League</option>
           <option value="NL">National League</option>
         </select>
+        {leaderWindows.length > 0 && (
+          <select value={leaderWindow} onChange={e => setLeaderWindow(e.target.value)} className="border border-gray-300 rounded px-2 py-1 ml-2">
+            <option value="season">Season</option>
+            {leaderWindows.map(w => (
+              <option key={w.key} value={w.key}>{w.label}</option>
+            ))}
+          </select>
+        )}
           <div className="flex flex-wrap md:flex-nowrap gap-4 mb-4">
             <LeaderList title="Batting Average" players={leaders.avg} statKey="AVG" />
             <LeaderList title="Home Runs" players={leaders.hr} statKey="HR" />
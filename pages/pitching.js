@@ -2,13 +2,17 @@
 import { useState } from 'react'
 import { getTeamToLeagueMap } from '../lib/teamUtils'
 import SortableTable from '../components/SortableTable'
+import { readSection } from '../lib/statFormat'
 import { getQualificationThresholds } from '../components/getQualificationThresholds'
 
 export async function getStaticProps() {
   const fs = await import('fs')
   const path = await import('path')
 
-  const data = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'stats', 'pitching.json'), 'utf8'))
+  // the typed file (numbers, null for undefined rates) formatted the way pitching.json is,
+  // or pitching.json itself before the typed file has been built
+  const statsDir = path.join(process.cwd(), 'data', 'stats')
+  const data = readSection(fs, path, statsDir, 'pitching')
   const teams = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'teams.json'), 'utf8'))
 
   const teamToLeague = getTeamToLeagueMap(teams)
@@ -35,15 +39,7 @@ export default function PitchingPage({ data, teamToLeague }) {
       league === 'All' ||
       (player.team in teamToLeague && teamToLeague[player.team] === league)
     return isQualified && isSplitOK && isLeagueMatch
-  }).map(row => ({
-    ...row,
-    ERA: parseFloat(row.ERA).toFixed(2),
-    H9: parseFloat(row.H9).toFixed(1),
-    HR9: parseFloat(row.HR9).toFixed(1),
-    BB9: parseFloat(row.BB9).toFixed(1),
-    SO9: parseFloat(row.SO9).toFixed(1),
-    "SO/BB": parseFloat(row["SO/BB"]).toFixed(1)
-  }))
+  })
 
 
   return (
@@ -1,11 +1,5 @@
-import { useRouter } from 'next/router'
-import batting from '../../data/stats/batting.json'
-import pitching from '../../data/stats/pitching.json'
-import fielding from '../../data/stats/fielding.json'
-import fieldingByPosition from '../../data/stats/fielding_by_position.json'
-import playerPhotos from '../../data/player_photos.json'
-import battingLog from '../../data/stats/batting_log.json'
-import fieldingLog from '../../data/stats/fielding_log.json'
+import fs from 'fs'
+import path from 'path'
 import Link from 'next/link'
 
 const positionMap = {
@@ -67,20 +61,51 @@ const renderTable = (title, stats, keys, format = {}) => (
   </div>
 )
 
-export default function PlayerPage() {
-  const router = useRouter()
-  const { id } = router.query
-  if (!id) return <div className="p-4 text-red-600">Invalid Player ID</div>
+// One page per entry in data/stats/players/index.json, each built from that
+// player's shard (players/<Player ID>.json) rather than the league-wide files.
+// Curated players (data/stats/players_index.json) get a page too, and until
+// scripts/build.py has written a player's shard the page falls back to their
+// entry in the committed players_combined.json.
+const statsDir = () => path.join(process.cwd(), 'data', 'stats')
+const playersDir = () => path.join(statsDir(), 'players')
 
-  const bat = batting.filter(p => p['Player ID'] === id)
-  const pit = pitching.filter(p => p['Player ID'] === id)
-  const fld = fielding.filter(p => p['Player ID'] === id)
-  const fldPos = fieldingByPosition.filter(p => p['Player ID'] === id)
+const readIfExists = (file, fallback) =>
+  fs.existsSync(file) ? JSON.parse(fs.readFileSync(file, 'utf8')) : fallback
 
-  const name = bat[0]?.Player || pit[0]?.Player || fld[0]?.Player || fldPos[0]?.Player
+export async function getStaticPaths() {
+  const built = readIfExists(path.join(playersDir(), 'index.json'), [])
+  const curated = readIfExists(path.join(statsDir(), 'players_index.json'), [])
+  const ids = new Set([...built, ...curated].map(p => p.id))
+  return {
+    paths: [...ids].map(id => ({ params: { id } })),
+    fallback: false
+  }
+}
+
+export async function getStaticProps({ params }) {
+  const curated = readIfExists(path.join(statsDir(), 'players_index.json'), []).find(p => p.id === params.id)
+  const shard = readIfExists(path.join(playersDir(), `${params.id}.json`), null)
+    || readIfExists(path.join(statsDir(), 'players_combined.json'), []).find(p => p.id === params.id)
+    || {}
+  const photos = JSON.parse(fs.readFileSync(path.join(process.cwd(), 'data', 'player_photos.json'), 'utf8'))
+  return {
+    props: {
+      id: params.id,
+      name: shard.name || curated?.name || null,
+      bat: shard.batting || [],
+      pit: shard.pitching || [],
+      fld: shard.fielding || [],
+      fldPos: shard.fielding_by_position || [],
+      battingLog: shard.batting_log || [],
+      fieldingLog: shard.fielding_log || [],
+      playerPhotoData: photos[params.id] || []
+    }
+  }
+}
+
+export default function PlayerPage({ id, name, bat, pit, fld, fldPos, battingLog, fieldingLog, playerPhotoData }) {
   if (!name) return <div className="p-4 text-red-600">Player not found.</div>
 
-  const playerPhotoData = playerPhotos[id] || []
   const lastTeam = bat.at(-1)?.team || pit.at(-1)?.team || fld.at(-1)?.team
   const photoUrl = playerPhotoData.find(p => p.team === lastTeam)?.url || null
   const otherPhotos = playerPhotoData
@@ -106,7 +131,6 @@ const allPositions = ['P','C','1B','2B','3B','SS','LF','CF','RF','DH','PH','PR']
 const gameTracker = {}
 
 battingLog
-  .filter(p => p['Player ID'] === id)
   .forEach(p => {
     const team = p.Team
     const gameKey = `${team}-${p['Game#']}`
@@ -130,7 +154,6 @@ battingLog
   })
 
 fieldingLog
-  .filter(p => p['Player ID'] === id)
   .forEach(p => {
     const team = p.Team
     const gameKey = `${team}-${p['Game#']}`
@@ -1,7 +1,7 @@
-
-import { useRouter } from 'next/router'
+import fs from 'fs'
+import path from 'path'
 import Link from 'next/link'
-import pitchingLog from '../../../data/stats/pitching_log.json'
+import { readLog, rowsWhere } from '../../../lib/columnarLog'
 import teams from '../../../data/teams.json'
 
 const teamMap = Object.fromEntries(teams.map(t => [t.id, t]))
@@ -14,12 +14,26 @@ const formatIP = num => {
   return `${whole}`
 }
 
-const PitchingGameLog = () => {
-  const router = useRouter()
-  const { id } = router.query
-  if (!id) return <div className="p-4">Loading...</div>
+// pitching_log.columnar.json (or pitching_log.json before it is built) is read once
+// per build worker; each page takes its player's rows out of it.
+let pitchingLog = null
+const loadLog = () => {
+  if (!pitchingLog) pitchingLog = readLog(fs, path, path.join(process.cwd(), 'data', 'stats'), 'pitching_log')
+  return pitchingLog
+}
+
+export async function getStaticPaths() {
+  return {
+    paths: (loadLog().dictionaries['Player ID'] || []).filter(Boolean).map(id => ({ params: { id } })),
+    fallback: false
+  }
+}
+
+export async function getStaticProps({ params }) {
+  return { props: { id: params.id, games: rowsWhere(loadLog(), 'Player ID', params.id) } }
+}
 
-  const games = pitchingLog.filter(row => row["Player ID"] === id)
+const PitchingGameLog = ({ id, games }) => {
   if (games.length === 0) return <div className="p-4 text-red-600">No game logs for this player.</div>
 
   const name = games[0].Player
@@ -2,6 +2,8 @@ import fs from 'fs'
 import path from 'path'
 import teams from '../data/teams.json'
 import { useEffect, useState } from 'react'
+import { boxscoreIds, readBoxscore } from '../lib/boxscores'
+import { expandRows, readLog } from '../lib/columnarLog'
 
 const useIsMobile = () => {
   const [isMobile, setIsMobile] = useState(false)
@@ -15,35 +17,13 @@ const useIsMobile = () => {
 
   return isMobile
 }
-const boxscoresDir = path.join(process.cwd(), 'data/boxscores');
 
 export async function getStaticProps() {
   const schedulePath = path.join(process.cwd(), 'data', 'stats', 'schedule.json')
   const raw = fs.readFileSync(schedulePath, 'utf8')
   const schedule = JSON.parse(raw)
-  const boxscoreFiles = fs.existsSync(boxscoresDir) ? fs.readdirSync(boxscoresDir) : []
-  const wlMap = {}
-  for (const file of boxscoreFiles) {
-    const gameId = file.replace('.json', '')
-    const boxscorePath = path.join(boxscoresDir, file)
-    const rawBox = fs.readFileSync(boxscorePath, 'utf8')
-    const box = JSON.parse(rawBox)
-    const allPitchers = [
-      ...Object.values(box.pitching?.[box.meta?.away] || {}),
-      ...Object.values(box.pitching?.[box.meta?.home] || {})
-    ]
-    const win = allPitchers.find(p => p.W > 0)
-    const loss = allPitchers.find(p => p.L > 0)
-    const save = allPitchers.find(p => p.SV > 0)
-    wlMap[gameId] = {
-      winner: win?.Player || "",
-      loser: loss?.Player || "",
-      save: save?.Player || "",
-    }
-      // Load pitching game log and build to-date W/L/S lookup
-  const pitchingLogPath = path.join(process.cwd(), 'data', 'stats', 'pitching_log.json')
-  const pitchingRaw = fs.readFileSync(pitchingLogPath, 'utf8')
-  const pitchingLog = JSON.parse(pitchingRaw)
+  // Load pitching game log and build to-date W/L/S lookup
+  const pitchingLog = expandRows(readLog(fs, path, path.join(process.cwd(), 'data', 'stats'), 'pitching_log'))
 
   // Build cumulative stats by player
   const pitcherStatsMap = {}
@@ -74,6 +54,23 @@ export async function getStaticProps() {
     }
   }
 
+  const wlMap = {}
+  for (const gameId of boxscoreIds()) {
+    const box = readBoxscore(gameId)
+    const allPitchers = [
+      ...Object.values(box.pitching?.[box.meta?.away] || {}),
+      ...Object.values(box.pitching?.[box.meta?.home] || {})
+    ]
+    const win = allPitchers.find(p => p.W > 0)
+    const loss = allPitchers.find(p => p.L > 0)
+    const save = allPitchers.find(p => p.SV > 0)
+    wlMap[gameId] = {
+      winner: win?.Player || "",
+      loser: loss?.Player || "",
+      save: save?.Player || "",
+    }
+  }
+
   // Merge W/L/S into schedule objects
   for (const g of schedule) {
     if (g.completed && g.id && wlMap[g.id]) {
@@ -92,8 +89,6 @@ export async function getStaticProps() {
       g.saveStats = save ? logLookup[`${g.id}_${save}`] : null
     }
   }
-}
-
 
   // Add W/L/S to each completed game
   for (const g of schedule) {
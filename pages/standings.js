@@ -1,28 +1,61 @@
 import fs from 'fs'
 import path from 'path'
+import { useState } from 'react'
 import StandingsTable from '../components/StandingsTable'
+import { standingsAsOf } from '../lib/standingsByDate'
 import teams from '../data/teams.json'
-import schedule from '../data/stats/schedule.json'
+
+// the parts of standings_by_date.json standingsAsOf reads
+const BY_DATE_FIELDS = ['dates', 'teams', 'W', 'L', 'GB', 'rank']
 
 export async function getStaticProps() {
   const dataPath = path.join(process.cwd(), 'data', 'stats', 'standings.json')
   const raw = fs.readFileSync(dataPath, 'utf8')
   const standings = JSON.parse(raw)
+  const streaksPath = path.join(process.cwd(), 'data', 'stats', 'team_streaks.json')
+  const streaks = fs.existsSync(streaksPath) ? JSON.parse(fs.readFileSync(streaksPath, 'utf8')) : {}
+  const byDatePath = path.join(process.cwd(), 'data', 'stats', 'standings_by_date.json')
+  const byDate = fs.existsSync(byDatePath)
+    ? Object.fromEntries(Object.entries(JSON.parse(fs.readFileSync(byDatePath, 'utf8'))).filter(([k]) => BY_DATE_FIELDS.includes(k)))
+    : null
 
   return {
     props: {
       standings,
       teams,
-      schedule
+      streaks,
+      byDate
     }
   }
 }
 
-export default function StandingsPage({ standings, teams, schedule }) {
+const formatDate = date =>
+  new Date(`${date}T00:00:00`).toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' })
+
+export default function StandingsPage({ standings, teams, streaks, byDate }) {
+  const dates = byDate ? byDate.dates.filter(Boolean) : []
+  const latest = dates.at(-1) || ''
+  const [date, setDate] = useState(latest)
+
+  // streaks are only known for the latest standings
+  const current = date === latest
+  const shown = current ? standings : standingsAsOf(byDate, teams, date)
+
   return (
     <div className="p-4">
       <h1 className="text-3xl font-bold mb-4">1999 Full Season Standings</h1>
 
+      {dates.length > 1 && (
+        <label className="mb-4 flex items-center">
+          <span className="mr-2 font-medium">Standings as of:</span>
+          <select value={date} onChange={e => setDate(e.target.value)} className="border border-gray-300 rounded px-2 py-1">
+            {dates.map(d => (
+              <option key={d} value={d}>{formatDate(d)}</option>
+            ))}
+          </select>
+        </label>
+      )}
+
       {['AL', 'NL'].map((league) => (
         <div key={league} className="mb-6">
           <h2 className="text-2xl font-semibold mb-2 flex items-center">
@@ -30,12 +63,12 @@ export default function StandingsPage({ standings, teams, schedule }) {
             {league === "AL" ? "American League" : "National League"}
           </h2>
           <div className="flex flex-wrap gap-6">
-            {Object.entries(standings[league]).map(([division, teamsData]) => (
+            {Object.entries(shown[league] || {}).map(([division, teamsData]) => (
               <div key={`${league}-${division}`} className="w-fit">
                 <StandingsTable
                   standings={{ [league]: { [division]: teamsData } }}
                   teams={teams}
-                  schedule={schedule}
+                  streaks={current ? streaks : {}}
                   useFullName={true}
                   hideLeagueHeaders={true}
                   enhanced={true}
@@ -2,8 +2,7 @@ import { useRouter } from 'next/router'
 import schedule from '../../../data/stats/schedule.json'
 import teams from '../../../data/teams.json'
 import Link from 'next/link'
-import fs from 'fs'
-import path from 'path'
+import { readBoxscore } from '../../../lib/boxscores'
 
 // Convert YYYY-MM-DD to "Monday, April 5th"
 function formatPrettyDate(dateStr) {
@@ -40,14 +39,12 @@ export async function getStaticProps({ params }) {
   const games = schedule.filter(g => g.home_team === abbr || g.away_team === abbr)
 
   // Load boxscores if available
-  const boxscoresDir = path.join(process.cwd(), 'data', 'boxscores')
   const boxscores = {}
 
   for (const game of games) {
     try {
-      const filePath = path.join(boxscoresDir, `${game.id}.json`)
-      const contents = fs.readFileSync(filePath, 'utf-8')
-      const data = JSON.parse(contents)
+      const data = readBoxscore(game.id)
+      if (!data) continue
 
       // Extract W/L/S pitcher from pitching data
       const pitching = data.pitching || {}
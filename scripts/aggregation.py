@@ -0,0 +1,323 @@
+import pandas as pd
+import numpy as np
+from stat_utils import innings_to_outs, exact_rate
+from stat_format import format_records
+
+# Season totals are built from one typed copy of the GameLog sheet: every
+# counting column is coerced to numbers once (innings to integer outs), then
+# each output is a single grouped reduction over (Player ID, Team[, POS])
+# instead of a Python loop over every row. The records built from the totals
+# are typed; stat_format.py turns them into display strings.
+
+BATTING_STATS = [
+    "AB", "H", "2B", "3B", "HR", "BB", "IBB", "SO", "R", "RBI", "HBP", "SH", "SF", "GDP", "SB", "CS"
+]
+
+# output name -> GameLog column
+PITCHING_STATS = {
+    "W": "W", "L": "L", "SV": "SV", "GS": "GS", "H": "H allowed",
+    "R": "R against", "ER": "ER", "HR": "HR allowed", "BB": "BB against", "IBB": "IBB against",
+    "SO": "SO against", "HBP": "HBP against", "BK": "BK", "WP": "WP"
+}
+
+FIELDING_STATS = {
+    "GS": "GS", "CG": "CG", "PO": "PO", "A": "A", "E": "ERR", "DP": "DP", "PB": "PB", "WP": "WP",
+    "SB": "SB against", "CS": "CS against", "PkO": "Pko"
+}
+
+COUNTING_COLUMNS = list(dict.fromkeys(
+    ["BOP"] + BATTING_STATS + list(PITCHING_STATS.values()) + list(FIELDING_STATS.values())
+))
+
+SECTIONS = ("batting", "pitching", "fielding", "fielding_by_position")
+
+PLAYER_TEAM = ["Player ID", "Team"]
+
+
+def _counting(rows, col):
+    # same result as safe_int() per cell: blanks and junk become 0, floats truncate
+    if col not in rows:
+        return pd.Series(0, index=rows.index, dtype=np.int64)
+    return np.trunc(pd.to_numeric(rows[col], errors="coerce").fillna(0)).astype(np.int64)
+
+def _outs(rows, col):
+    if col not in rows:
+        return pd.Series(0, index=rows.index)
+    return innings_to_outs(rows[col])
+
+def prepare_gamelog(gamelog_df):
+    pid = gamelog_df["Player ID"]
+    rows = gamelog_df[pid.notna() & (pid != "")]
+
+    frame = pd.DataFrame({
+        "Player ID": rows["Player ID"],
+        "Team": rows["Team"],
+        "Player": rows["Player Name"],
+        "Game#": rows["Game#"],
+        "POS": rows["POS"],
+        "pos": pd.to_numeric(rows["POS"], errors="coerce"),
+        "scoreless": pd.to_numeric(rows["R against"], errors="coerce").eq(0)
+        if "R against" in rows else False,
+    }, index=rows.index)
+
+    counting = pd.DataFrame({col: _counting(rows, col) for col in COUNTING_COLUMNS}, index=rows.index)
+    counting["IP outs"] = _outs(rows, "IP")
+    counting["INN outs"] = _outs(rows, "INN")
+    return pd.concat([frame, counting], axis=1)
+
+def _reduce(rows, keys, columns, base=None):
+    # base holds totals from an earlier build; its rows go first so the
+    # last-seen name carries on exactly as in a full pass
+    if base is not None:
+        rows = pd.concat([base.drop(columns="G"), rows], ignore_index=True)
+    grouped = rows.groupby(keys, sort=False, dropna=False)
+    totals = grouped[columns].sum()
+    totals["Player"] = grouped["Player"].last()
+    totals["G"] = grouped["Game#"].nunique()
+    if base is not None:
+        earlier = base.groupby(keys, sort=False, dropna=False)["G"].sum()
+        totals["G"] = totals["G"].add(earlier, fill_value=0).astype(int)
+    return totals.reset_index()
+
+def _games(totals):
+    if totals is None:
+        return None
+    return totals[PLAYER_TEAM + ["Player", "G"]]
+
+def _fielders(frame):
+    """Rows at positions 1-9, with 0/1 "complete" and "shutout" columns.
+
+    A player who is his team's only one at a position in a game played all
+    of it there: a complete game, and a shutout for a pitcher who allowed no
+    runs. The flags are summed like any other count, so CG and SHO come out
+    per (Player ID, Team) with everything else.
+    """
+    fielders = frame[frame["pos"].isin(range(1, 10))]
+    alone = fielders.groupby(["Game#", "Team", "pos"], sort=False)["Player ID"].transform("size").eq(1)
+    return fielders.assign(
+        complete=alone.astype(int),
+        shutout=(alone & fielders["scoreless"] & fielders["pos"].eq(1)).astype(int),
+    )
+
+def aggregate_gamelog(gamelog_df, sections=SECTIONS, base=None):
+    """Season totals per (Player ID, Team[, POS]) for the requested sections.
+
+    With ``base`` (the totals from an earlier run over other games) only
+    ``gamelog_df``'s rows are reduced and folded into those totals.
+    """
+    frame = prepare_gamelog(gamelog_df)
+    base = base or {}
+    totals = {}
+
+    if "batting" in sections:
+        batters = frame[frame["BOP"] > 0]
+        totals["batting"] = _reduce(batters, PLAYER_TEAM, BATTING_STATS, base=base.get("batting"))
+
+    fielders = _fielders(frame) if set(sections) - {"batting"} else None
+    if "pitching" in sections:
+        pitchers = fielders[fielders["pos"] == 1]
+        columns = list(PITCHING_STATS.values()) + ["IP outs", "complete", "shutout"]
+        totals["pitching"] = _reduce(pitchers, PLAYER_TEAM, columns, base=base.get("pitching"))
+
+    if "fielding" in sections or "fielding_by_position" in sections:
+        columns = list(FIELDING_STATS.values()) + ["INN outs", "complete"]
+        by_position = _reduce(fielders, PLAYER_TEAM + ["POS"], columns, base=base.get("fielding_by_position"))
+        # keep each player's positions together, players in order of first appearance
+        pair_order = by_position.groupby(PLAYER_TEAM, sort=False, dropna=False).ngroup()
+        by_position = by_position.iloc[np.argsort(pair_order.to_numpy(), kind="stable")].reset_index(drop=True)
+        totals["fielding_by_position"] = by_position
+
+        if "fielding" in sections:
+            # season lines are the per-position sums rolled up; games are
+            # counted again because one game can span several positions
+            rolled = by_position.groupby(PLAYER_TEAM, sort=False, dropna=False)[columns].sum()
+            per_player = _reduce(fielders, PLAYER_TEAM, [], base=_games(base.get("fielding")))
+            totals["fielding"] = rolled.join(per_player.set_index(PLAYER_TEAM)).reset_index()
+
+    return totals
+
+# Rates from summed counts. The season records use these, and so do the TOT
+# lines built from the team sheets (stat_json_generator.merge_totals), so a
+# rate means the same thing in every file.
+
+def batting_rates(ab, h, tb, bb, hbp, sf, sh):
+    pa = ab + bb + hbp + sf + sh
+    avg = exact_rate(h, ab, 3, 0)
+    obp = exact_rate(h + bb + hbp, pa, 3, 0)
+    slg = exact_rate(tb, ab, 3, 0)
+    return {"AVG": avg, "OBP": obp, "SLG": slg, "OPS": round(obp + slg, 3)}
+
+def pitching_rates(w, l, outs, er, h, hr, bb, so):
+    return {
+        "W-L%": exact_rate(w, w + l, 3, 0.0),
+        "ERA": exact_rate(er * 27, outs, 2),
+        "H9": exact_rate(h * 27, outs, 1, 0.0),
+        "HR9": exact_rate(hr * 27, outs, 1, 0.0),
+        "BB9": exact_rate(bb * 27, outs, 1, 0.0),
+        "SO9": exact_rate(so * 27, outs, 1, 0.0),
+        "SO/BB": exact_rate(so, bb, 1, 0.0),
+    }
+
+def whip(h, bb, outs):
+    return exact_rate((h + bb) * 3, outs, 2)
+
+def fielding_rates(po, a, e, sb, cs):
+    return {
+        "Fld%": exact_rate(po + a, po + a + e, 3),
+        "CS%": exact_rate(cs * 100, sb + cs, 0),
+    }
+
+def _fielding_line(stats):
+    po = stats["PO"]
+    a = stats["A"]
+    e = stats["ERR"]
+    sb = stats["SB against"]
+    cs = stats["CS against"]
+    rates = fielding_rates(po, a, e, sb, cs)
+    return {
+        "Inn": int(stats["INN outs"]),
+        "Ch": int(po + a + e),
+        "PO": int(po),
+        "A": int(a),
+        "E": int(e),
+        "DP": int(stats["DP"]),
+        "Fld%": rates["Fld%"],
+        "PB": int(stats["PB"]),
+        "WP": int(stats["WP"]),
+        "SB": int(sb),
+        "CS": int(cs),
+        "CS%": rates["CS%"],
+        "PkO": int(stats["Pko"]),
+    }
+
+def batting_records(totals):
+    result = []
+    for stats in totals["batting"].to_dict("records"):
+        ab = stats["AB"]
+        h = stats["H"]
+        bb = stats["BB"]
+        hbp = stats["HBP"]
+        sf = stats["SF"]
+        sh = stats["SH"]
+        tb = h + stats["2B"] + 2 * stats["3B"] + 3 * stats["HR"]
+        pa = ab + bb + hbp + sf + sh
+
+        result.append({
+            "Player": stats["Player"],
+            "team": stats["Team"],
+            "G": stats["G"],
+            "PA": pa,
+            "AB": ab,
+            "R": stats["R"],
+            "H": h,
+            "2B": stats["2B"],
+            "3B": stats["3B"],
+            "HR": stats["HR"],
+            "RBI": stats["RBI"],
+            "SB": stats["SB"],
+            "CS": stats["CS"],
+            "BB": bb,
+            "SO": stats["SO"],
+            **batting_rates(ab, h, tb, bb, hbp, sf, sh),
+            "TB": tb,
+            "GDP": stats["GDP"],
+            "HBP": hbp,
+            "SH": sh,
+            "SF": sf,
+            "IBB": stats["IBB"],
+            "Player ID": stats["Player ID"]
+        })
+    return result
+
+def pitching_records(totals):
+    result = []
+    for stats in totals["pitching"].to_dict("records"):
+        pid = stats["Player ID"]
+        outs = stats["IP outs"]
+        er = stats["ER"]
+        h = stats["H allowed"]
+        hr = stats["HR allowed"]
+        bb = stats["BB against"]
+        so = stats["SO against"]
+
+        w = stats["W"]
+        l = stats["L"]
+        rates = pitching_rates(w, l, outs, er, h, hr, bb, so)
+
+        result.append({
+            "Player": stats["Player"],
+            "team": stats["Team"],
+            "W": w,
+            "L": l,
+            "W-L%": rates["W-L%"],
+            "ERA": rates["ERA"],
+            "G": stats["G"],
+            "GS": stats["GS"],
+            "CG": int(stats["complete"]),
+            "SHO": int(stats["shutout"]),
+            "SV": stats["SV"],
+            "IP": int(outs),
+            "H": h,
+            "R": stats["R against"],
+            "ER": er,
+            "HR": hr,
+            "BB": bb,
+            "IBB": stats["IBB against"],
+            "SO": so,
+            "HBP": stats["HBP against"],
+            "BK": stats["BK"],
+            "WP": stats["WP"],
+            "H9": rates["H9"],
+            "HR9": rates["HR9"],
+            "BB9": rates["BB9"],
+            "SO9": rates["SO9"],
+            "SO/BB": rates["SO/BB"],
+            "Player ID": pid
+        })
+    return result
+
+def fielding_records(totals):
+    result = []
+    for stats in totals["fielding"].to_dict("records"):
+        pid = stats["Player ID"]
+        result.append({
+            "Player": stats["Player"],
+            "team": stats["Team"],
+            "G": stats["G"],
+            "GS": int(stats["GS"]),
+            "CG": int(stats["complete"]),
+            **_fielding_line(stats),
+            "Player ID": pid
+        })
+    return result
+
+def fielding_by_position_records(totals):
+    result = []
+    for stats in totals["fielding_by_position"].to_dict("records"):
+        result.append({
+            "Player": stats["Player"],
+            "team": stats["Team"],
+            "POS": str(stats["POS"]),
+            "G": stats["G"],
+            "GS": int(stats["GS"]),
+            "CG": int(stats["CG"]),
+            **_fielding_line(stats),
+            "Player ID": stats["Player ID"]
+        })
+    return result
+
+
+# display records, as the generators used to return them
+
+def group_stats(gamelog_df):
+    return format_records(batting_records(aggregate_gamelog(gamelog_df, ("batting",))), "batting")
+
+def group_pitching_stats(gamelog_df, schedule_df=None):
+    return format_records(pitching_records(aggregate_gamelog(gamelog_df, ("pitching",))), "pitching")
+
+def group_fielding_stats(gamelog_df):
+    return format_records(fielding_records(aggregate_gamelog(gamelog_df, ("fielding",))), "fielding")
+
+def compute_fielding_by_position(gamelog_df):
+    totals = aggregate_gamelog(gamelog_df, ("fielding_by_position",))
+    return format_records(fielding_by_position_records(totals), "fielding_by_position")
@@ -0,0 +1,97 @@
+"""Time the vectorized season aggregates against the old per-row loops.
+
+    python scripts/benchmarks/bench_aggregation.py --seasons 10
+
+Both implementations run over the same synthetic GameLog and their JSON
+output is compared byte for byte. Two differences are expected, and
+counted and reported separately:
+
+- rates over innings pitched: the old code summed float innings, the new
+  code exact outs, so a rate that lands on a rounding tie can differ in
+  its last digit;
+- CG/SHO: the old code counted them per player, shown on every team line
+  a traded player had, and also counted a lone PH/PR/DH as a fielding
+  complete game. They are now per (player, team), at positions 1-9 only.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import legacy
+from synthetic import synthetic_gamelog
+from stat_utils import clean_for_json
+from stat_format import format_records
+from aggregation import (
+    aggregate_gamelog, batting_records, pitching_records, fielding_records, fielding_by_position_records
+)
+
+# rates divided by innings pitched
+INNINGS_RATES = ["ERA", "H9", "HR9", "BB9", "SO9"]
+COMPLETE_GAMES = ["CG", "SHO"]
+
+
+def run_legacy(gamelog_df):
+    return {
+        "batting": legacy.group_stats(gamelog_df),
+        "pitching": legacy.group_pitching_stats(gamelog_df, None),
+        "fielding": legacy.group_fielding_stats(gamelog_df),
+        "fielding_by_position": legacy.compute_fielding_by_position(gamelog_df),
+    }
+
+def run_vectorized(gamelog_df):
+    totals = aggregate_gamelog(gamelog_df)
+    records = {
+        "batting": batting_records(totals),
+        "pitching": pitching_records(totals),
+        "fielding": fielding_records(totals),
+        "fielding_by_position": fielding_by_position_records(totals),
+    }
+    return {section: format_records(rows, section) for section, rows in records.items()}
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1999)
+    parser.add_argument("--skip-legacy", action="store_true", help="only time the vectorized path")
+    args = parser.parse_args()
+
+    gamelog_df, build_time = timed(synthetic_gamelog, args.seasons, args.seed)
+    print(f"synthetic GameLog: {args.seasons} season(s), {len(gamelog_df):,} rows ({build_time:.1f}s to build)")
+
+    new, new_time = timed(run_vectorized, gamelog_df)
+    print(f"vectorized: {new_time:8.2f}s")
+    if args.skip_legacy:
+        return
+
+    old, old_time = timed(run_legacy, gamelog_df)
+    print(f"iterrows:   {old_time:8.2f}s")
+    print(f"speedup:    {old_time / new_time:8.1f}x")
+
+    for name in old:
+        same = json.dumps(clean_for_json(old[name]), indent=2) == json.dumps(clean_for_json(new[name]), indent=2)
+        if same:
+            print(f"{name + '.json':28} identical")
+            continue
+        expected = INNINGS_RATES + (COMPLETE_GAMES if name != "fielding_by_position" else [])
+        strip = [{k: v for k, v in rec.items() if k not in expected} for rec in old[name]], \
+                [{k: v for k, v in rec.items() if k not in expected} for rec in new[name]]
+        if json.dumps(clean_for_json(strip[0])) != json.dumps(clean_for_json(strip[1])):
+            print(f"{name + '.json':28} DIFFERS")
+            sys.exit(1)
+        ties = sum(a[k] != b[k] for a, b in zip(old[name], new[name]) for k in INNINGS_RATES if k in a)
+        complete = sum(a[k] != b[k] for a, b in zip(old[name], new[name]) for k in expected
+                       if k in COMPLETE_GAMES and k in a)
+        print(f"{name + '.json':28} identical except {ties} innings rate(s) rounded from exact outs, "
+              f"{complete} CG/SHO value(s) now per team at positions 1-9")
+
+if __name__ == "__main__":
+    main()
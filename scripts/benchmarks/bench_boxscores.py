@@ -0,0 +1,91 @@
+"""Time the box-score stage at increasing worker counts, and the archive layout.
+
+    python scripts/benchmarks/bench_boxscores.py --seasons 1 --workers 1 2 4 8
+
+Every run writes to its own temporary directory; the files from each
+worker count are compared with the single-process output. The archive
+(boxscore_archive.py) is then written once and checked against those
+files, and reading --reads random games is timed from both layouts.
+"""
+import os
+import sys
+import json
+import time
+import random
+import filecmp
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import synthetic_schedule, synthetic_gamelog
+from schedule_index import build_schedule_index
+from generate_stats import write_boxscores
+from boxscore_archive import BoxscoreArchive, archive_paths, load_index, read_boxscore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1999)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--reads", type=int, default=500, help="random games read back from each layout")
+    args = parser.parse_args()
+
+    schedule_df = synthetic_schedule(args.seasons, args.seed)
+    gamelog_df = synthetic_gamelog(args.seasons, args.seed, schedule=schedule_df)
+    index = build_schedule_index(schedule_df)
+    print(f"{len(schedule_df):,} games, {len(gamelog_df):,} GameLog rows, {os.cpu_count()} CPU(s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = None
+        serial_time = None
+        for workers in sorted(set(args.workers)):
+            out = os.path.join(tmp, f"w{workers}")
+            start = time.perf_counter()
+            written = write_boxscores(gamelog_df, index, out, workers=workers)
+            elapsed = time.perf_counter() - start
+            serial_time = serial_time or elapsed
+            if baseline is None:
+                baseline = out
+                same = True
+            else:
+                names = os.listdir(baseline)
+                match, mismatch, errors = filecmp.cmpfiles(baseline, out, names, shallow=False)
+                same = not mismatch and not errors and len(os.listdir(out)) == len(names)
+            print(f"workers={workers:<3} {written:6,} files {elapsed:8.2f}s  "
+                  f"{serial_time / elapsed:5.2f}x  {'identical' if same else 'DIFFERS'}")
+
+        archive_dir = os.path.join(tmp, "archive")
+        start = time.perf_counter()
+        write_boxscores(gamelog_df, index, archive_dir, layout="archive")
+        elapsed = time.perf_counter() - start
+        archive_path, index_path = archive_paths(archive_dir)
+        names = sorted(os.listdir(baseline))
+        files_size = sum(os.path.getsize(os.path.join(baseline, name)) for name in names)
+        print(f"archive     {len(load_index(index_path)):6,} games {elapsed:8.2f}s  "
+              f"{os.path.getsize(archive_path) + os.path.getsize(index_path):,} bytes in 2 files "
+              f"(per-game files: {files_size:,} bytes in {len(names):,})")
+
+        def from_file(game_id):
+            with open(os.path.join(baseline, f"{game_id}.json")) as f:
+                return json.load(f)
+
+        game_ids = random.Random(args.seed).choices([name[:-len(".json")] for name in names], k=args.reads)
+        games = load_index(index_path)
+        with BoxscoreArchive(archive_dir) as archive:
+            readers = [("per-game files", from_file),
+                       ("archive, seek", lambda game_id: read_boxscore(archive_dir, game_id, games)),
+                       ("archive, mmap", archive.__getitem__)]
+            expected = [from_file(game_id) for game_id in game_ids]
+            for label, read in readers:
+                elapsed = None
+                for _ in range(3):  # best of three, so the first pass can warm the page cache
+                    start = time.perf_counter()
+                    boxes = [read(game_id) for game_id in game_ids]
+                    elapsed = min(elapsed or float("inf"), time.perf_counter() - start)
+                print(f"read {label:15} {elapsed / len(game_ids) * 1e6:7.1f}us/game  "
+                      f"{'identical' if boxes == expected else 'DIFFERS'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Peak memory of the box-score and game-log stages, old (everything in memory) vs streaming.
+
+    python scripts/benchmarks/bench_memory.py --seasons 1 2 4
+
+Each approach runs in a fresh process that loads the same pickled
+synthetic GameLog, resets the kernel's peak-RSS mark (VmHWM), and reports
+how far the peak rose above its RSS at that point, i.e. what the approach
+adds on top of its input. Every run writes into a temporary folder, and
+the streamed output is checked against the in-memory output. Linux only
+(/proc/self/status and clear_refs).
+
+  box scores
+    legacy      the original per-row generate_boxscores: every game's
+                nested defaultdicts, written once all games are built
+    in memory   generate_boxscores(): each game is built separately, but
+                all of them are held until they are written
+    streaming   write_boxscores(): one game at a time, in Game# order
+
+  game logs
+    in memory   the three logs expanded into lists of row dicts, then saved
+    streaming   the columnar logs, with rows made as they are written
+"""
+import os
+import gc
+import sys
+import json
+import time
+import pickle
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import legacy
+import columnar_log
+from synthetic import synthetic_schedule, synthetic_gamelog
+from schedule_index import build_schedule_index
+from stat_utils import save_json_rows, convert_sets_to_lists, write_json
+from generate_stats import generate_boxscores, write_boxscores, finish_boxscore, build_game_logs
+
+LOG_NAMES = ["batting_log", "pitching_log", "fielding_log"]
+
+
+def _status_bytes(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+
+def _reset_peak_rss():
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+
+def legacy_boxscores(gamelog_df, schedule_df, index, out):
+    os.makedirs(out)
+    for game_id, box in legacy.generate_boxscores(gamelog_df, schedule_df).items():
+        write_json(convert_sets_to_lists(box), os.path.join(out, f"{game_id}.json"))
+
+def held_boxscores(gamelog_df, schedule_df, index, out):
+    os.makedirs(out)
+    for game_id, box in generate_boxscores(gamelog_df, index).items():
+        write_json(finish_boxscore(box), os.path.join(out, f"{game_id}.json"))
+
+def streamed_boxscores(gamelog_df, schedule_df, index, out):
+    write_boxscores(gamelog_df, index, out)
+
+def held_logs(gamelog_df, schedule_df, index, out):
+    os.makedirs(out)
+    rows = {name: list(columnar_log.expand_rows(log))
+            for name, log in zip(LOG_NAMES, build_game_logs(gamelog_df, index))}
+    for name, log_rows in rows.items():
+        save_json_rows(log_rows, os.path.join(out, f"{name}.json"))
+
+def streamed_logs(gamelog_df, schedule_df, index, out):
+    os.makedirs(out)
+    for name, log in zip(LOG_NAMES, build_game_logs(gamelog_df, index)):
+        save_json_rows(columnar_log.expand_rows(log), os.path.join(out, f"{name}.json"))
+
+RUNS = {
+    "legacy": ("box scores", "legacy", legacy_boxscores),
+    "held": ("box scores", "in memory", held_boxscores),
+    "streamed": ("box scores", "streaming", streamed_boxscores),
+    "held_logs": ("game logs", "in memory", held_logs),
+    "streamed_logs": ("game logs", "streaming", streamed_logs),
+}
+
+def same_files(a, b):
+    names = sorted(os.listdir(a))
+    if names != sorted(os.listdir(b)):
+        return False
+    for name in names:
+        with open(os.path.join(a, name)) as fa, open(os.path.join(b, name)) as fb:
+            if json.load(fa) != json.load(fb):
+                return False
+    return True
+
+def run_child(name, data_path, out):
+    with open(data_path, "rb") as f:
+        schedule_df, gamelog_df = pickle.load(f)
+    index = build_schedule_index(schedule_df)
+    gc.collect()
+    _reset_peak_rss()
+    baseline = _status_bytes("VmRSS")
+    start = time.perf_counter()
+    RUNS[name][2](gamelog_df, schedule_df, index, out)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"added": _status_bytes("VmHWM") - baseline, "seconds": elapsed}))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seasons", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seed", type=int, default=1999)
+    parser.add_argument("--skip-legacy", action="store_true", help="leave out the (slow) original box-score code")
+    parser.add_argument("--child", nargs=3, metavar=("RUN", "DATA", "OUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return run_child(*args.child)
+
+    for seasons in args.seasons:
+        schedule_df = synthetic_schedule(seasons, args.seed)
+        gamelog_df = synthetic_gamelog(seasons, args.seed, schedule=schedule_df)
+        print(f"{seasons} season(s): {len(schedule_df):,} games, {len(gamelog_df):,} GameLog rows")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = os.path.join(tmp, "input.pickle")
+            with open(data_path, "wb") as f:
+                pickle.dump((schedule_df, gamelog_df), f)
+            for name, (stage, label, _) in RUNS.items():
+                if name == "legacy" and args.skip_legacy:
+                    continue
+                result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", name, data_path,
+                                         os.path.join(tmp, name)], check=True, capture_output=True, text=True)
+                measured = json.loads(result.stdout.splitlines()[-1])
+                print(f"  {stage:10} {label:9}  peak RSS +{measured['added'] / 2**20:7.1f} MiB  "
+                      f"{measured['seconds']:7.2f}s")
+
+            def same(a, b):
+                return "identical" if same_files(os.path.join(tmp, a), os.path.join(tmp, b)) else "DIFFER"
+            print(f"  streamed vs in memory: box scores {same('held', 'streamed')}, "
+                  f"game logs {same('held_logs', 'streamed_logs')}")
+
+if __name__ == "__main__":
+    main()
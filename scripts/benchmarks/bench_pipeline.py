@@ -0,0 +1,124 @@
+"""Time and measure the main generate_stats.py stages on synthetic seasons.
+
+    python scripts/benchmarks/bench_pipeline.py --seasons 1 10 50 --repeat 3
+
+Every (size, stage) pair runs in its own Python process, so the peak RSS
+reported for a stage is that stage's alone, and a stage that runs out of
+memory at one size is reported as failed instead of ending the suite. The
+synthetic workbook for each size is built once and pickled under
+data/.cache/synthetic/. --json writes all results for tracking over time.
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+from statistics import median
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from synthetic import synthetic_workbook
+from instrumentation import BuildTimer
+
+STAGES = [
+    "group_stats", "group_pitching_stats", "group_fielding_stats", "generate_boxscores", "game_logs", "linescores"
+]
+
+
+def stage_runner(name, gamelog_df, schedule_df, linescore_df):
+    import aggregation
+    import columnar_log
+    import generate_stats
+    from schedule_index import build_schedule_index
+
+    index = build_schedule_index(schedule_df)
+    runners = {
+        "group_stats": lambda: aggregation.group_stats(gamelog_df),
+        "group_pitching_stats": lambda: aggregation.group_pitching_stats(gamelog_df, schedule_df),
+        "group_fielding_stats": lambda: aggregation.group_fielding_stats(gamelog_df),
+        "generate_boxscores": lambda: generate_stats.generate_boxscores(gamelog_df, index),
+        "game_logs": lambda: [list(columnar_log.expand_rows(log))
+                              for log in generate_stats.build_game_logs(gamelog_df, index)],
+        "linescores": lambda: generate_stats.build_linescores(linescore_df, index, gamelog_df),
+    }
+    return runners[name]
+
+def run_stage(name, seasons, seed, repeat):
+    """Child process: load the workbook, run one stage ``repeat`` times, print one JSON line."""
+    timer = BuildTimer()
+    with timer.stage("load") as st:
+        frames = synthetic_workbook(seasons, seed)
+        st["rows"] = len(frames[0])
+    run = stage_runner(name, *frames)
+    for _ in range(repeat):
+        with timer.stage(name) as st:
+            result = run()
+            st["rows"] = len(result)
+        del result
+    print(json.dumps(timer.report(seasons=seasons, seed=seed)))
+
+def _child(seasons, seed, *extra):
+    cmd = [sys.executable, os.path.abspath(__file__), "--seasons", str(seasons), "--seed", str(seed), *extra]
+    return subprocess.run(cmd, capture_output=True, text=True)
+
+def measure(name, seasons, seed, repeat):
+    proc = _child(seasons, seed, "--run-stage", name, "--repeat", str(repeat))
+    if proc.returncode < 0:
+        return {"stage": name, "seasons": seasons, "error": f"killed by signal {-proc.returncode} (out of memory?)"}
+    if proc.returncode != 0:
+        reason = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit code {proc.returncode}"
+        return {"stage": name, "seasons": seasons, "error": reason}
+
+    report = json.loads(proc.stdout.strip().splitlines()[-1])
+    load, *runs = report["stages"]
+    return {
+        "stage": name,
+        "seasons": seasons,
+        "gamelog_rows": load["rows"],
+        "output_rows": runs[0]["rows"],
+        "seconds": [r["seconds"] for r in runs],
+        "min_seconds": min(r["seconds"] for r in runs),
+        "median_seconds": median(r["seconds"] for r in runs),
+        "input_rss_mb": load["peak_rss_mb"],
+        "peak_rss_mb": report["peak_rss_mb"],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seasons", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--seed", type=int, default=1999)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--json", help="write every result to this file")
+    parser.add_argument("--run-stage", choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument("--build-only", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.build_only:
+        synthetic_workbook(args.seasons[0], args.seed)
+        return
+    if args.run_stage:
+        run_stage(args.run_stage, args.seasons[0], args.seed, args.repeat)
+        return
+
+    results = []
+    print(f"{'seasons':>7} {'stage':22} {'rows':>10} {'min s':>9} {'median s':>9} {'input MB':>9} {'peak MB':>9}")
+    for seasons in args.seasons:
+        # build the cached workbook in a child too, so this process stays small
+        _child(seasons, args.seed, "--build-only").check_returncode()
+        for name in args.stages:
+            result = measure(name, seasons, args.seed, args.repeat)
+            results.append(result)
+            if "error" in result:
+                print(f"{seasons:>7} {name:22} failed: {result['error']}")
+                continue
+            print(f"{seasons:>7} {name:22} {result['gamelog_rows']:>10,} {result['min_seconds']:>9.3f} "
+                  f"{result['median_seconds']:>9.3f} {result['input_rss_mb']:>9} {result['peak_rss_mb']:>9}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"seed": args.seed, "repeat": args.repeat, "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Time game-log and box-score generation with the schedule index against the old per-row schedule scans.
+
+    python scripts/benchmarks/bench_schedule_index.py --seasons 1
+
+The default is one full 2,430-game season (162 games for each of the 30
+teams). Outputs of both paths are compared before timings are reported.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import legacy
+from synthetic import synthetic_schedule, synthetic_gamelog
+from stat_utils import clean_for_json, convert_sets_to_lists
+from schedule_index import build_schedule_index
+from generate_stats import generate_boxscores, build_game_logs
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def as_json(obj):
+    obj = convert_sets_to_lists(obj)
+    if isinstance(obj, dict):
+        # box-score positions were an unordered set before and an ordered list now
+        for box in obj.values():
+            for players in box["positions"].values():
+                for player in players:
+                    players[player] = sorted(players[player])
+    return json.dumps(clean_for_json(obj), indent=2, sort_keys=True, default=str)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1999)
+    args = parser.parse_args()
+
+    schedule_df = synthetic_schedule(args.seasons, args.seed)
+    gamelog_df = synthetic_gamelog(args.seasons, args.seed, schedule=schedule_df)
+    print(f"synthetic schedule: {len(schedule_df):,} games, GameLog: {len(gamelog_df):,} rows")
+
+    index, index_time = timed(build_schedule_index, schedule_df)
+    print(f"{'build_schedule_index':22} {index_time:8.3f}s")
+
+    stages = [
+        ("game logs", legacy.build_game_logs, build_game_logs),
+        ("box scores", legacy.generate_boxscores, generate_boxscores),
+    ]
+    for name, old_fn, new_fn in stages:
+        new, new_time = timed(new_fn, gamelog_df, index)
+        old, old_time = timed(old_fn, gamelog_df, schedule_df)
+        same = as_json(old) == as_json(new)
+        print(f"{name:22} scans {old_time:8.2f}s  index {new_time:8.2f}s  "
+              f"{old_time / new_time:6.1f}x  {'identical' if same else 'DIFFERS'}")
+        if not same:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
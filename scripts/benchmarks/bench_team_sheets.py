@@ -0,0 +1,50 @@
+"""Time parsing the per-team "<TEAM> B/P/F" sheets serially and across worker processes.
+
+    python scripts/benchmarks/bench_team_sheets.py --workbook "data/SOM 1999 Full Season Replay.xlsm" --workers 4
+
+Without --workbook a synthetic one (30 teams, built from the synthetic
+GameLog) is used. Sheets are parsed from the workbook itself, not the
+column cache, and both runs must produce the same team and player lines.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import synthetic_team_workbook
+from ingest import open_workbook
+from stat_json_generator import read_team_sheets
+from stat_utils import clean_for_json
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workbook", help="team workbook to read (default: a synthetic one)")
+    parser.add_argument("--seasons", type=int, default=1, help="size of the synthetic workbook")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    path = args.workbook or synthetic_team_workbook(args.seasons)
+    xls = open_workbook(path, use_cache=False)
+    print(f"{path}: {len(xls.sheet_names)} sheets, {os.cpu_count()} CPUs")
+
+    serial, serial_time = timed(read_team_sheets, xls)
+    print(f"1 process:    {serial_time:8.2f}s")
+    pooled, pooled_time = timed(read_team_sheets, xls, workers=args.workers)
+    print(f"{args.workers} processes: {pooled_time:8.2f}s  ({serial_time / pooled_time:.1f}x)")
+
+    same = json.dumps(clean_for_json(list(serial)), default=str) == json.dumps(clean_for_json(list(pooled)), default=str)
+    print("team and player lines", "identical" if same else "DIFFER")
+    if not same:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
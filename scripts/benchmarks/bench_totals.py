@@ -0,0 +1,98 @@
+"""Time the TOT merge for multi-team players against the old per-player loop.
+
+    python scripts/benchmarks/bench_totals.py --players 20000 --traded 0.3
+
+Team-sheet lines are generated directly: every player gets one line, and
+a ``--traded`` share of them two or three, on different teams. The old
+merge summed every column of the display rows, one player at a time; the
+new one sums the typed lines in one groupby and recomputes the rates. The
+counting columns of both TOT lines are compared. Rates and innings are
+not: the old code added up rate strings, and "10.2" + "5.1" innings as
+decimals.
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import legacy
+from stat_json_generator import merge_totals, format_rows, SHEET_FORMATS
+
+TEAMS = ["ARI", "ATL", "BAL", "BOS", "CHC", "CHW", "CIN", "CLE", "COL", "DET", "FLA", "HOU", "KC", "LA", "MIL",
+         "MIN", "MON", "NYM", "NYY", "OAK", "PHI", "PIT", "SD", "SEA", "SF", "STL", "TB", "TEX", "TOR", "ANA"]
+
+
+def _batting_line(rng, team, pid):
+    ab = int(rng.integers(0, 600))
+    h = int(rng.binomial(ab, 0.27))
+    bb, hbp, sf = int(rng.integers(0, 80)), int(rng.integers(0, 10)), int(rng.integers(0, 8))
+    doubles, hr = int(rng.binomial(h, 0.2)), int(rng.binomial(h, 0.1))
+    tb = h + doubles + 3 * hr
+    pa = ab + bb + hbp + sf
+    obp = round((h + bb + hbp) / pa, 3) if pa else 0
+    slg = round(tb / ab, 3) if ab else 0
+    return {"team": team, "Player": pid, "Player ID": pid, "G": int(rng.integers(1, 162)), "PA": pa, "AB": ab,
+            "H": h, "2B": doubles, "3B": 0, "HR": hr, "BB": bb, "HBP": hbp, "SF": sf, "TB": tb,
+            "AVG": round(h / ab, 3) if ab else 0, "OBP": obp, "SLG": slg, "OPS": round(obp + slg, 3)}
+
+def _pitching_line(rng, team, pid):
+    outs, w, l = int(rng.integers(0, 700)), int(rng.integers(0, 20)), int(rng.integers(0, 20))
+    h, er, bb, so = int(rng.integers(0, 250)), int(rng.integers(0, 120)), int(rng.integers(0, 90)), int(rng.integers(0, 250))
+    return {"team": team, "Player": pid, "Player ID": pid, "W": w, "L": l, "G": int(rng.integers(1, 70)),
+            "IP": outs, "H": h, "ER": er, "BB": bb, "SO": so,
+            "W-L%": round(w / (w + l), 3) if w + l else 0.0, "ERA": round(er * 27 / outs, 2) if outs else None,
+            "WHIP": round((h + bb) * 3 / outs, 2) if outs else None,
+            "SO/BB": round(so / bb, 1) if bb else 0.0}
+
+def synthetic_players(n_players, traded, seed):
+    rng = np.random.default_rng(seed)
+    players = {}
+    for i in range(n_players):
+        pid = f"player{i:06d}"
+        n_teams = int(rng.integers(2, 4)) if rng.random() < traded else 1
+        teams = rng.choice(TEAMS, n_teams, replace=False)
+        players[pid] = {
+            "batting": [_batting_line(rng, team, pid) for team in teams],
+            "pitching": [_pitching_line(rng, team, pid) for team in teams],
+        }
+    return players
+
+def run_legacy(display, section):
+    # display: {Player ID: formatted lines}, what the old code merged
+    totals = {}
+    for pid, lines in display.items():
+        if len(set(row["team"] for row in lines)) > 1:
+            totals[pid] = legacy.merge_totals(lines)[-1]
+    return totals
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=20000)
+    parser.add_argument("--traded", type=float, default=0.3, help="share of players with lines on several teams")
+    parser.add_argument("--seed", type=int, default=1999)
+    args = parser.parse_args()
+
+    players = synthetic_players(args.players, args.traded, args.seed)
+    for section in ["batting", "pitching"]:
+        new, new_time = timed(merge_totals, players, section)
+        display = {pid: format_rows(p[section], section) for pid, p in players.items()}
+        old, old_time = timed(run_legacy, display, section)
+        skip = {k for k in SHEET_FORMATS[section]} | {"team", "Player", "Player ID"}
+        same = old.keys() == new.keys() and all(
+            all(old[pid][k] == v for k, v in new[pid].items() if k not in skip) for pid in new
+        )
+        print(f"{section:9} {len(new):6,} TOT lines  per player: {old_time:6.2f}s  groupby: {new_time:6.2f}s  "
+              f"({old_time / new_time:.1f}x)  counts {'identical' if same else 'DIFFER'}")
+        if not same:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,580 @@
+import pandas as pd
+from collections import defaultdict
+from fractions import Fraction
+from stat_utils import safe_int
+
+# The original per-row (iterrows) implementations, kept verbatim as the
+# reference the optimized versions are timed and checked against.
+
+def safe_float(val):
+    try:
+        return float(val)
+    except:
+        return 0.0
+
+def parse_ip(ip_val):
+    if pd.isna(ip_val):
+        return 0.0
+    try:
+        if isinstance(ip_val, (int, float)):
+            return float(ip_val)
+        if isinstance(ip_val, str):
+            parts = ip_val.strip().split()
+            if len(parts) == 2:
+                # e.g. "1 2/3"
+                whole = int(parts[0])
+                frac = float(Fraction(parts[1]))
+                return whole + frac
+            elif '/' in ip_val:
+                # e.g. "2/3"
+                return float(Fraction(ip_val))
+            else:
+                return float(ip_val)
+        return float(ip_val)
+    except:
+        return 0.0
+
+def format_ip_for_display(ip):
+    if pd.isna(ip):
+        return "0.0"  # or return "" if you prefer blank
+    ip = round(ip, 2)
+    whole = int(ip)
+    remainder = round((ip - whole) * 100)
+    if remainder == 33:
+        return f"{whole}.1"
+    elif remainder == 67:
+        return f"{whole}.2"
+    return str(ip)
+
+def compute_fielding_cg(gamelog_df):
+    cg_by_player = defaultdict(int)
+    filtered = gamelog_df[gamelog_df["POS"].notna() & gamelog_df["Player ID"].notna()]
+
+    for (game, team, pos), group in filtered.groupby(["Game#", "Team", "POS"]):
+        if len(group) == 1:
+            pid = group.iloc[0]["Player ID"]
+            cg_by_player[pid] += 1
+
+    return cg_by_player
+
+
+def group_stats(gamelog_df):
+    batting = defaultdict(lambda: defaultdict(float))
+    games_played = defaultdict(set)
+
+    for _, row in gamelog_df.iterrows():
+        pid = row.get("Player ID")
+        if pd.isna(pid) or pid == "":
+            continue
+
+        team = row["Team"]
+        player = row["Player Name"]
+        game_num = row["Game#"]
+        key = (pid, team)
+        bop = safe_int(row.get("BOP"))
+        
+        if bop > 0:
+            games_played[key].add(game_num)
+            batting[key]["Player"] = player
+            batting[key]["AB"] += safe_int(row.get("AB"))
+            batting[key]["H"] += safe_int(row.get("H"))
+            batting[key]["2B"] += safe_int(row.get("2B"))
+            batting[key]["3B"] += safe_int(row.get("3B"))
+            batting[key]["HR"] += safe_int(row.get("HR"))
+            batting[key]["BB"] += safe_int(row.get("BB"))
+            batting[key]["IBB"] += safe_int(row.get("IBB"))
+            batting[key]["SO"] += safe_int(row.get("SO"))
+            batting[key]["R"] += safe_int(row.get("R"))
+            batting[key]["RBI"] += safe_int(row.get("RBI"))
+            batting[key]["HBP"] += safe_int(row.get("HBP"))
+            batting[key]["SH"] += safe_int(row.get("SH"))
+            batting[key]["SF"] += safe_int(row.get("SF"))
+            batting[key]["GDP"] += safe_int(row.get("GDP"))
+            batting[key]["SB"] += safe_int(row.get("SB"))
+            batting[key]["CS"] += safe_int(row.get("CS"))
+
+    result = []
+    for (pid, team), stats in batting.items():
+        ab = stats.get("AB", 0)
+        h = stats.get("H", 0)
+        bb = stats.get("BB", 0)
+        hbp = stats.get("HBP", 0)
+        sf = stats.get("SF", 0)
+        sh = stats.get("SH", 0)
+        tb = h + stats.get("2B", 0) + 2 * stats.get("3B", 0) + 3 * stats.get("HR", 0)
+        pa = ab + bb + hbp + sf + sh
+
+        avg = round(h / ab, 3) if ab else 0
+        obp = round((h + bb + hbp) / pa, 3) if pa else 0
+        slg = round(tb / ab, 3) if ab else 0
+        ops = round(obp + slg, 3)
+
+        entry = {
+            "Player": stats["Player"],
+            "team": team,
+            "G": len(games_played[(pid, team)]),
+            "PA": pa,
+            "AB": ab,
+            "R": stats.get("R", 0),
+            "H": h,
+            "2B": stats.get("2B", 0),
+            "3B": stats.get("3B", 0),
+            "HR": stats.get("HR", 0),
+            "RBI": stats.get("RBI", 0),
+            "SB": stats.get("SB", 0),
+            "CS": stats.get("CS", 0),
+            "BB": bb,
+            "SO": stats.get("SO", 0),
+            "AVG": "1.000" if avg == 1 else f"{avg:.3f}".lstrip("0"),
+            "OBP": "1.000" if obp == 1 else f"{obp:.3f}".lstrip("0"),
+            "SLG": f"{slg:.3f}" if slg >= 1 else f"{slg:.3f}".lstrip("0"),
+            "OPS": f"{ops:.3f}" if ops >= 1 else f"{ops:.3f}".lstrip("0"),
+            "TB": tb,
+            "GDP": stats.get("GDP", 0),
+            "HBP": hbp,
+            "SH": sh,
+            "SF": sf,
+            "IBB": stats.get("IBB", 0),
+            "Player ID": pid
+        }
+
+        result.append(entry)
+
+    return result
+
+def group_pitching_stats(gamelog_df, schedule_df):
+    cg_sho_counts = defaultdict(lambda: {"CG": 0, "SHO": 0})
+    for (game, team), group in gamelog_df[gamelog_df["Player ID"].notna()].groupby(["Game#", "Team"]):
+        team_pitchers = group[group["POS"] == 1]
+        if len(team_pitchers) == 1:
+            row = team_pitchers.iloc[0]
+            pid = row["Player ID"]
+            cg_sho_counts[pid]["CG"] += 1
+            if row.get("R against", 1) == 0:
+                cg_sho_counts[pid]["SHO"] += 1
+                
+    pitching = defaultdict(lambda: defaultdict(float))
+    games = defaultdict(set)
+
+    for _, row in gamelog_df.iterrows():
+        pid = row.get("Player ID")
+        if pd.isna(pid) or pid == "":
+            continue
+
+        team = row["Team"]
+        player = row["Player Name"]
+        game_id = row["Game#"]
+        key = (pid, team)
+
+        if row.get("POS") != 1:
+            continue  # Skip players who were not pitchers
+        
+        ip = parse_ip(row.get("IP"))
+        pitching[key]["Player"] = player
+        pitching[key]["IP"] += ip
+        pitching[key]["W"] += safe_int(row.get("W"))
+        pitching[key]["L"] += safe_int(row.get("L"))
+        pitching[key]["SV"] += safe_int(row.get("SV"))
+        pitching[key]["GS"] += safe_int(row.get("GS"))
+        pitching[key]["CG"] += safe_int(row.get("CG"))
+        pitching[key]["SHO"] += safe_int(row.get("SHO"))
+        pitching[key]["H"] += safe_int(row.get("H allowed"))
+        pitching[key]["R"] += safe_int(row.get("R against"))
+        pitching[key]["ER"] += safe_int(row.get("ER"))
+        pitching[key]["HR"] += safe_int(row.get("HR allowed"))
+        pitching[key]["BB"] += safe_int(row.get("BB against"))
+        pitching[key]["IBB"] += safe_int(row.get("IBB against"))
+        pitching[key]["SO"] += safe_int(row.get("SO against"))
+        pitching[key]["HBP"] += safe_int(row.get("HBP against"))
+        pitching[key]["BK"] += safe_int(row.get("BK"))
+        pitching[key]["WP"] += safe_int(row.get("WP"))
+        games[key].add(game_id)
+
+    result = []
+    for (pid, team), stats in pitching.items():
+        ip = stats.get("IP", 0)
+        er = stats.get("ER", 0)
+        h = stats.get("H", 0)
+        hr = stats.get("HR", 0)
+        bb = stats.get("BB", 0)
+        so = stats.get("SO", 0)
+
+        if ip == 0:
+            era_str = "---"
+        else:
+            era_str = f"{(er * 9 / ip):.2f}"
+        h9 = round(h * 9 / ip, 1) if ip else 0.0
+        hr9 = round(hr * 9 / ip, 1) if ip else 0.0
+        bb9 = round(bb * 9 / ip, 1) if ip else 0.0
+        so9 = round(so * 9 / ip, 1) if ip else 0.0
+        so_bb = round(so / bb, 1) if bb else 0.0
+
+        w = stats.get("W", 0)
+        l = stats.get("L", 0)
+        wl_pct = round(w / (w + l), 3) if (w + l) else 0.000
+
+        entry = {
+            "Player": stats["Player"],
+            "team": team,
+            "W": w,
+            "L": l,
+            "W-L%": "1.000" if wl_pct == 1 else f"{wl_pct:.3f}".lstrip("0"),
+            "ERA": era_str,
+            "G": len(games[(pid, team)]),
+            "GS": stats.get("GS", 0),
+            "CG": cg_sho_counts[pid]["CG"],
+            "SHO": cg_sho_counts[pid]["SHO"],
+            "SV": stats.get("SV", 0),
+            "IP": format_ip_for_display(ip),
+            "H": h,
+            "R": stats.get("R", 0),
+            "ER": er,
+            "HR": hr,
+            "BB": bb,
+            "IBB": stats.get("IBB", 0),
+            "SO": so,
+            "HBP": stats.get("HBP", 0),
+            "BK": stats.get("BK", 0),
+            "WP": stats.get("WP", 0),
+            "H9": f"{h9:.1f}",
+            "HR9": f"{hr9:.1f}",
+            "BB9": f"{bb9:.1f}",
+            "SO9": f"{so9:.1f}",
+            "SO/BB": f"{so_bb:.1f}",
+            "Player ID": pid
+        }
+
+        result.append(entry)
+
+    return result
+
+def group_fielding_stats(gamelog_df):
+    cg_by_player = compute_fielding_cg(gamelog_df)
+    from collections import defaultdict
+
+    def format_ip_for_display(ip):
+        if pd.isna(ip):
+            return "0.0"
+        ip = round(ip, 2)
+        whole = int(ip)
+        remainder = round((ip - whole) * 100)
+        if remainder == 33:
+            return f"{whole}.1"
+        elif remainder == 67:
+            return f"{whole}.2"
+        return str(ip)
+
+    fielding = defaultdict(lambda: defaultdict(float))
+    games = defaultdict(set)
+
+    for _, row in gamelog_df.iterrows():
+        pid = row.get("Player ID")
+        if pd.isna(pid) or pid == "":
+            continue
+
+        pos = row.get("POS", "")
+        if pos not in range(1, 10):  # skip DH, PH, PR, etc.
+            continue
+
+        team = row["Team"]
+        player = row["Player Name"]
+        game_id = row["Game#"]
+        key = (pid, team)
+
+        games[key].add(game_id)
+        fielding[key]["Player"] = player
+        fielding[key]["GS"] += safe_int(row.get("GS"))
+        fielding[key]["CG"] += safe_int(row.get("CG"))
+        fielding[key]["INN"] += safe_float(row.get("INN"))
+        fielding[key]["PO"] += safe_int(row.get("PO"))
+        fielding[key]["A"] += safe_int(row.get("A"))
+        fielding[key]["E"] += safe_int(row.get("ERR"))
+        fielding[key]["DP"] += safe_int(row.get("DP"))
+        fielding[key]["PB"] += safe_int(row.get("PB"))
+        fielding[key]["WP"] += safe_int(row.get("WP"))
+        fielding[key]["SB"] += safe_int(row.get("SB against"))
+        fielding[key]["CS"] += safe_int(row.get("CS against"))
+        fielding[key]["PkO"] += safe_int(row.get("Pko"))
+
+    result = []
+    for (pid, team), stats in fielding.items():
+        po = stats["PO"]
+        a = stats["A"]
+        e = stats["E"]
+        ch = po + a + e
+        fld_pct = (po + a) / ch if ch else None
+        sb = stats["SB"]
+        cs = stats["CS"]
+        cs_pct = (cs / (sb + cs)) if (sb + cs) else None
+
+        entry = {
+            "Player": stats["Player"],
+            "team": team,
+            "G": len(games[(pid, team)]),
+            "GS": int(stats["GS"]),
+            "CG": cg_by_player.get(pid, 0),
+            "Inn": format_ip_for_display(stats["INN"]),
+            "Ch": int(ch),
+            "PO": int(po),
+            "A": int(a),
+            "E": int(e),
+            "DP": int(stats["DP"]),
+            "Fld%": "1.000" if fld_pct == 1 else f"{fld_pct:.3f}".lstrip("0") if fld_pct is not None else "",
+            "PB": int(stats["PB"]) if stats["PB"] else "",
+            "WP": int(stats["WP"]) if stats["WP"] else "",
+            "SB": int(sb) if sb else "",
+            "CS": int(cs) if cs else "",
+            "CS%": f"{round(cs_pct * 100)}%" if cs_pct is not None else "",
+            "PkO": int(stats["PkO"]) if stats["PkO"] else "",
+            "Player ID": pid
+        }
+
+        result.append(entry)
+
+    return result
+
+def compute_fielding_by_position(gamelog_df):
+    fielding = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
+    games = defaultdict(lambda: defaultdict(set))
+
+    for _, row in gamelog_df.iterrows():
+        pid = row.get("Player ID")
+        if pd.isna(pid) or pid == "":
+            continue
+
+        pos = row.get("POS", "")
+        if pos not in range(1, 10):
+            continue
+
+        team = row["Team"]
+        player = row["Player Name"]
+        game_id = row["Game#"]
+        key = (pid, team, pos)
+
+        games[(pid, team)][pos].add(game_id)
+        f = fielding[(pid, team)][pos]
+
+        f["Player"] = player
+        f["GS"] += safe_int(row.get("GS"))
+        f["CG"] += safe_int(row.get("CG"))
+        f["INN"] += safe_float(row.get("INN"))
+        f["PO"] += safe_int(row.get("PO"))
+        f["A"] += safe_int(row.get("A"))
+        f["E"] += safe_int(row.get("ERR"))
+        f["DP"] += safe_int(row.get("DP"))
+        f["PB"] += safe_int(row.get("PB"))
+        f["WP"] += safe_int(row.get("WP"))
+        f["SB"] += safe_int(row.get("SB against"))
+        f["CS"] += safe_int(row.get("CS against"))
+        f["PkO"] += safe_int(row.get("Pko"))
+
+    results = []
+    for (pid, team), pos_dict in fielding.items():
+        for pos, stats in pos_dict.items():
+            po = stats["PO"]
+            a = stats["A"]
+            e = stats["E"]
+            ch = po + a + e
+            fld_pct = (po + a) / ch if ch else None
+            sb = stats["SB"]
+            cs = stats["CS"]
+            cs_pct = (cs / (sb + cs)) if (sb + cs) else None
+            entry = {
+                "Player": stats["Player"],
+                "team": team,
+                "POS": str(pos),
+                "G": len(games[(pid, team)][pos]),
+                "GS": int(stats["GS"]),
+                "CG": int(stats["CG"]),
+                "Inn": format_ip_for_display(stats["INN"]),
+                "Ch": int(ch),
+                "PO": int(po),
+                "A": int(a),
+                "E": int(e),
+                "DP": int(stats["DP"]),
+                "Fld%": "1.000" if fld_pct == 1 else f"{fld_pct:.3f}".lstrip("0") if fld_pct is not None else "",
+                "PB": int(stats["PB"]) if stats["PB"] else "",
+                "WP": int(stats["WP"]) if stats["WP"] else "",
+                "SB": int(sb) if sb else "",
+                "CS": int(cs) if cs else "",
+                "CS%": f"{round(cs_pct * 100)}%" if cs_pct is not None else "",
+                "PkO": int(stats["PkO"]) if stats["PkO"] else "",
+                "Player ID": pid
+            }
+            results.append(entry)
+    return results
+
+def generate_boxscores(gamelog_df, schedule_df):
+    def safe_str(val):
+        return str(val) if not pd.isna(val) else ""
+
+    stat_list = [
+        "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "IBB", "SO", "SB", "CS", "GDP", "HBP", "SH", "SF",
+        "W", "L", "SV", "IP", "H allowed", "R against", "ER", "HR allowed", "BB against", "IBB against",
+        "SO against", "HBP against", "BK", "WP", "PO", "A", "ERR", "DP", "TP", "PB", "SB against",
+        "CS against", "Pko"
+    ]
+        
+    game_lookup = {}
+    for _, row in schedule_df.iterrows():
+        game_num = row["Game#"]
+        game_id = row["Game ID"]
+        if not pd.isna(game_num) and not pd.isna(game_id):
+            game_lookup[int(game_num)] = str(game_id)
+
+    boxscores = defaultdict(lambda: {
+        "meta": {},
+        "batting": defaultdict(lambda: defaultdict(dict)),
+        "pitching": defaultdict(lambda: defaultdict(dict)),
+        "batting_order": defaultdict(list),
+        "positions": defaultdict(lambda: defaultdict(set)),
+        "games_started": defaultdict(lambda: defaultdict(int))
+    })
+
+    for _, row in gamelog_df.iterrows():
+        game_num = row["Game#"]
+        if pd.isna(game_num):
+            continue
+        game_id = game_lookup.get(int(game_num))
+        if not game_id:
+            continue  # skip unknown games
+
+        # Set meta data from schedule_df instead of gamelog row
+        if game_id and "meta" in boxscores[game_id] and not boxscores[game_id]["meta"]:
+            sched_row = schedule_df[schedule_df["Game ID"] == game_id].iloc[0]
+            boxscores[game_id]["meta"] = {
+                "date": safe_str(sched_row.get("Date")),
+                "home": safe_str(sched_row.get("Home")),
+                "away": safe_str(sched_row.get("Away")),
+                "home_score": safe_str(sched_row.get("Home Score")),
+                "away_score": safe_str(sched_row.get("Away Score"))
+    }
+
+
+        team = row["Team"]
+        player = row["Player Name"]
+        pid = row["Player ID"]
+        bop = safe_int(row.get("BOP"))
+        gs = safe_int(row.get("GS"))
+        pos = str(row.get("POS")) if not pd.isna(row.get("POS")) else ""
+
+        if pos:
+            boxscores[game_id]["positions"][team][player].add(pos)
+
+        if bop > 0:
+            boxscores[game_id]["batting_order"][team].append((bop, player))
+        if gs:
+            boxscores[game_id]["games_started"][team][player] += gs
+
+        if bop > 0 and "Player" not in boxscores[game_id]["batting"][team][player]:
+            boxscores[game_id]["batting"][team][player]["Player"] = player
+            boxscores[game_id]["batting"][team][player]["Player ID"] = pid
+        if pos == '1' and "Player" not in boxscores[game_id]["pitching"][team][player]:
+            boxscores[game_id]["pitching"][team][player]["Player"] = player
+            boxscores[game_id]["pitching"][team][player]["Player ID"] = pid
+        for stat in stat_list:
+            val = row.get(stat, 0)
+            if pd.notna(val):
+                # Batting section (if BOP > 0)
+                if bop > 0:
+                    if "Player" not in boxscores[game_id]["batting"][team][player]:
+                        boxscores[game_id]["batting"][team][player]["Player"] = player
+                        boxscores[game_id]["batting"][team][player]["Player ID"] = pid
+                    if stat not in boxscores[game_id]["batting"][team][player]:
+                        boxscores[game_id]["batting"][team][player][stat] = 0
+                    if stat == "IP":
+                        boxscores[game_id]["batting"][team][player][stat] = format_ip_for_display(val)
+                    else:
+                        boxscores[game_id]["batting"][team][player][stat] += safe_int(val)
+
+                # Pitching section (if POS == '1')
+                if pos == '1':
+                    if "Player" not in boxscores[game_id]["pitching"][team][player]:
+                        boxscores[game_id]["pitching"][team][player]["Player"] = player
+                        boxscores[game_id]["pitching"][team][player]["Player ID"] = pid
+                    pit_num = row.get("Pit #")
+                    if pd.notna(pit_num):
+                        boxscores[game_id]["pitching"][team][player]["Pit #"] = int(pit_num)
+                    if stat not in boxscores[game_id]["pitching"][team][player]:
+                        boxscores[game_id]["pitching"][team][player][stat] = 0
+                    if stat == "IP":
+                        boxscores[game_id]["pitching"][team][player][stat] = format_ip_for_display(val)
+                    else:
+                        boxscores[game_id]["pitching"][team][player][stat] += safe_int(val)
+
+
+    return boxscores
+
+def build_game_logs(gamelog_df, schedule_df):
+    batting_log = []
+    pitching_log = []
+    fielding_log = []
+
+    for _, row in gamelog_df.iterrows():
+        pid = row.get("Player ID")
+        name = row.get("Player Name")
+        team = row.get("Team")
+        raw_game_num = row.get("Game#")
+        if pd.isna(raw_game_num):
+            continue  # skip this row
+        game_num = int(raw_game_num)
+        bop = row.get("BOP")
+        pos = str(row.get("POS")) if not pd.isna(row.get("POS")) else ""
+        game_id = schedule_df[schedule_df["Game#"] == game_num]["Game ID"].values[0] if game_num in schedule_df["Game#"].values else f"G{game_num}"
+
+        meta = {
+            "Player": name,
+            "Player ID": pid,
+            "Team": team,
+            "Game#": game_num,
+            "Game ID": game_id
+        }
+
+        # Batting log
+        if not pd.isna(bop) and bop > 0:
+            entry = meta.copy()
+            entry["POS"] = row.get("POS") 
+            for stat in [
+                "GS", "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "IBB", "SO", "SB", "CS", "GDP",
+                "HBP", "SH", "SF"
+            ]:
+                val = row.get(stat)
+                if not pd.isna(val):
+                    entry[stat] = int(val)
+            batting_log.append(entry)
+
+        # Pitching log
+        if pos == "1":
+            entry = meta.copy()
+            entry["IP"] = row.get("IP")
+            for stat in [
+                "GS", "W", "L", "SV", "H allowed", "R against", "ER", "HR allowed",
+                "BB against", "IBB against", "SO against", "HBP against", "BK", "WP"
+            ]:
+                if not pd.isna(row.get(stat)):
+                    entry[stat] = int(row.get(stat))
+            pitching_log.append(entry)
+
+        # Fielding log
+        if pos.isdigit() and int(pos) in range(1, 10):
+            entry = meta.copy()
+            entry["POS"] = pos
+            for stat in ["GS", "INN", "PO", "A", "ERR", "DP", "PB", "SB against", "CS against", "Pko"]:
+                if not pd.isna(row.get(stat)):
+                    entry[stat] = row.get(stat) if "INN" in stat else int(row.get(stat))
+            fielding_log.append(entry)
+
+    return batting_log, pitching_log, fielding_log
+
+def merge_totals(records):
+    if not records:
+        return []
+    keys = set().union(*(r.keys() for r in records))
+    total = {"team": "TOT"}
+    for k in keys:
+        if k in {"team", "POS"}:
+            continue
+        vals = [float(r[k]) for r in records if k in r and isinstance(r[k], (int, float, str)) and str(r[k]).replace('.', '', 1).isdigit()]
+        if vals:
+            total[k] = round(sum(vals), 3)
+    return records + [total]
@@ -0,0 +1,263 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# Synthetic Schedule, GameLog and Linescores sheets in the same column layout
+# as "data/1999 Replay.xlsx", sized in whole replay seasons so the pipeline
+# can be timed well past the ~100 games the real workbook holds today.
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(REPO_ROOT, "data", ".cache", "synthetic")
+
+GAMES_PER_SEASON = 2430
+
+GAMELOG_COLUMNS = [
+    "Game#", "Team", "Player ID", "Player Name", "BOP", "POS", "GS", "Pit #", "AB", "R", "H", "2B",
+    "3B", "HR", "RBI", "BB", "IBB", "SO", "SB", "CS", "GDP", "HBP", "SH", "SF", "W", "L", "SV", "IP",
+    "H allowed", "R against", "ER", "HR allowed", "BB against", "IBB against", "SO against",
+    "HBP against", "BK", "WP", "INN", "PO", "A", "ERR", "DP", "TP", "PB", "SB against", "CS against",
+    "Pko"
+]
+
+MAX_INNINGS = 20
+
+# primary position of the 13 hitters on every synthetic roster
+HITTER_POSITIONS = [2, 3, 4, 5, 6, 7, 8, 9, 2, 4, 6, 8, 3]
+PITCHERS_PER_ROSTER = 12
+
+
+def load_teams():
+    with open(os.path.join(REPO_ROOT, "data", "teams.json")) as f:
+        return [(t["id"], t["league"]) for t in json.load(f)]
+
+def _roster(team):
+    hitters = [(f"{team.lower()}h{n:02d}", f"{team} Hitter {n}", pos) for n, pos in enumerate(HITTER_POSITIONS)]
+    pitchers = [(f"{team.lower()}p{n:02d}", f"{team} Pitcher {n}", 1) for n in range(PITCHERS_PER_ROSTER)]
+    return {"hitters": hitters, "pitchers": pitchers}
+
+def _trade(rng, rosters, teams):
+    # swap a few hitters between clubs so some players finish with lines on two teams
+    for _ in range(3):
+        a, b = rng.choice(len(teams), 2, replace=False)
+        i, j = rng.integers(len(HITTER_POSITIONS), size=2)
+        ra, rb = rosters[teams[a][0]]["hitters"], rosters[teams[b][0]]["hitters"]
+        (pa, na, _), (pb, nb, _) = ra[i], rb[j]
+        ra[i], rb[j] = (pb, nb, ra[i][2]), (pa, na, rb[j][2])
+
+def _team_game(rng, game_num, team, dh, roster, rows):
+    hitters = roster["hitters"]
+    starters = {}
+    for idx, (pid, name, pos) in enumerate(hitters):
+        if pos not in starters or rng.random() < 0.2:
+            starters[pos] = idx
+    order = [starters[pos] for pos in range(2, 10)]
+    bench = [i for i in range(len(hitters)) if i not in order]
+
+    n_pitchers = 1 if rng.random() < 0.08 else int(rng.integers(2, 5))
+    staff = rng.choice(PITCHERS_PER_ROSTER, n_pitchers, replace=False)
+    cuts = np.sort(rng.choice(np.arange(1, 27), n_pitchers - 1, replace=False))
+    outs = np.diff(np.concatenate(([0], cuts, [27])))
+
+    lineup = [(hitters[i], hitters[i][2]) for i in order]
+    if dh:
+        lineup.append((hitters[bench.pop(0)], "DH"))
+    rng.shuffle(lineup)
+    if not dh:
+        lineup.append((roster["pitchers"][staff[0]], 1))
+
+    def row(player, bop, pos, gs, inn, pit=np.nan, ip=np.nan):
+        pid, name, _ = player
+        rows.append((game_num, team, pid, name, bop, pos, gs, pit, ip, inn))
+
+    for bop, (player, pos) in enumerate(lineup, start=1):
+        if pos == 1:
+            continue
+        row(player, bop, pos, 1, 9.0 if pos != "DH" else np.nan)
+    if rng.random() < 0.3 and bench:
+        row(hitters[bench[0]], int(rng.integers(1, 10)), "PH", np.nan, np.nan)
+
+    for n, (p, o) in enumerate(zip(staff, outs), start=1):
+        ip = o / 3
+        bop = len(lineup) if (n == 1 and not dh) else np.nan
+        row(roster["pitchers"][p], bop, 1, 1 if n == 1 else np.nan, ip, pit=n, ip=ip)
+
+def synthetic_schedule(seasons=1, seed=1999, games_per_season=GAMES_PER_SEASON):
+    """Schedule sheet where every team plays once a day: 15 games a day, 162 per team."""
+    rng = np.random.default_rng(seed)
+    teams = [team for team, _ in load_teams()]
+    per_day = len(teams) // 2
+
+    rows = []
+    game_num = 0
+    for season in range(seasons):
+        opening = pd.Timestamp(1999 + season, 4, 5)
+        for g in range(games_per_season):
+            day, slot = divmod(g, per_day)
+            if slot == 0:
+                order = rng.permutation(len(teams))
+            away, home = teams[order[2 * slot]], teams[order[2 * slot + 1]]
+            date = opening + pd.Timedelta(days=day)
+            away_score, home_score = rng.integers(0, 10, size=2)
+            if away_score == home_score:
+                home_score += 1
+            game_num += 1
+            rows.append((game_num, f"{date:%Y%m%d}_{away}@{home}", date, away, home,
+                         int(away_score), int(home_score), "Yes", date.strftime("%B %Y"), np.nan))
+
+    return pd.DataFrame(rows, columns=[
+        "Game#", "Game ID", "Date", "Away", "Home", "Away Score", "Home Score", "Played", "Played On",
+        "Doubleheader?"
+    ])
+
+def synthetic_gamelog(seasons=1, seed=1999, games_per_season=GAMES_PER_SEASON, schedule=None):
+    """GameLog sheet for the games in ``schedule`` (built with the same seed if not given)."""
+    if schedule is None:
+        schedule = synthetic_schedule(seasons, seed, games_per_season)
+    rng = np.random.default_rng(seed)
+    teams = load_teams()
+    leagues = dict(teams)
+    rosters = {team: _roster(team) for team, _ in teams}
+
+    rows = []
+    for i, (game_num, away, home) in enumerate(zip(schedule["Game#"], schedule["Away"], schedule["Home"])):
+        if i and i % games_per_season == games_per_season // 2:
+            _trade(rng, rosters, teams)
+        for team in (away, home):
+            _team_game(rng, game_num, team, leagues[team] == "AL", rosters[team], rows)
+
+    skeleton = pd.DataFrame(rows, columns=["Game#", "Team", "Player ID", "Player Name", "BOP", "POS", "GS", "Pit #", "IP", "INN"])
+    n = len(skeleton)
+    bop = skeleton["BOP"].fillna(0).to_numpy()
+    pos = skeleton["POS"]
+    is_pitcher = (pos == 1).to_numpy()
+    is_fielder = pos.map(lambda p: isinstance(p, int)).to_numpy()
+    batting = bop > 0
+    outs = np.rint(skeleton["IP"].fillna(0).to_numpy() * 3)
+
+    stats = {}
+    ab = np.where(batting, np.where(pos == "PH", 1, rng.integers(3, 6, n)), 0)
+    h = rng.binomial(ab, 0.26)
+    hr = rng.binomial(h, 0.12)
+    triples = rng.binomial(h - hr, 0.02)
+    doubles = rng.binomial(h - hr - triples, 0.2)
+    stats.update({
+        "AB": ab, "H": h, "2B": doubles, "3B": triples, "HR": hr,
+        "R": np.where(batting, rng.poisson(0.5, n), 0),
+        "RBI": np.where(batting, rng.poisson(0.5, n), 0),
+        "BB": np.where(batting, rng.poisson(0.35, n), 0),
+        "IBB": np.where(batting, rng.poisson(0.02, n), 0),
+        "SO": rng.binomial(ab, 0.18),
+        "SB": np.where(batting, rng.poisson(0.06, n), 0),
+        "CS": np.where(batting, rng.poisson(0.02, n), 0),
+        "GDP": np.where(batting, rng.poisson(0.08, n), 0),
+        "HBP": np.where(batting, rng.poisson(0.03, n), 0),
+        "SH": np.where(batting, rng.poisson(0.02, n), 0),
+        "SF": np.where(batting, rng.poisson(0.03, n), 0),
+    })
+
+    runs = np.where(is_pitcher, rng.poisson(outs / 6), 0)
+    decision = rng.random(n)
+    stats.update({
+        "W": np.where(is_pitcher & (decision < 0.2), 1, 0),
+        "L": np.where(is_pitcher & (decision >= 0.8), 1, 0),
+        "SV": np.where(is_pitcher & (decision >= 0.2) & (decision < 0.25), 1, 0),
+        "H allowed": np.where(is_pitcher, rng.poisson(outs / 3), 0),
+        "R against": runs,
+        "ER": rng.binomial(runs, 0.9),
+        "HR allowed": np.where(is_pitcher, rng.poisson(outs / 25), 0),
+        "BB against": np.where(is_pitcher, rng.poisson(outs / 8), 0),
+        "IBB against": np.where(is_pitcher, rng.poisson(0.03, n), 0),
+        "SO against": np.where(is_pitcher, rng.poisson(outs / 4), 0),
+        "HBP against": np.where(is_pitcher, rng.poisson(0.04, n), 0),
+        "BK": np.where(is_pitcher, rng.poisson(0.01, n), 0),
+        "WP": np.where(is_pitcher, rng.poisson(0.05, n), 0),
+    })
+
+    catcher = (pos == 2).to_numpy()
+    stats.update({
+        "PO": np.where(is_fielder, rng.poisson(np.where(catcher, 7, 2), n), 0),
+        "A": np.where(is_fielder, rng.poisson(1.2, n), 0),
+        "ERR": np.where(is_fielder, rng.poisson(0.06, n), 0),
+        "DP": np.where(is_fielder, rng.poisson(0.2, n), 0),
+        "TP": np.zeros(n, dtype=int),
+        "PB": np.where(catcher, rng.poisson(0.03, n), 0),
+        "SB against": np.where(catcher, rng.poisson(0.4, n), 0),
+        "CS against": np.where(catcher, rng.poisson(0.15, n), 0),
+        "Pko": np.where(is_pitcher, rng.poisson(0.01, n), 0),
+    })
+
+    gamelog = skeleton.copy()
+    for col, values in stats.items():
+        # the workbook leaves zero cells blank
+        gamelog[col] = np.where(values == 0, np.nan, values.astype(float))
+    gamelog["POS"] = gamelog["POS"].astype(object)
+    return gamelog[GAMELOG_COLUMNS]
+
+def synthetic_linescores(schedule, seed=1999):
+    """Linescores sheet: an away and a home row per game, runs spread over the innings.
+
+    A winning home side doesn't bat in the 9th, as in the workbook.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(schedule)
+    away = schedule["Away Score"].to_numpy()
+    home = schedule["Home Score"].to_numpy()
+    home_won = home > away
+
+    away_innings = rng.multinomial(away, [1 / 9] * 9).astype(float)
+    home_innings = np.zeros((n, 9))
+    home_innings[home_won, :8] = rng.multinomial(home[home_won], [1 / 8] * 8)
+    home_innings[~home_won] = rng.multinomial(home[~home_won], [1 / 9] * 9)
+    home_innings[home_won, 8] = np.nan
+
+    innings = np.full((2 * n, MAX_INNINGS), np.nan)
+    innings[0::2, :9] = away_innings
+    innings[1::2, :9] = home_innings
+
+    frame = pd.DataFrame({
+        "Game#": np.repeat(schedule["Game#"].to_numpy(), 2),
+        "Game ID": np.repeat(schedule["Game ID"].to_numpy(), 2),
+        "Team": np.column_stack([schedule["Away"], schedule["Home"]]).ravel(),
+        "SCORE": np.column_stack([away, home]).ravel(),
+    })
+    for i in range(MAX_INNINGS):
+        frame[i + 1] = innings[:, i]
+    return frame
+
+def synthetic_workbook(seasons=1, seed=1999, cache=True):
+    """(gamelog, schedule, linescores) like generate_stats.load_data, pickled under data/.cache/synthetic."""
+    path = os.path.join(CACHE_DIR, f"{seasons}_seasons_seed{seed}.pkl")
+    if cache and os.path.exists(path):
+        return pd.read_pickle(path)
+
+    schedule = synthetic_schedule(seasons, seed)
+    frames = (synthetic_gamelog(seasons, seed, schedule=schedule), schedule, synthetic_linescores(schedule, seed))
+    if cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pd.to_pickle(frames, path)
+    return frames
+
+def synthetic_team_workbook(seasons=1, seed=1999):
+    """Path of an .xlsx with a "<TEAM> B", "<TEAM> P" and "<TEAM> F" sheet per team, built from the synthetic GameLog."""
+    from aggregation import aggregate_gamelog, batting_records, pitching_records, fielding_by_position_records
+    from stat_format import format_records
+
+    path = os.path.join(CACHE_DIR, f"team_sheets_{seasons}_seasons_seed{seed}.xlsx")
+    if os.path.exists(path):
+        return path
+    totals = aggregate_gamelog(synthetic_workbook(seasons, seed)[0])
+    sheets = {
+        "B": pd.DataFrame(batting_records(totals)),
+        "P": pd.DataFrame(format_records(pitching_records(totals), "pitching")),
+        "F": pd.DataFrame(fielding_by_position_records(totals)).rename(columns={"Inn": "INN", "E": "ERR"}),
+    }
+    sheets["P"]["IP"] = sheets["P"]["IP"].astype(float)
+    sheets["F"]["INN"] = sheets["F"]["INN"] / 3
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with pd.ExcelWriter(path) as writer:
+        for team, _ in load_teams():
+            for kind, frame in sheets.items():
+                lines = frame[frame["team"] == team].drop(columns="team")
+                lines.to_excel(writer, sheet_name=f"{team} {kind}", index=False)
+    return path
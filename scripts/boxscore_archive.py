@@ -0,0 +1,114 @@
+import os
+import json
+import mmap
+import time
+
+from stat_utils import OUTPUT_REPORT
+
+# All of a season's box scores in one file instead of one file per game:
+#
+#   boxscores.jsonl        one compact JSON box score per line
+#   boxscores.index.json   {"version": 1, "games": {"19990404_COL@SDP": [offset, length], ...}}
+#
+# offset/length are byte positions in the .jsonl, so a reader seeks (or
+# slices a memory map) straight to one game without parsing the rest. The
+# line holds exactly what data/boxscores/<Game ID>.json holds. An
+# --incremental build appends its new games to the end and adds them to
+# the index; a full build rewrites both files. The archive is never
+# compressed, since that would rule out reading one game at an offset.
+
+FORMAT_VERSION = 1
+
+
+def archive_paths(boxscore_dir):
+    """(archive, index) paths that sit next to ``boxscore_dir``."""
+    base = os.path.normpath(boxscore_dir)
+    return f"{base}.jsonl", f"{base}.index.json"
+
+def encode_boxscore(box):
+    return json.dumps(box, separators=(",", ":")).encode("utf-8")
+
+def load_index(index_path):
+    with open(index_path) as f:
+        index = json.load(f)
+    if index.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{index_path}: unsupported box-score index version {index.get('version')}")
+    return index["games"]
+
+def write_archive(entries, boxscore_dir, append=False):
+    """Write ``(Game ID, encoded box score)`` pairs to the archive; returns how many games it indexes."""
+    with ArchiveWriter(boxscore_dir, append=append) as archive:
+        for game_id, data in entries:
+            archive.add(game_id, data)
+    return len(archive.games)
+
+def read_boxscore(boxscore_dir, game_id, index=None):
+    """One game's box score, read with a seek; pass ``index`` (from load_index) to skip reloading it."""
+    archive_path, index_path = archive_paths(boxscore_dir)
+    offset, length = (index or load_index(index_path))[game_id]
+    with open(archive_path, "rb") as f:
+        f.seek(offset)
+        return json.loads(f.read(length))
+
+
+class ArchiveWriter:
+    """Adds games to the archive one at a time; the index is written on close()."""
+
+    def __init__(self, boxscore_dir, append=False):
+        self.archive_path, self.index_path = archive_paths(boxscore_dir)
+        self.start = time.perf_counter()
+        append = append and os.path.exists(self.archive_path) and os.path.exists(self.index_path)
+        self.games = load_index(self.index_path) if append else {}
+        self._file = open(self.archive_path, "ab" if append else "wb")
+        self.offset = self._file.tell()
+
+    def add(self, game_id, data):
+        self._file.write(data + b"\n")
+        self.games[game_id] = [self.offset, len(data)]
+        self.offset += len(data) + 1
+
+    def close(self):
+        self._file.close()
+        with open(self.index_path, "w") as f:
+            json.dump({"version": FORMAT_VERSION, "games": self.games}, f, separators=(",", ":"))
+        OUTPUT_REPORT.append((self.archive_path, {"json": self.offset}, time.perf_counter() - self.start))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BoxscoreArchive:
+    """The archive memory-mapped, for reading many games: ``with BoxscoreArchive(dir) as a: a[game_id]``."""
+
+    def __init__(self, boxscore_dir):
+        archive_path, index_path = archive_paths(boxscore_dir)
+        self.index = load_index(index_path)
+        self._file = open(archive_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.index else None
+
+    def __contains__(self, game_id):
+        return game_id in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, game_id):
+        offset, length = self.index[game_id]
+        return json.loads(self._map[offset:offset + length])
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
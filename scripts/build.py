@@ -0,0 +1,560 @@
+"""Single entry point for every generated file under data/.
+
+    python scripts/build.py [--incremental] [--stages standings player_shards] [--force]
+    python scripts/build.py --season 1999 "data/1999 Replay.xlsx" "data/SOM 1999 Full Season Replay.xlsm" \
+                            --season 2000 "data/2000 Replay.xlsx"
+
+The build is a graph of stages. Each stage declares the stages it reads
+from and the files it writes. Workbook sheets are loaded once and shared in
+memory, and stages whose inputs are all ready run concurrently.
+
+Every stage gets a fingerprint: a hash of the build code, the output
+options and the fingerprints of its inputs, down to the content of each
+sheet. A stage is skipped when its fingerprint matches the previous run
+(recorded in data/stats/build_manifest.json, which git ignores, so a fresh
+checkout runs everything) and its files still exist. A skipped stage only
+runs again when a changed stage further down needs its value.
+
+With --season (repeatable: name, workbook and optionally the team
+workbook) every season is built the same way in its own process, into
+<data-dir>/<season>/stats and <data-dir>/<season>/boxscores, each with its
+own manifest and build state. Career lines are then summed from the
+seasons' build states (career.py) into <data-dir>/career, and
+<data-dir>/seasons.json lists the seasons and where their files are.
+"""
+import os
+import json
+import glob
+import hashlib
+import argparse
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import pandas as pd
+
+import columnar_log
+from ingest import open_workbook, file_digest
+from instrumentation import BuildTimer
+from schedule_index import build_schedule_index, game_id_for
+from build_state import game_digests, load_state, save_state, stale_games
+from standings import build_standings, format_standings, standings_by_date
+from streaks import team_streaks, hitting_streaks
+from leaders import build_leaders
+from window_stats import window_sections
+from career import load_season_totals, career_records, traded_records
+from player_shards import group_by_player, write_player_shards
+from stat_json_generator import read_team_sheets, write_team_files
+from stat_utils import add_output_arguments, set_output_options, print_output_report, save_json, save_json_rows
+from stat_format import FORMATS, format_record, format_records
+from aggregation import (
+    aggregate_gamelog, batting_records, pitching_records, fielding_records, fielding_by_position_records
+)
+from boxscore_archive import archive_paths
+from generate_stats import (
+    write_boxscores, build_schedule, build_linescores, build_game_logs, BOXSCORE_LAYOUTS
+)
+
+MANIFEST_FILE = "build_manifest.json"
+MANIFEST_VERSION = 1
+TEAM_WORKBOOK = "data/SOM 1999 Full Season Replay.xlsm"
+TEAMS_JSON = "data/teams.json"
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+STAGES = {}
+
+
+def stage(name, deps=(), outputs=None):
+    """Register a stage. ``outputs(ctx)`` lists the files or folders it writes."""
+    def register(fn):
+        STAGES[name] = {"deps": list(deps), "outputs": outputs or (lambda ctx: []), "run": fn}
+        return fn
+    return register
+
+
+class BuildContext:
+    def __init__(self, args):
+        self.args = args
+        self.output_dir = args.output_dir
+        self.values = {}
+        self._workbooks = {}
+        self._lock = threading.Lock()
+
+    def workbook(self, path):
+        # CachedWorkbook updates its manifest on a cache miss, so sheet loads take turns
+        with self._lock:
+            if path not in self._workbooks:
+                self._workbooks[path] = open_workbook(path, use_cache=not self.args.no_cache)
+            return self._workbooks[path]
+
+    def sheet(self, name):
+        xls = self.workbook(self.args.input)
+        with self._lock:
+            return xls.parse(name)
+
+    def out(self, name):
+        return os.path.join(self.output_dir, name)
+
+
+def _frame_digest(df):
+    digest = hashlib.sha256(json.dumps([str(c) for c in df.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _code_digest():
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(SCRIPTS_DIR, "*.py"))):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Inputs: each returns (value, content fingerprint)
+
+@stage("GameLog")
+def load_gamelog(ctx, st):
+    df = ctx.sheet("GameLog")
+    st["rows"] = len(df)
+    return df, _frame_digest(df)
+
+@stage("Schedule")
+def load_schedule(ctx, st):
+    df = ctx.sheet("Schedule")
+    st["rows"] = len(df)
+    return df, _frame_digest(df)
+
+@stage("Linescores")
+def load_linescores(ctx, st):
+    df = ctx.sheet("Linescores")
+    st["rows"] = len(df)
+    return df, _frame_digest(df)
+
+@stage("teams")
+def load_teams(ctx, st):
+    with open(TEAMS_JSON) as f:
+        text = f.read()
+    return json.loads(text), hashlib.sha256(text.encode()).hexdigest()
+
+@stage("TeamWorkbook")
+def load_team_workbook(ctx, st):
+    path = ctx.args.team_workbook
+    if not path or not os.path.exists(path):
+        return None, "missing"
+    xls = ctx.workbook(path)
+    return xls, xls.manifest["sha256"] if xls.manifest else file_digest(path)
+
+INPUTS = ["GameLog", "Schedule", "Linescores", "teams", "TeamWorkbook"]
+
+
+@stage("schedule_index", deps=["Schedule"])
+def schedule_index_stage(ctx, st):
+    st["rows"] = len(ctx.values["Schedule"])
+    return build_schedule_index(ctx.values["Schedule"])
+
+@stage("plan", deps=["GameLog", "schedule_index"])
+def plan_stage(ctx, st):
+    """Which GameLog rows to fold in: all of them, or only new games on an --incremental run."""
+    gamelog_df, schedule_index = ctx.values["GameLog"], ctx.values["schedule_index"]
+    digests = game_digests(gamelog_df, schedule_index)
+
+    state = load_state(ctx.output_dir) if ctx.args.incremental else None
+    if state is not None:
+        stale = stale_games(state, digests)
+        if stale:
+            print(f"{len(stale)} game(s) changed since the last build ({', '.join(stale[:5])}); rebuilding everything.")
+            state = None
+    elif ctx.args.incremental:
+        print("No usable build state; rebuilding everything.")
+
+    if state is None:
+        new_games = gamelog_df
+    else:
+        played = {int(n) for n in gamelog_df["Game#"].dropna().unique()}
+        new_nums = {n for n in played if game_id_for(schedule_index, n) not in state["games"]}
+        new_games = gamelog_df[gamelog_df["Game#"].isin(new_nums)]
+        print(f"Incremental build: {len(new_nums)} new game(s).")
+    st["rows"] = len(new_games)
+    return {"digests": digests, "state": state, "new_games": new_games}
+
+@stage("aggregate", deps=["plan"])
+def aggregate_stage(ctx, st):
+    plan = ctx.values["plan"]
+    base = plan["state"]["totals"] if plan["state"] is not None else None
+    totals = aggregate_gamelog(plan["new_games"], base=base)
+    st["rows"] = len(plan["new_games"])
+    return {
+        "totals": totals,
+        "batting": batting_records(totals),
+        "pitching": pitching_records(totals),
+        "fielding": fielding_records(totals),
+    }
+
+def _pool_context(ctx):
+    # forking while other stages' threads are running is unsafe, so worker
+    # processes are started from a clean server process instead
+    return multiprocessing.get_context("forkserver") if ctx.args.jobs > 1 and os.name == "posix" else None
+
+def _boxscore_outputs(ctx):
+    layout = ctx.args.boxscore_layout
+    return ([ctx.args.boxscore_dir] if layout != "archive" else []) + \
+        (list(archive_paths(ctx.args.boxscore_dir)) if layout != "files" else [])
+
+@stage("boxscores", deps=["plan", "schedule_index"], outputs=_boxscore_outputs)
+def boxscores_stage(ctx, st):
+    plan = ctx.values["plan"]
+    st["rows"] = write_boxscores(plan["new_games"], ctx.values["schedule_index"],
+                                 boxscore_dir=ctx.args.boxscore_dir, workers=ctx.args.workers,
+                                 mp_context=_pool_context(ctx), layout=ctx.args.boxscore_layout,
+                                 append=plan["state"] is not None)
+
+@stage("schedule", deps=["Schedule"], outputs=lambda ctx: [ctx.out("schedule.json")])
+def schedule_stage(ctx, st):
+    schedule_data = build_schedule(ctx.values["Schedule"])
+    save_json(schedule_data, ctx.out("schedule.json"))
+    st["rows"] = len(schedule_data)
+    return schedule_data
+
+@stage("standings", deps=["schedule", "teams"],
+       outputs=lambda ctx: [ctx.out("standings.json"), ctx.out("standings_by_date.json")])
+def standings_stage(ctx, st):
+    table = build_standings(ctx.values["schedule"], ctx.values["teams"])
+    save_json(format_standings(table, ctx.values["teams"]), ctx.out("standings.json"))
+    save_json(standings_by_date(table), ctx.out("standings_by_date.json"))
+    st["rows"] = len(table["dates"])
+    return table
+
+@stage("linescores", deps=["Linescores", "GameLog", "schedule_index"], outputs=lambda ctx: [ctx.out("linescores.json")])
+def linescores_stage(ctx, st):
+    linescores = build_linescores(ctx.values["Linescores"], ctx.values["schedule_index"], ctx.values["GameLog"])
+    save_json(linescores, ctx.out("linescores.json"))
+    st["rows"] = len(linescores)
+
+def _save_section(output_dir, section, records):
+    """<section>.json as the site shows it, and <section>.typed.json with the values unformatted."""
+    save_json_rows((format_record(record, FORMATS[section]) for record in records),
+                   os.path.join(output_dir, f"{section}.json"))
+    save_json_rows(records, os.path.join(output_dir, f"{section}.typed.json"))
+
+def _section_files(ctx, sections):
+    return [ctx.out(f"{s}{suffix}.json") for s in sections for suffix in ("", ".typed")]
+
+@stage("fielding_by_position", deps=["aggregate"], outputs=lambda ctx: _section_files(ctx, ["fielding_by_position"]))
+def fielding_by_position_stage(ctx, st):
+    records = fielding_by_position_records(ctx.values["aggregate"]["totals"])
+    _save_section(ctx.output_dir, "fielding_by_position", records)
+    st["rows"] = len(records)
+    return records
+
+LOG_NAMES = ["batting_log", "pitching_log", "fielding_log"]
+
+LOG_SUFFIXES = {"columnar": [".columnar"], "rows": [""], "both": [".columnar", ""]}
+
+def _log_files(ctx):
+    return [ctx.out(f"{name}{suffix}.json") for name in LOG_NAMES for suffix in LOG_SUFFIXES[ctx.args.log_format]]
+
+@stage("game_logs", deps=["GameLog", "schedule_index"], outputs=_log_files)
+def game_logs_stage(ctx, st):
+    """The three game logs, kept columnar; row dicts are only made as they are written or grouped."""
+    logs = dict(zip(LOG_NAMES, build_game_logs(ctx.values["GameLog"], ctx.values["schedule_index"])))
+    for name, log in logs.items():
+        if ctx.args.log_format in ("columnar", "both"):
+            save_json(log, ctx.out(f"{name}.columnar.json"))
+        if ctx.args.log_format in ("rows", "both"):
+            save_json_rows(columnar_log.expand_rows(log), ctx.out(f"{name}.json"))
+    st["rows"] = sum(log["rows"] for log in logs.values())
+    return logs
+
+@stage("season_totals", deps=["aggregate"],
+       outputs=lambda ctx: _section_files(ctx, ["batting", "pitching", "fielding"]) + [ctx.out("stat_formats.json")])
+def season_totals_stage(ctx, st):
+    aggregate = ctx.values["aggregate"]
+    for section in ["batting", "pitching", "fielding"]:
+        _save_section(ctx.output_dir, section, aggregate[section])
+    save_json(FORMATS, ctx.out("stat_formats.json"))
+    st["rows"] = sum(len(aggregate[section]) for section in ["batting", "pitching", "fielding"])
+
+@stage("leaders", deps=["aggregate", "standings", "teams"], outputs=lambda ctx: [ctx.out("leaders.json")])
+def leaders_stage(ctx, st):
+    aggregate, table = ctx.values["aggregate"], ctx.values["standings"]
+    games_played = table["counts"]["W"][-1] + table["counts"]["L"][-1]
+    team_games = {team: int(games) for team, games in zip(table["teams"], games_played)}
+    leaders = build_leaders(aggregate["batting"], aggregate["pitching"], aggregate["fielding"],
+                            ctx.values["teams"], team_games)
+    save_json(leaders, ctx.out("leaders.json"))
+    st["rows"] = len(aggregate["batting"]) + len(aggregate["pitching"]) + len(aggregate["fielding"])
+
+@stage("windows", deps=["game_logs", "schedule", "teams"], outputs=lambda ctx: [ctx.out("windows")])
+def windows_stage(ctx, st):
+    """windows/<key>.json per standard game window (window_stats.py) and windows/index.json listing them."""
+    folder = ctx.out("windows")
+    os.makedirs(folder, exist_ok=True)
+    windows = []
+    for window, sections in window_sections(ctx.values["game_logs"], ctx.values["schedule"], ctx.values["teams"]):
+        save_json({
+            "window": window,
+            "batting": format_records(sections["batting"], "batting"),
+            "pitching": format_records(sections["pitching"], "pitching"),
+            "leaders": sections["leaders"],
+        }, os.path.join(folder, f"{window['key']}.json"))
+        windows.append(window)
+    save_json(windows, os.path.join(folder, "index.json"))
+    st["rows"] = len(windows)
+
+@stage("streaks", deps=["schedule", "game_logs", "teams"],
+       outputs=lambda ctx: [ctx.out("team_streaks.json"), ctx.out("hitting_streaks.json")])
+def streaks_stage(ctx, st):
+    teams = team_streaks(ctx.values["schedule"], ctx.values["teams"])
+    hitters = hitting_streaks(columnar_log.to_frame(ctx.values["game_logs"]["batting_log"]))
+    save_json(teams, ctx.out("team_streaks.json"))
+    save_json(hitters, ctx.out("hitting_streaks.json"))
+    st["rows"] = len(teams) + len(hitters)
+
+@stage("team_sheets", deps=["TeamWorkbook"])
+def team_sheets_stage(ctx, st):
+    """<TEAM>.json and players_combined.json from the per-team B/P/F sheets, when that workbook exists.
+
+    The league-wide batting/pitching/fielding.json belong to season_totals.
+    """
+    xls = ctx.values["TeamWorkbook"]
+    if xls is None:
+        print(f"{ctx.args.team_workbook} not found; skipping per-team sheet files.")
+        return None
+    teams, all_players = read_team_sheets(xls, workers=ctx.args.workers, mp_context=_pool_context(ctx))
+    combined, names = write_team_files(teams, all_players, ctx.output_dir)
+    st["rows"] = len(all_players)
+    return {"combined": combined, "names": names}
+
+@stage("player_shards", deps=["aggregate", "fielding_by_position", "game_logs", "team_sheets"], outputs=lambda ctx: [ctx.out("players")])
+def player_shards_stage(ctx, st):
+    aggregate = ctx.values["aggregate"]
+    seasons = {section: aggregate[section] for section in ["batting", "pitching", "fielding"]}
+    seasons["fielding_by_position"] = ctx.values["fielding_by_position"]
+    # traded players' TOT lines come after their team lines, with or without the team workbook
+    for section, records in traded_records(aggregate["totals"]).items():
+        seasons[section] = seasons[section] + records
+    sections = {
+        **{section: format_records(records, section) for section, records in seasons.items()},
+        **{name: columnar_log.expand_rows(log) for name, log in ctx.values["game_logs"].items()},
+    }
+    by_player = {name: group_by_player(records) for name, records in sections.items()}
+    team_sheets = ctx.values["team_sheets"]
+    names = None
+    if team_sheets is not None:
+        by_player["combined"] = team_sheets["combined"]
+        names = team_sheets["names"]
+    st["rows"] = write_player_shards(ctx.output_dir, by_player, names)
+    print(f"{st['rows']} player files written to {ctx.out('players')}.")
+
+@stage("build_state", deps=["plan", "aggregate"], outputs=lambda ctx: [ctx.out("build_state.json")])
+def build_state_stage(ctx, st):
+    save_state(ctx.output_dir, ctx.values["plan"]["digests"], ctx.values["aggregate"]["totals"])
+
+
+def _ancestors(names):
+    seen = set()
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        if name not in seen:
+            seen.add(name)
+            stack.extend(STAGES[name]["deps"])
+    return seen
+
+def _topological(names):
+    order, done = [], set()
+    def visit(name):
+        if name in done:
+            return
+        for dep in STAGES[name]["deps"]:
+            visit(dep)
+        done.add(name)
+        order.append(name)
+    for name in STAGES:
+        if name in names:
+            visit(name)
+    return order
+
+def _outputs_exist(ctx, name):
+    return all(os.path.exists(path) for path in STAGES[name]["outputs"](ctx))
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        manifest = json.load(f)
+    return manifest["stages"] if manifest.get("version") == MANIFEST_VERSION else {}
+
+def save_manifest(output_dir, stages):
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "stages": stages}, f, indent=2, sort_keys=True)
+
+def run_stages(ctx, names, timer, jobs):
+    """Run ``names`` (already closed over their dependencies) as soon as their inputs are ready."""
+    pending = {name: set(STAGES[name]["deps"]) & set(names) for name in names}
+    running = {}
+
+    def run(name):
+        with timer.stage(name) as st:
+            return STAGES[name]["run"](ctx, st)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in [n for n, deps in pending.items() if not deps]:
+                del pending[name]
+                running[pool.submit(run, name)] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                ctx.values[name] = future.result()
+                for deps in pending.values():
+                    deps.discard(name)
+
+def build(args):
+    os.makedirs(args.output_dir, exist_ok=True)
+    if args.profile is not None:
+        args.jobs = 1  # one cProfile profiler at a time
+    profile_dir = (args.profile or os.path.join(args.output_dir, "profile")) if args.profile is not None else None
+    timer = BuildTimer(profile_dir)
+    ctx = BuildContext(args)
+
+    wanted = _ancestors(args.stages or STAGES)
+    inputs = [name for name in INPUTS if name in wanted]
+
+    # inputs always load: their content is what every other fingerprint is built from
+    fingerprints = {}
+    run_stages(ctx, inputs, timer, args.jobs)
+    for name in inputs:
+        ctx.values[name], fingerprints[name] = ctx.values[name]
+
+    settings = json.dumps({
+        "code": _code_digest(), "input": args.input, "output_dir": args.output_dir,
+        "team_workbook": args.team_workbook, "boxscore_dir": args.boxscore_dir,
+        "boxscore_layout": args.boxscore_layout, "format": args.format, "compress": sorted(args.compress),
+        "log_format": args.log_format,
+    }, sort_keys=True)
+    order = [name for name in _topological(wanted) if name not in inputs]
+    for name in order:
+        parts = [name, settings] + [fingerprints[dep] for dep in STAGES[name]["deps"]]
+        fingerprints[name] = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    previous = load_manifest(args.output_dir)
+    changed = [
+        name for name in order
+        if args.force or previous.get(name, {}).get("fingerprint") != fingerprints[name] or not _outputs_exist(ctx, name)
+    ]
+    # unchanged stages still run when a changed stage needs their in-memory result
+    to_run = [name for name in order if name in _ancestors(changed) and name not in inputs]
+    skipped = [name for name in order if name not in to_run]
+    if skipped:
+        print(f"Unchanged, skipped: {', '.join(skipped)}")
+
+    try:
+        run_stages(ctx, to_run, timer, args.jobs)
+    finally:
+        finished = {name: {"fingerprint": fingerprints[name]} for name in to_run if name in ctx.values}
+        save_manifest(args.output_dir, {**previous, **finished})
+
+    if args.report:
+        print_output_report()
+    timer.print_summary()
+    timer.write_report(
+        args.output_dir, input=args.input, incremental=args.incremental, workers=args.workers, jobs=args.jobs,
+        format=args.format, skipped=skipped
+    )
+
+def season_args(args, season, workbook, team_workbook=None):
+    """``args`` for building one season of a --season build."""
+    season_dir = os.path.join(args.data_dir, season)
+    return argparse.Namespace(**{
+        **vars(args),
+        "season": None,
+        "input": workbook,
+        "team_workbook": team_workbook,
+        "output_dir": os.path.join(season_dir, "stats"),
+        "boxscore_dir": os.path.join(season_dir, "boxscores"),
+        # a --profile DIR gets a folder per season; the default is already per season
+        "profile": os.path.join(args.profile, season) if args.profile else args.profile,
+    })
+
+def _build_season(args):
+    # a process per season: output options are module state, so set them here
+    set_output_options(args.format, args.compress)
+    build(args)
+    return args.output_dir
+
+def build_seasons(args):
+    seasons = [season_args(args, *spec) for spec in args.season]
+    names = [spec[0] for spec in args.season]
+    workers = max(1, min(args.season_workers, len(seasons)))
+    if workers == 1:
+        stats_dirs = [_build_season(season) for season in seasons]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            stats_dirs = list(pool.map(_build_season, seasons))
+
+    career_dir = os.path.join(args.data_dir, "career")
+    os.makedirs(career_dir, exist_ok=True)
+    season_totals = load_season_totals(zip(names, stats_dirs))
+    if season_totals:
+        for section, records in career_records([totals for _, totals in season_totals]).items():
+            _save_section(career_dir, section, records)
+        save_json(FORMATS, os.path.join(career_dir, "stat_formats.json"))
+        print(f"Career totals over {len(season_totals)} season(s) written to {career_dir}.")
+    save_json([
+        {"season": name, "stats": season.output_dir, "boxscores": season.boxscore_dir,
+         "in_career": name in dict(season_totals)}
+        for name, season in zip(names, seasons)
+    ], os.path.join(args.data_dir, "seasons.json"))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the site's stat JSON from the replay workbook.")
+    parser.add_argument("--input", default="data/1999 Replay.xlsx")
+    parser.add_argument("--team-workbook", default=TEAM_WORKBOOK,
+                        help="workbook with the per-team '<TEAM> B/P/F' sheets (skipped if missing)")
+    parser.add_argument("--output-dir", default="data/stats")
+    parser.add_argument("--boxscore-dir", default="data/boxscores")
+    parser.add_argument("--boxscore-layout", choices=BOXSCORE_LAYOUTS, default="files",
+                        help="one file per game in --boxscore-dir, one <boxscore-dir>.jsonl archive "
+                             "with an offset index, or both")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES),
+                        help="build only these stages (and what they depend on)")
+    parser.add_argument("--force", action="store_true", help="rerun every stage even if its inputs are unchanged")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="stages run at the same time")
+    parser.add_argument("--incremental", action="store_true",
+                        help="fold in only games not recorded in the build state from the last run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes used to build and write box scores and to parse team sheets (1 = in-process)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="parse the workbook directly instead of through the data/.cache column cache")
+    parser.add_argument("--log-format", choices=["rows", "columnar", "both"], default="columnar",
+                        help="game logs as *.columnar.json (what the site reads), lists of row dicts, or both")
+    parser.add_argument("--profile", nargs="?", const="", metavar="DIR",
+                        help="dump cProfile stats per stage into DIR (default <output-dir>/profile); runs stages one at a time")
+    parser.add_argument("--season", action="append", nargs="+", metavar=("SEASON", "WORKBOOK"),
+                        help="build a season from WORKBOOK [TEAM_WORKBOOK] into <data-dir>/SEASON; repeat for "
+                             "each season (--input, --team-workbook, --output-dir and --boxscore-dir are then ignored)")
+    parser.add_argument("--season-workers", type=int, default=os.cpu_count() or 1,
+                        help="seasons built at the same time, each in its own process")
+    parser.add_argument("--data-dir", default="data", help="where --season builds write their folders")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    for spec in args.season or []:
+        if len(spec) not in (2, 3):
+            parser.error(f"--season takes SEASON WORKBOOK [TEAM_WORKBOOK], got {spec}")
+    names = [spec[0] for spec in args.season or []]
+    if len(set(names)) != len(names) or "career" in names:
+        parser.error("each --season needs its own name, other than \"career\"")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    set_output_options(args.format, args.compress)
+    if args.season:
+        build_seasons(args)
+    else:
+        build(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import os
+import json
+import pandas as pd
+from schedule_index import game_id_for
+
+# Persistent record of what an earlier generate_stats.py run already folded
+# in: a content digest per Game ID and the raw (unformatted) season totals.
+# An --incremental run reduces only the games missing from it and adds them
+# on top. (Standings are rebuilt from the whole schedule every time; see
+# standings.py.)
+
+STATE_FILE = "build_state.json"
+STATE_VERSION = 4
+
+FRAME_SECTIONS = ("batting", "pitching", "fielding", "fielding_by_position")
+
+
+def state_path(output_dir):
+    return os.path.join(output_dir, STATE_FILE)
+
+def game_digests(gamelog_df, schedule_index):
+    """Order-insensitive content hash of each game's GameLog rows, keyed by Game ID."""
+    rows = gamelog_df[gamelog_df["Game#"].notna()]
+    hashes = pd.util.hash_pandas_object(rows, index=False)
+    per_game = hashes.groupby(rows["Game#"].astype(int).to_numpy(), sort=False).sum()
+    return {game_id_for(schedule_index, int(num)): f"{int(digest):016x}" for num, digest in per_game.items()}
+
+def load_state(output_dir):
+    path = state_path(output_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        state = json.load(f)
+    if state.get("version") != STATE_VERSION:
+        return None
+
+    state["totals"] = {name: pd.DataFrame(state["totals"][name]) for name in FRAME_SECTIONS}
+    return state
+
+def save_state(output_dir, games, totals):
+    state = {
+        "version": STATE_VERSION,
+        "games": games,
+        "totals": {name: totals[name].to_dict("records") for name in FRAME_SECTIONS},
+    }
+    with open(state_path(output_dir), "w") as f:
+        json.dump(state, f)
+
+def stale_games(state, digests):
+    """Game IDs folded in earlier whose rows have since changed or disappeared."""
+    return [gid for gid, digest in state["games"].items() if digests.get(gid) != digest]
@@ -0,0 +1,61 @@
+import pandas as pd
+from build_state import FRAME_SECTIONS, load_state
+from aggregation import batting_records, pitching_records, fielding_records, fielding_by_position_records
+
+# Career lines for a multi-season build (build.py --season ...). Every
+# season's build leaves its raw season totals in
+# <data>/<season>/stats/build_state.json; career totals are those frames
+# summed per player (and per position), so no GameLog is read again. The
+# lines go through the same record builders as a season's, which recompute
+# the rates from the summed counts, and carry team "TOT". A traded player's
+# TOT lines in one season (the player files) are built the same way from
+# that season's totals.
+
+CAREER_TEAM = "TOT"
+
+RECORDS = {
+    "batting": batting_records,
+    "pitching": pitching_records,
+    "fielding": fielding_records,
+    "fielding_by_position": fielding_by_position_records,
+}
+
+
+def load_season_totals(seasons):
+    """[(season, totals)] from each ``(season, stats dir)`` that has a build state."""
+    result = []
+    for season, stats_dir in seasons:
+        state = load_state(stats_dir)
+        if state is None:
+            print(f"{stats_dir} has no usable build state; season {season} is left out of the career totals.")
+            continue
+        result.append((season, state["totals"]))
+    return result
+
+def combine_totals(season_totals):
+    """aggregate_gamelog-style totals summed over ``season_totals`` (oldest first) per player."""
+    combined = {}
+    for section in FRAME_SECTIONS:
+        frame = pd.concat([totals[section] for totals in season_totals], ignore_index=True)
+        keys = ["Player ID", "POS"] if section == "fielding_by_position" else ["Player ID"]
+        grouped = frame.groupby(keys, sort=False, dropna=False)
+        columns = [col for col in frame.columns if col not in keys and col not in ("Team", "Player")]
+        totals = grouped[columns].sum()
+        totals["Player"] = grouped["Player"].last()
+        totals["Team"] = CAREER_TEAM
+        combined[section] = totals.reset_index()
+    return combined
+
+def career_records(season_totals):
+    """{section: typed career records} from [totals] in season order."""
+    combined = combine_totals(season_totals)
+    return {section: build(combined) for section, build in RECORDS.items()}
+
+def traded_records(totals):
+    """{section: typed TOT records} for players with lines on more than one team in one season's ``totals``."""
+    traded = {}
+    for section, frame in totals.items():
+        keys = ["Player ID", "POS"] if section == "fielding_by_position" else ["Player ID"]
+        teams = frame.groupby(keys, sort=False, dropna=False)["Team"].transform("nunique")
+        traded[section] = frame[teams > 1]
+    return career_records([traded])
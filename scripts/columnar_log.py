@@ -0,0 +1,99 @@
+import json
+import numpy as np
+import pandas as pd
+
+# Game logs stored column-wise instead of as a list of dicts that repeats
+# every key on every row:
+#
+#   {"version": 1, "rows": 3,
+#    "columns": ["Player ID", "Team", "Game#", "AB"],
+#    "dictionaries": {"Player ID": ["ruthb", "gehrl"], "Team": ["NYY"]},
+#    "sparse": ["AB"],
+#    "values": [[0, 1, 0], [0, 0, 0], [1, 1, 2], [4, null, 3]]}
+#
+# "values" holds one array per column, in column order. Columns listed in
+# "dictionaries" store integer codes into that list instead of the values.
+# Columns listed in "sparse" are left out of an expanded row when they are
+# null, so expand_rows() returns exactly the dicts the row-format logs contain.
+# A sparse column that is null in most rows (the workbook leaves zeros blank)
+# is stored as {"gaps": [...], "values": [...]} instead: only the non-null
+# values, with "gaps" giving each one's distance from the previous non-null
+# row (the first gap counts from row -1).
+
+FORMAT_VERSION = 1
+
+
+def encode(columns, dictionary=(), sparse=()):
+    """Columnar log from ``{name: sequence}``; every sequence has one value per row."""
+    names = list(columns)
+    log = {
+        "version": FORMAT_VERSION,
+        "rows": len(columns[names[0]]) if names else 0,
+        "columns": names,
+        "dictionaries": {},
+        "sparse": [name for name in names if name in sparse],
+        "values": [],
+    }
+    for name in names:
+        values = pd.Series(columns[name]).astype(object)
+        if name in dictionary:
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            log["dictionaries"][name] = list(uniques)
+            log["values"].append(codes.tolist())
+        elif name in sparse and values.isna().sum() * 2 > len(values):
+            present = np.flatnonzero(values.notna().to_numpy())
+            log["values"].append({
+                "gaps": np.diff(present, prepend=-1).tolist(),
+                "values": values.iloc[present].tolist(),
+            })
+        else:
+            log["values"].append(values.tolist())
+    return log
+
+def _missing(value):
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+def _column(log, name, values):
+    if isinstance(values, dict):
+        full = [None] * log["rows"]
+        for i, value in zip((np.cumsum(values["gaps"]) - 1).tolist(), values["values"]):
+            full[i] = value
+        return full
+    if name in log["dictionaries"]:
+        dictionary = log["dictionaries"][name]
+        return [dictionary[code] for code in values]
+    return values
+
+def _decoded(log):
+    return [_column(log, name, values) for name, values in zip(log["columns"], log["values"])]
+
+def expand_rows(log):
+    """Yield each row as the dict the row-format log would have held."""
+    names = log["columns"]
+    sparse = [name in set(log["sparse"]) for name in names]
+    columns = _decoded(log)
+    for i in range(log["rows"]):
+        row = {}
+        for name, values, is_sparse in zip(names, columns, sparse):
+            value = values[i]
+            if is_sparse and _missing(value):
+                continue
+            row[name] = value
+        yield row
+
+def to_frame(log):
+    """Decode straight into a DataFrame (one column per log column) for analysis."""
+    data = {}
+    for name, values in zip(log["columns"], log["values"]):
+        if name in log["dictionaries"]:
+            data[name] = np.asarray(log["dictionaries"][name], dtype=object)[np.asarray(values, dtype=int)]
+        else:
+            data[name] = _column(log, name, values)
+    return pd.DataFrame(data, columns=log["columns"])
+
+def load(path):
+    with open(path) as f:
+        log = json.load(f)
+    if log.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported columnar log version {log.get('version')}")
+    return log
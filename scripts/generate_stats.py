@@ -1,422 +1,60 @@
 import pandas as pd
 import numpy as np
 import os
-import json
-from collections import defaultdict
-from fractions import Fraction
-
-def safe_int(val):
-    try:
-        return int(val)
-    except:
-        return 0
-
-def safe_float(val):
-    try:
-        return float(val)
-    except:
-        return 0.0
-
-def parse_ip(ip_val):
-    if pd.isna(ip_val):
-        return 0.0
-    try:
-        if isinstance(ip_val, (int, float)):
-            return float(ip_val)
-        if isinstance(ip_val, str):
-            parts = ip_val.strip().split()
-            if len(parts) == 2:
-                # e.g. "1 2/3"
-                whole = int(parts[0])
-                frac = float(Fraction(parts[1]))
-                return whole + frac
-            elif '/' in ip_val:
-                # e.g. "2/3"
-                return float(Fraction(ip_val))
-            else:
-                return float(ip_val)
-        return float(ip_val)
-    except:
-        return 0.0
-
-
-def convert_sets_to_lists(obj):
-    """Recursively convert sets in a nested dict or list to lists for JSON serialization."""
-    if isinstance(obj, dict):
-        return {k: convert_sets_to_lists(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_sets_to_lists(v) for v in obj]
-    elif isinstance(obj, set):
-        return list(obj)
-    else:
-        return obj
-
-def format_ip_for_display(ip):
-    if pd.isna(ip):
-        return "0.0"  # or return "" if you prefer blank
-    ip = round(ip, 2)
-    whole = int(ip)
-    remainder = round((ip - whole) * 100)
-    if remainder == 33:
-        return f"{whole}.1"
-    elif remainder == 67:
-        return f"{whole}.2"
-    return str(ip)
-
-def clean_for_json(obj):
-    if isinstance(obj, float) and (np.isnan(obj) or np.isinf(obj)):
-        return None
-    if isinstance(obj, dict):
-        return {k: clean_for_json(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [clean_for_json(v) for v in obj]
-    return obj
-
-def compute_fielding_cg(gamelog_df):
-    cg_by_player = defaultdict(int)
-    filtered = gamelog_df[gamelog_df["POS"].notna() & gamelog_df["Player ID"].notna()]
-
-    for (game, team, pos), group in filtered.groupby(["Game#", "Team", "POS"]):
-        if len(group) == 1:
-            pid = group.iloc[0]["Player ID"]
-            cg_by_player[pid] += 1
-
-    return cg_by_player
-
-
-def save_json(data, path):
-    with open(path, "w") as f:
-        json.dump(clean_for_json(data), f, indent=2)
-
-def load_data(file_path):
-    xls = pd.ExcelFile(file_path)
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict, deque
+from stat_utils import (
+    safe_int, convert_sets_to_lists, innings_to_outs, format_outs, write_json,
+    set_output_options, drain_output_report, OUTPUT_OPTIONS, OUTPUT_REPORT
+)
+from ingest import open_workbook
+from schedule_index import game_id_for
+import columnar_log
+from boxscore_archive import ArchiveWriter, encode_boxscore
+
+def load_data(file_path, use_cache=True):
+    xls = open_workbook(file_path, use_cache=use_cache)
     gamelog = xls.parse("GameLog")
     schedule = xls.parse("Schedule")
     linescore = xls.parse("Linescores")
     return gamelog, schedule, linescore
 
-def group_stats(gamelog_df):
-    batting = defaultdict(lambda: defaultdict(float))
-    games_played = defaultdict(set)
-
-    for _, row in gamelog_df.iterrows():
-        pid = row.get("Player ID")
-        if pd.isna(pid) or pid == "":
-            continue
-
-        team = row["Team"]
-        player = row["Player Name"]
-        game_num = row["Game#"]
-        key = (pid, team)
-        bop = safe_int(row.get("BOP"))
-        
-        if bop > 0:
-            games_played[key].add(game_num)
-            batting[key]["Player"] = player
-            batting[key]["AB"] += safe_int(row.get("AB"))
-            batting[key]["H"] += safe_int(row.get("H"))
-            batting[key]["2B"] += safe_int(row.get("2B"))
-            batting[key]["3B"] += safe_int(row.get("3B"))
-            batting[key]["HR"] += safe_int(row.get("HR"))
-            batting[key]["BB"] += safe_int(row.get("BB"))
-            batting[key]["IBB"] += safe_int(row.get("IBB"))
-            batting[key]["SO"] += safe_int(row.get("SO"))
-            batting[key]["R"] += safe_int(row.get("R"))
-            batting[key]["RBI"] += safe_int(row.get("RBI"))
-            batting[key]["HBP"] += safe_int(row.get("HBP"))
-            batting[key]["SH"] += safe_int(row.get("SH"))
-            batting[key]["SF"] += safe_int(row.get("SF"))
-            batting[key]["GDP"] += safe_int(row.get("GDP"))
-            batting[key]["SB"] += safe_int(row.get("SB"))
-            batting[key]["CS"] += safe_int(row.get("CS"))
-
-    result = []
-    for (pid, team), stats in batting.items():
-        ab = stats.get("AB", 0)
-        h = stats.get("H", 0)
-        bb = stats.get("BB", 0)
-        hbp = stats.get("HBP", 0)
-        sf = stats.get("SF", 0)
-        sh = stats.get("SH", 0)
-        tb = h + stats.get("2B", 0) + 2 * stats.get("3B", 0) + 3 * stats.get("HR", 0)
-        pa = ab + bb + hbp + sf + sh
-
-        avg = round(h / ab, 3) if ab else 0
-        obp = round((h + bb + hbp) / pa, 3) if pa else 0
-        slg = round(tb / ab, 3) if ab else 0
-        ops = round(obp + slg, 3)
-
-        entry = {
-            "Player": stats["Player"],
-            "team": team,
-            "G": len(games_played[(pid, team)]),
-            "PA": pa,
-            "AB": ab,
-            "R": stats.get("R", 0),
-            "H": h,
-            "2B": stats.get("2B", 0),
-            "3B": stats.get("3B", 0),
-            "HR": stats.get("HR", 0),
-            "RBI": stats.get("RBI", 0),
-            "SB": stats.get("SB", 0),
-            "CS": stats.get("CS", 0),
-            "BB": bb,
-            "SO": stats.get("SO", 0),
-            "AVG": "1.000" if avg == 1 else f"{avg:.3f}".lstrip("0"),
-            "OBP": "1.000" if obp == 1 else f"{obp:.3f}".lstrip("0"),
-            "SLG": f"{slg:.3f}" if slg >= 1 else f"{slg:.3f}".lstrip("0"),
-            "OPS": f"{ops:.3f}" if ops >= 1 else f"{ops:.3f}".lstrip("0"),
-            "TB": tb,
-            "GDP": stats.get("GDP", 0),
-            "HBP": hbp,
-            "SH": sh,
-            "SF": sf,
-            "IBB": stats.get("IBB", 0),
-            "Player ID": pid
-        }
-
-        result.append(entry)
-
-    return result
-
-def group_pitching_stats(gamelog_df, schedule_df):
-    cg_sho_counts = defaultdict(lambda: {"CG": 0, "SHO": 0})
-    for (game, team), group in gamelog_df[gamelog_df["Player ID"].notna()].groupby(["Game#", "Team"]):
-        team_pitchers = group[group["POS"] == 1]
-        if len(team_pitchers) == 1:
-            row = team_pitchers.iloc[0]
-            pid = row["Player ID"]
-            cg_sho_counts[pid]["CG"] += 1
-            if row.get("R against", 1) == 0:
-                cg_sho_counts[pid]["SHO"] += 1
-                
-    pitching = defaultdict(lambda: defaultdict(float))
-    games = defaultdict(set)
-
-    for _, row in gamelog_df.iterrows():
-        pid = row.get("Player ID")
-        if pd.isna(pid) or pid == "":
-            continue
-
-        team = row["Team"]
-        player = row["Player Name"]
-        game_id = row["Game#"]
-        key = (pid, team)
-
-        if row.get("POS") != 1:
-            continue  # Skip players who were not pitchers
-        
-        ip = parse_ip(row.get("IP"))
-        pitching[key]["Player"] = player
-        pitching[key]["IP"] += ip
-        pitching[key]["W"] += safe_int(row.get("W"))
-        pitching[key]["L"] += safe_int(row.get("L"))
-        pitching[key]["SV"] += safe_int(row.get("SV"))
-        pitching[key]["GS"] += safe_int(row.get("GS"))
-        pitching[key]["CG"] += safe_int(row.get("CG"))
-        pitching[key]["SHO"] += safe_int(row.get("SHO"))
-        pitching[key]["H"] += safe_int(row.get("H allowed"))
-        pitching[key]["R"] += safe_int(row.get("R against"))
-        pitching[key]["ER"] += safe_int(row.get("ER"))
-        pitching[key]["HR"] += safe_int(row.get("HR allowed"))
-        pitching[key]["BB"] += safe_int(row.get("BB against"))
-        pitching[key]["IBB"] += safe_int(row.get("IBB against"))
-        pitching[key]["SO"] += safe_int(row.get("SO against"))
-        pitching[key]["HBP"] += safe_int(row.get("HBP against"))
-        pitching[key]["BK"] += safe_int(row.get("BK"))
-        pitching[key]["WP"] += safe_int(row.get("WP"))
-        games[key].add(game_id)
-
-    result = []
-    for (pid, team), stats in pitching.items():
-        ip = stats.get("IP", 0)
-        er = stats.get("ER", 0)
-        h = stats.get("H", 0)
-        hr = stats.get("HR", 0)
-        bb = stats.get("BB", 0)
-        so = stats.get("SO", 0)
-
-        if ip == 0:
-            era_str = "---"
-        else:
-            era_str = f"{(er * 9 / ip):.2f}"
-        h9 = round(h * 9 / ip, 1) if ip else 0.0
-        hr9 = round(hr * 9 / ip, 1) if ip else 0.0
-        bb9 = round(bb * 9 / ip, 1) if ip else 0.0
-        so9 = round(so * 9 / ip, 1) if ip else 0.0
-        so_bb = round(so / bb, 1) if bb else 0.0
-
-        w = stats.get("W", 0)
-        l = stats.get("L", 0)
-        wl_pct = round(w / (w + l), 3) if (w + l) else 0.000
-
-        entry = {
-            "Player": stats["Player"],
-            "team": team,
-            "W": w,
-            "L": l,
-            "W-L%": "1.000" if wl_pct == 1 else f"{wl_pct:.3f}".lstrip("0"),
-            "ERA": era_str,
-            "G": len(games[(pid, team)]),
-            "GS": stats.get("GS", 0),
-            "CG": cg_sho_counts[pid]["CG"],
-            "SHO": cg_sho_counts[pid]["SHO"],
-            "SV": stats.get("SV", 0),
-            "IP": format_ip_for_display(ip),
-            "H": h,
-            "R": stats.get("R", 0),
-            "ER": er,
-            "HR": hr,
-            "BB": bb,
-            "IBB": stats.get("IBB", 0),
-            "SO": so,
-            "HBP": stats.get("HBP", 0),
-            "BK": stats.get("BK", 0),
-            "WP": stats.get("WP", 0),
-            "H9": f"{h9:.1f}",
-            "HR9": f"{hr9:.1f}",
-            "BB9": f"{bb9:.1f}",
-            "SO9": f"{so9:.1f}",
-            "SO/BB": f"{so_bb:.1f}",
-            "Player ID": pid
-        }
-
-        result.append(entry)
-
-    return result
-
-def group_fielding_stats(gamelog_df):
-    cg_by_player = compute_fielding_cg(gamelog_df)
-    from collections import defaultdict
-
-    def format_ip_for_display(ip):
-        if pd.isna(ip):
-            return "0.0"
-        ip = round(ip, 2)
-        whole = int(ip)
-        remainder = round((ip - whole) * 100)
-        if remainder == 33:
-            return f"{whole}.1"
-        elif remainder == 67:
-            return f"{whole}.2"
-        return str(ip)
-
-    fielding = defaultdict(lambda: defaultdict(float))
-    games = defaultdict(set)
-
-    for _, row in gamelog_df.iterrows():
-        pid = row.get("Player ID")
-        if pd.isna(pid) or pid == "":
-            continue
-
-        pos = row.get("POS", "")
-        if pos not in range(1, 10):  # skip DH, PH, PR, etc.
-            continue
-
-        team = row["Team"]
-        player = row["Player Name"]
-        game_id = row["Game#"]
-        key = (pid, team)
-
-        games[key].add(game_id)
-        fielding[key]["Player"] = player
-        fielding[key]["GS"] += safe_int(row.get("GS"))
-        fielding[key]["CG"] += safe_int(row.get("CG"))
-        fielding[key]["INN"] += safe_float(row.get("INN"))
-        fielding[key]["PO"] += safe_int(row.get("PO"))
-        fielding[key]["A"] += safe_int(row.get("A"))
-        fielding[key]["E"] += safe_int(row.get("ERR"))
-        fielding[key]["DP"] += safe_int(row.get("DP"))
-        fielding[key]["PB"] += safe_int(row.get("PB"))
-        fielding[key]["WP"] += safe_int(row.get("WP"))
-        fielding[key]["SB"] += safe_int(row.get("SB against"))
-        fielding[key]["CS"] += safe_int(row.get("CS against"))
-        fielding[key]["PkO"] += safe_int(row.get("Pko"))
-
-    result = []
-    for (pid, team), stats in fielding.items():
-        po = stats["PO"]
-        a = stats["A"]
-        e = stats["E"]
-        ch = po + a + e
-        fld_pct = (po + a) / ch if ch else None
-        sb = stats["SB"]
-        cs = stats["CS"]
-        cs_pct = (cs / (sb + cs)) if (sb + cs) else None
-
-        entry = {
-            "Player": stats["Player"],
-            "team": team,
-            "G": len(games[(pid, team)]),
-            "GS": int(stats["GS"]),
-            "CG": cg_by_player.get(pid, 0),
-            "Inn": format_ip_for_display(stats["INN"]),
-            "Ch": int(ch),
-            "PO": int(po),
-            "A": int(a),
-            "E": int(e),
-            "DP": int(stats["DP"]),
-            "Fld%": "1.000" if fld_pct == 1 else f"{fld_pct:.3f}".lstrip("0") if fld_pct is not None else "",
-            "PB": int(stats["PB"]) if stats["PB"] else "",
-            "WP": int(stats["WP"]) if stats["WP"] else "",
-            "SB": int(sb) if sb else "",
-            "CS": int(cs) if cs else "",
-            "CS%": f"{round(cs_pct * 100)}%" if cs_pct is not None else "",
-            "PkO": int(stats["PkO"]) if stats["PkO"] else "",
-            "Player ID": pid
-        }
-
-        result.append(entry)
-
-    return result
-
-def generate_boxscores(gamelog_df, schedule_df):
-    def safe_str(val):
-        return str(val) if not pd.isna(val) else ""
-
-    stat_list = [
-        "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "IBB", "SO", "SB", "CS", "GDP", "HBP", "SH", "SF",
-        "W", "L", "SV", "IP", "H allowed", "R against", "ER", "HR allowed", "BB against", "IBB against",
-        "SO against", "HBP against", "BK", "WP", "PO", "A", "ERR", "DP", "TP", "PB", "SB against",
-        "CS against", "Pko"
-    ]
-        
-    game_lookup = {}
-    for _, row in schedule_df.iterrows():
-        game_num = row["Game#"]
-        game_id = row["Game ID"]
-        if not pd.isna(game_num) and not pd.isna(game_id):
-            game_lookup[int(game_num)] = str(game_id)
+BOXSCORE_STATS = [
+    "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "IBB", "SO", "SB", "CS", "GDP", "HBP", "SH", "SF",
+    "W", "L", "SV", "IP", "H allowed", "R against", "ER", "HR allowed", "BB against", "IBB against",
+    "SO against", "HBP against", "BK", "WP", "PO", "A", "ERR", "DP", "TP", "PB", "SB against",
+    "CS against", "Pko"
+]
+
+def boxscore_games(gamelog_df, schedule_index):
+    """Yield (Game ID, meta, rows) per scheduled game in Game# order, turning one game's rows into dicts at a time."""
+    game_lookup = schedule_index["game_ids"]
+    if "IP" in gamelog_df:
+        gamelog_df = gamelog_df.assign(**{"IP outs": innings_to_outs(gamelog_df["IP"])})
+    game_nums = pd.to_numeric(gamelog_df["Game#"], errors="coerce").to_numpy(dtype=float)
+    positions = np.flatnonzero(~np.isnan(game_nums))
+    positions = positions[np.argsort(game_nums[positions], kind="stable")]
+    nums = game_nums[positions].astype(np.int64)
+    starts = np.flatnonzero(np.diff(nums, prepend=-1))
+    for lo, hi in zip(starts.tolist(), np.append(starts[1:], len(nums)).tolist()):
+        game_id = game_lookup.get(int(nums[lo]))
+        if not game_id:
+            continue  # skip unknown games
+        yield game_id, schedule_index["meta"][game_id], gamelog_df.iloc[positions[lo:hi]].to_dict("records")
 
-    boxscores = defaultdict(lambda: {
-        "meta": {},
+def build_boxscore(rows, meta):
+    box = {
+        # Set meta data from the schedule index instead of gamelog row
+        "meta": dict(meta),
         "batting": defaultdict(lambda: defaultdict(dict)),
         "pitching": defaultdict(lambda: defaultdict(dict)),
         "batting_order": defaultdict(list),
-        "positions": defaultdict(lambda: defaultdict(set)),
+        "positions": defaultdict(lambda: defaultdict(list)),
         "games_started": defaultdict(lambda: defaultdict(int))
-    })
-
-    for _, row in gamelog_df.iterrows():
-        game_num = row["Game#"]
-        if pd.isna(game_num):
-            continue
-        game_id = game_lookup.get(int(game_num))
-        if not game_id:
-            continue  # skip unknown games
-
-        # Set meta data from schedule_df instead of gamelog row
-        if game_id and "meta" in boxscores[game_id] and not boxscores[game_id]["meta"]:
-            sched_row = schedule_df[schedule_df["Game ID"] == game_id].iloc[0]
-            boxscores[game_id]["meta"] = {
-                "date": safe_str(sched_row.get("Date")),
-                "home": safe_str(sched_row.get("Home")),
-                "away": safe_str(sched_row.get("Away")),
-                "home_score": safe_str(sched_row.get("Home Score")),
-                "away_score": safe_str(sched_row.get("Away Score"))
     }
+    stat_list = BOXSCORE_STATS
 
-
+    for row in rows:
         team = row["Team"]
         player = row["Player Name"]
         pid = row["Player ID"]
@@ -425,79 +63,141 @@ def generate_boxscores(gamelog_df, schedule_df):
         pos = str(row.get("POS")) if not pd.isna(row.get("POS")) else ""
 
         if pos:
-            boxscores[game_id]["positions"][team][player].add(pos)
+            if pos not in box["positions"][team][player]:
+                box["positions"][team][player].append(pos)
 
         if bop > 0:
-            boxscores[game_id]["batting_order"][team].append((bop, player))
+            box["batting_order"][team].append((bop, player))
         if gs:
-            boxscores[game_id]["games_started"][team][player] += gs
-
-        if bop > 0 and "Player" not in boxscores[game_id]["batting"][team][player]:
-            boxscores[game_id]["batting"][team][player]["Player"] = player
-            boxscores[game_id]["batting"][team][player]["Player ID"] = pid
-        if pos == '1' and "Player" not in boxscores[game_id]["pitching"][team][player]:
-            boxscores[game_id]["pitching"][team][player]["Player"] = player
-            boxscores[game_id]["pitching"][team][player]["Player ID"] = pid
+            box["games_started"][team][player] += gs
+
+        if bop > 0 and "Player" not in box["batting"][team][player]:
+            box["batting"][team][player]["Player"] = player
+            box["batting"][team][player]["Player ID"] = pid
+        if pos == '1' and "Player" not in box["pitching"][team][player]:
+            box["pitching"][team][player]["Player"] = player
+            box["pitching"][team][player]["Player ID"] = pid
         for stat in stat_list:
             val = row.get(stat, 0)
             if pd.notna(val):
                 # Batting section (if BOP > 0)
                 if bop > 0:
-                    if "Player" not in boxscores[game_id]["batting"][team][player]:
-                        boxscores[game_id]["batting"][team][player]["Player"] = player
-                        boxscores[game_id]["batting"][team][player]["Player ID"] = pid
-                    if stat not in boxscores[game_id]["batting"][team][player]:
-                        boxscores[game_id]["batting"][team][player][stat] = 0
+                    if "Player" not in box["batting"][team][player]:
+                        box["batting"][team][player]["Player"] = player
+                        box["batting"][team][player]["Player ID"] = pid
+                    if stat not in box["batting"][team][player]:
+                        box["batting"][team][player][stat] = 0
                     if stat == "IP":
-                        boxscores[game_id]["batting"][team][player][stat] = format_ip_for_display(val)
+                        box["batting"][team][player][stat] = format_outs(row["IP outs"])
                     else:
-                        boxscores[game_id]["batting"][team][player][stat] += safe_int(val)
+                        box["batting"][team][player][stat] += safe_int(val)
 
                 # Pitching section (if POS == '1')
                 if pos == '1':
-                    if "Player" not in boxscores[game_id]["pitching"][team][player]:
-                        boxscores[game_id]["pitching"][team][player]["Player"] = player
-                        boxscores[game_id]["pitching"][team][player]["Player ID"] = pid
+                    if "Player" not in box["pitching"][team][player]:
+                        box["pitching"][team][player]["Player"] = player
+                        box["pitching"][team][player]["Player ID"] = pid
                     pit_num = row.get("Pit #")
                     if pd.notna(pit_num):
-                        boxscores[game_id]["pitching"][team][player]["Pit #"] = int(pit_num)
-                    if stat not in boxscores[game_id]["pitching"][team][player]:
-                        boxscores[game_id]["pitching"][team][player][stat] = 0
+                        box["pitching"][team][player]["Pit #"] = int(pit_num)
+                    if stat not in box["pitching"][team][player]:
+                        box["pitching"][team][player][stat] = 0
                     if stat == "IP":
-                        boxscores[game_id]["pitching"][team][player][stat] = format_ip_for_display(val)
+                        box["pitching"][team][player][stat] = format_outs(row["IP outs"])
                     else:
-                        boxscores[game_id]["pitching"][team][player][stat] += safe_int(val)
-
-
-    return boxscores
-
-if __name__ == "__main__":
-    input_file = "data/1999 Replay.xlsx"
-    output_dir = "data/stats"
-    os.makedirs(output_dir, exist_ok=True)
-
-    gamelog_df, schedule_df, linescore_df = load_data(input_file)
-    
-    batting_stats = group_stats(gamelog_df)
-    pitching_stats = group_pitching_stats(gamelog_df, schedule_df)
-    fielding_stats = group_fielding_stats(gamelog_df)
-    boxscores = generate_boxscores(gamelog_df, schedule_df)
-    os.makedirs("data/boxscores", exist_ok=True)
-    for game_id, game_data in boxscores.items():
-        for team, pitchers in game_data["pitching"].items():
-            entries = list(pitchers.items())
-            if all("Pit #" in p and p["Pit #"] != "" for _, p in entries):
-                # Sort by Pit #
-                sorted_entries = sorted(entries, key=lambda x: int(x[1]["Pit #"]))
-                boxscores[game_id]["pitching"][team] = {k: v for k, v in sorted_entries}
-    for gid, raw_data in boxscores.items():
-        cleaned = convert_sets_to_lists(raw_data)
-        with open(os.path.join("data/boxscores", f"{gid}.json"), "w") as f:
-            json.dump(cleaned, f, indent=2)
-
-
-
-    # Generate schedule.json
+                        box["pitching"][team][player][stat] += safe_int(val)
+    return box
+
+def generate_boxscores(gamelog_df, schedule_index):
+    return {gid: build_boxscore(rows, meta) for gid, meta, rows in boxscore_games(gamelog_df, schedule_index)}
+
+def finish_boxscore(box):
+    """The box score as it is written: pitchers in Pit # order, sets turned into lists."""
+    for team, pitchers in box["pitching"].items():
+        entries = list(pitchers.items())
+        if all("Pit #" in p and p["Pit #"] != "" for _, p in entries):
+            # Sort by Pit #
+            sorted_entries = sorted(entries, key=lambda x: int(x[1]["Pit #"]))
+            box["pitching"][team] = {k: v for k, v in sorted_entries}
+    return convert_sets_to_lists(box)
+
+BOXSCORE_LAYOUTS = ["files", "archive", "both"]
+SHARD_GAMES = 32
+
+# Box scores are written as a stream: games come out of boxscore_games() in
+# Game# order, each is built, written and dropped before the next, and the
+# archive gets its line as soon as the game is done. With workers, games go
+# out in shards of SHARD_GAMES and only a couple of shards per worker are in
+# flight at once, so memory holds a few shards rather than the season.
+
+def _boxscore_entries(boxscore_dir, games, layout):
+    """Build and write each game; yields (Game ID, archive line or None)."""
+    for game_id, meta, rows in games:
+        box = finish_boxscore(build_boxscore(rows, meta))
+        if layout != "archive":
+            write_json(box, os.path.join(boxscore_dir, f"{game_id}.json"))
+        yield game_id, encode_boxscore(box) if layout != "files" else None
+
+def _write_boxscore_shard(boxscore_dir, games, options, layout):
+    # workers may be spawned rather than forked, so the output options come
+    # along and each shard's size/time report goes back to the parent
+    set_output_options(**options)
+    entries = list(_boxscore_entries(boxscore_dir, games, layout))
+    return drain_output_report(), entries
+
+def _shards(games, size):
+    shard = []
+    for game in games:
+        shard.append(game)
+        if len(shard) == size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+def _pooled_entries(boxscore_dir, games, layout, workers, mp_context):
+    options = {"format": OUTPUT_OPTIONS["format"], "compress": OUTPUT_OPTIONS["compress"]}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        pending = deque()
+        for shard in _shards(games, SHARD_GAMES):
+            pending.append(pool.submit(_write_boxscore_shard, boxscore_dir, shard, options, layout))
+            while len(pending) > 2 * workers or (pending and pending[0].done()):
+                report, entries = pending.popleft().result()
+                OUTPUT_REPORT.extend(report)
+                yield from entries
+        while pending:
+            report, entries = pending.popleft().result()
+            OUTPUT_REPORT.extend(report)
+            yield from entries
+
+def write_boxscores(gamelog_df, schedule_index, boxscore_dir="data/boxscores", workers=1, mp_context=None,
+                    layout="files", append=False):
+    """Build and write every game's box score, spread over ``workers`` processes.
+
+    ``layout`` is "files" (one data/boxscores/<Game ID>.json per game), "archive"
+    (boxscore_archive.py) or "both". With ``append`` the games are added to an
+    existing archive instead of replacing it.
+    """
+    if layout != "archive":
+        os.makedirs(boxscore_dir, exist_ok=True)
+    games = boxscore_games(gamelog_df, schedule_index)
+    if workers <= 1:
+        entries = _boxscore_entries(boxscore_dir, games, layout)
+    else:
+        entries = _pooled_entries(boxscore_dir, games, layout, workers, mp_context)
+    archive = ArchiveWriter(boxscore_dir, append=append) if layout != "files" else None
+    written = 0
+    try:
+        for game_id, data in entries:
+            written += 1
+            if archive is not None:
+                archive.add(game_id, data)
+    finally:
+        if archive is not None:
+            archive.close()
+    return written
+
+def build_schedule(schedule_df):
     schedule_data = []
     for _, row in schedule_df.iterrows():
         game = {
@@ -511,276 +211,120 @@ if __name__ == "__main__":
             "completed": str(row.get("Played", "")).strip().lower() == "yes"
         }
         schedule_data.append(game)
-
-    save_json(schedule_data, os.path.join(output_dir, "schedule.json"))
-
-    # Generate standings.json
-    standings = {}
-    for game in schedule_data:
-        if not game["completed"]:
-            continue
-
-        home = game["home_team"]
-        away = game["away_team"]
-        home_score = game["home_score"]
-        away_score = game["away_score"]
-
-        if home_score is None or away_score is None:
-            continue
-
-        for team in [home, away]:
-            if team not in standings:
-                standings[team] = {"W": 0, "L": 0}
-
-        if home_score > away_score:
-            standings[home]["W"] += 1
-            standings[away]["L"] += 1
-        else:
-            standings[away]["W"] += 1
-            standings[home]["L"] += 1
-
-    with open("data/teams.json", "r") as tf:
-        teams = json.load(tf)
-
-    team_meta = {t["id"]: {"league": t["league"], "division": t["division"]} for t in teams}
-    all_team_ids = [t["id"] for t in teams]
-
-    complete = {}
-    for tid in all_team_ids:
-        record = standings.get(tid, {"W": 0, "L": 0})
-        wins = record["W"]
-        losses = record["L"]
-        total = wins + losses
-        pct = wins / total if total > 0 else 0
-        record["W-L%"] = "1.000" if pct == 1 else f".{int(round(pct * 1000)):03d}"
-        complete[tid] = record
-
-    from collections import defaultdict
-    grouped = defaultdict(lambda: defaultdict(list))
-    for team_id, record in complete.items():
-        meta = team_meta.get(team_id)
-        if meta:
-            league = meta["league"]
-            division = meta["division"]
-            grouped[league][division].append({"team": team_id, **record})
-
-    league_order = ["AL", "NL"]
-    division_order = ["East", "Central", "West"]
-    ordered = {}
-
-for league in league_order:
-    if league in grouped:
-        ordered[league] = {}
-        for division in division_order:
-            if division in grouped[league]:
-                teams = grouped[league][division]
-
-                # Sort by Win Percentage: W / (W + L)
-                sorted_teams = sorted(
-                    teams,
-                    key=lambda t: -(t["W"] / (t["W"] + t["L"]) if (t["W"] + t["L"]) > 0 else 0)
-                )
-
-                # Determine GB relative to leader
-                leader = sorted_teams[0]
-                leader_W, leader_L = leader["W"], leader["L"]
-
-                for team in sorted_teams:
-                    w, l = team["W"], team["L"]
-                    if (w == leader_W and l == leader_L):
-                        team["GB"] = "--"
-                    else:
-                        gb = ((leader_W - w) + (l - leader_L)) / 2
-                        team["GB"] = round(gb, 1)
-
-                ordered[league][division] = sorted_teams
-    save_json(ordered, os.path.join(output_dir, "standings.json"))
-
-# --- START linescores.json GENERATION BLOCK ---
-completed_game_ids = {
-    str(row["Game ID"]).strip()
-    for _, row in schedule_df.iterrows()
-    if str(row.get("Played", "")).strip().lower() == "yes"
-}
-
-linescore_data = {}
-inning_cols = [col for col in linescore_df.columns if isinstance(col, int)]
-inning_cols = sorted(inning_cols)
-
-for _, row in linescore_df.iterrows():
-    game_id = str(row["Game ID"]).strip()
-    team = str(row["Team"]).strip()
-
-    if game_id not in completed_game_ids:
-        continue
-
-    innings = []
-    for col in inning_cols:
-        val = row.get(col)
-        if pd.isna(val):
-            innings.append("")
-        else:
-            innings.append(str(int(val)) if isinstance(val, float) and val.is_integer() else str(val).strip())
-
-    if not any(v.strip() for v in innings):
-        continue
-
-    if game_id not in linescore_data:
-        linescore_data[game_id] = {}
-
-    linescore_data[game_id][team] = innings
-
-save_json(linescore_data, os.path.join(output_dir, "linescores.json"))
-# --- END linescores.json GENERATION BLOCK ---
-
-def compute_fielding_by_position(gamelog_df):
-    fielding = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
-    games = defaultdict(lambda: defaultdict(set))
-
-    for _, row in gamelog_df.iterrows():
-        pid = row.get("Player ID")
-        if pd.isna(pid) or pid == "":
-            continue
-
-        pos = row.get("POS", "")
-        if pos not in range(1, 10):
-            continue
-
-        team = row["Team"]
-        player = row["Player Name"]
-        game_id = row["Game#"]
-        key = (pid, team, pos)
-
-        games[(pid, team)][pos].add(game_id)
-        f = fielding[(pid, team)][pos]
-
-        f["Player"] = player
-        f["GS"] += safe_int(row.get("GS"))
-        f["CG"] += safe_int(row.get("CG"))
-        f["INN"] += safe_float(row.get("INN"))
-        f["PO"] += safe_int(row.get("PO"))
-        f["A"] += safe_int(row.get("A"))
-        f["E"] += safe_int(row.get("ERR"))
-        f["DP"] += safe_int(row.get("DP"))
-        f["PB"] += safe_int(row.get("PB"))
-        f["WP"] += safe_int(row.get("WP"))
-        f["SB"] += safe_int(row.get("SB against"))
-        f["CS"] += safe_int(row.get("CS against"))
-        f["PkO"] += safe_int(row.get("Pko"))
-
-    results = []
-    for (pid, team), pos_dict in fielding.items():
-        for pos, stats in pos_dict.items():
-            po = stats["PO"]
-            a = stats["A"]
-            e = stats["E"]
-            ch = po + a + e
-            fld_pct = (po + a) / ch if ch else None
-            sb = stats["SB"]
-            cs = stats["CS"]
-            cs_pct = (cs / (sb + cs)) if (sb + cs) else None
-            entry = {
-                "Player": stats["Player"],
-                "team": team,
-                "POS": str(pos),
-                "G": len(games[(pid, team)][pos]),
-                "GS": int(stats["GS"]),
-                "CG": int(stats["CG"]),
-                "Inn": format_ip_for_display(stats["INN"]),
-                "Ch": int(ch),
-                "PO": int(po),
-                "A": int(a),
-                "E": int(e),
-                "DP": int(stats["DP"]),
-                "Fld%": "1.000" if fld_pct == 1 else f"{fld_pct:.3f}".lstrip("0") if fld_pct is not None else "",
-                "PB": int(stats["PB"]) if stats["PB"] else "",
-                "WP": int(stats["WP"]) if stats["WP"] else "",
-                "SB": int(sb) if sb else "",
-                "CS": int(cs) if cs else "",
-                "CS%": f"{round(cs_pct * 100)}%" if cs_pct is not None else "",
-                "PkO": int(stats["PkO"]) if stats["PkO"] else "",
-                "Player ID": pid
-            }
-            results.append(entry)
-    return results
+    return schedule_data
+
+# linescores.json, per completed game:
+#
+#   {"innings": 9, "COL": [2, 7, 0,  0, 1, 0, 1, 0, 0, 0, 0, 0],
+#                  "SDP": [5, 9, 1,  0, 0, 1, 0, 0, 3, 1, 0]}
+#
+# Each team is one int array: R, H, E, then the runs per inning. The
+# innings stop after the team's last inning at bat (a home team that didn't
+# bat in the 9th has 8), with null for any gap before that. R is the sum of
+# the innings; H and E come from the GameLog (hits by the batters, errors
+# by the fielders). Flat arrays keep the file about half the size of the
+# old per-inning strings and quicker to parse than a nested object per team.
+
+def game_hits_errors(gamelog_df, schedule_index):
+    """{(Game ID, team): (H, E)} summed from the GameLog."""
+    rows = gamelog_df[gamelog_df["Game#"].notna()]
+    batting = (pd.to_numeric(rows["BOP"], errors="coerce") > 0).to_numpy()
+    fielding = pd.to_numeric(rows["POS"], errors="coerce").between(1, 9).to_numpy()
+    frame = pd.DataFrame({
+        "game": rows["Game#"].astype(int).map(schedule_index["game_ids"]),
+        "team": rows["Team"],
+        "H": np.where(batting, pd.to_numeric(rows["H"], errors="coerce").fillna(0), 0),
+        "E": np.where(fielding, pd.to_numeric(rows["ERR"], errors="coerce").fillna(0), 0),
+    })
+    totals = frame.groupby(["game", "team"])[["H", "E"]].sum()
+    return {key: (int(h), int(e)) for key, h, e in zip(totals.index, totals["H"], totals["E"])}
+
+def build_linescores(linescore_df, schedule_index, gamelog_df=None):
+    game_ids = linescore_df["Game ID"].astype(str).str.strip()
+    rows = linescore_df[game_ids.isin(schedule_index["completed"])]
+    inning_cols = sorted(col for col in rows.columns if isinstance(col, int))
+    runs = rows[inning_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    played = ~np.isnan(runs)
+    length = np.where(played, np.arange(1, len(inning_cols) + 1), 0).max(axis=1, initial=0)
+
+    keep = length > 0
+    games = game_ids[rows.index].to_numpy()[keep]
+    teams = rows["Team"].astype(str).str.strip().to_numpy()[keep]
+    runs, played, length = runs[keep], played[keep], length[keep]
+    totals = np.where(played, runs, 0).sum(axis=1).astype(np.int64)
+    innings = pd.Series(length).groupby(games).transform("max").to_numpy()
+    hits_errors = game_hits_errors(gamelog_df, schedule_index) if gamelog_df is not None else {}
+
+    linescore_data = {}
+    for i, (game_id, team) in enumerate(zip(games.tolist(), teams.tolist())):
+        line = [int(v) if ok else None for v, ok in zip(runs[i, :length[i]].tolist(), played[i, :length[i]])]
+        hits, errors = hits_errors.get((game_id, team), (0, 0))
+        game = linescore_data.setdefault(game_id, {"innings": int(innings[i])})
+        game[team] = [int(totals[i]), hits, errors] + line
+    return linescore_data
+
+LOG_DICTIONARY = ["Player", "Player ID", "Team", "Game ID", "POS"]
+BATTING_LOG_STATS = [
+    "GS", "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "IBB", "SO", "SB", "CS", "GDP", "HBP", "SH", "SF"
+]
+PITCHING_LOG_STATS = [
+    "GS", "W", "L", "SV", "H allowed", "R against", "ER", "HR allowed",
+    "BB against", "IBB against", "SO against", "HBP against", "BK", "WP"
+]
+FIELDING_LOG_STATS = ["GS", "INN", "PO", "A", "ERR", "DP", "PB", "SB against", "CS against", "Pko"]
+
+def _log_innings(values):
+    # true innings (5.333...) as the site reads them, rebuilt from exact outs
+    out = np.full(len(values), None, dtype=object)
+    present = values.notna().to_numpy()
+    out[present] = (innings_to_outs(values).to_numpy()[present] / 3).tolist()
+    return out
+
+def _log_ints(values):
+    values = pd.to_numeric(values)
+    out = np.full(len(values), None, dtype=object)
+    present = values.notna().to_numpy()
+    out[present] = np.trunc(values.to_numpy(dtype=float)[present]).astype(np.int64).tolist()
+    return out
+
+def build_game_logs(gamelog_df, schedule_index):
+    """Columnar batting, pitching and fielding logs (see columnar_log.py), one row per GameLog line."""
+    rows = gamelog_df[gamelog_df["Game#"].notna()]
+    game_num = rows["Game#"].astype(int)
+    game_ids = {n: game_id_for(schedule_index, n) for n in game_num.unique()}
+    pos = rows["POS"].map(lambda p: "" if pd.isna(p) else str(p))
+    digits = pos.str.isdigit()
+
+    def log(mask, leading, stats, innings=()):
+        # same keys, in the same order, as the old per-row dicts
+        part = rows[mask]
+        columns = {
+            "Player": part["Player Name"],
+            "Player ID": part["Player ID"],
+            "Team": part["Team"],
+            "Game#": game_num[mask],
+            "Game ID": game_num[mask].map(game_ids),
+            **leading,
+        }
+        for stat in stats:
+            if stat in part:
+                columns[stat] = _log_innings(part[stat]) if stat in innings else _log_ints(part[stat])
+        sparse = [stat for stat in stats if stat in part]
+        return columnar_log.encode(columns, dictionary=LOG_DICTIONARY, sparse=sparse)
+
+    batting = rows["BOP"].notna() & (rows["BOP"] > 0)
+    pitching = pos == "1"
+    fielding = digits & pos.where(digits, "0").astype(int).between(1, 9)
+
+    batting_log = log(batting, {"POS": rows.loc[batting, "POS"]}, BATTING_LOG_STATS)
+    pitching_log = log(pitching, {"IP": _log_innings(rows.loc[pitching, "IP"])}, PITCHING_LOG_STATS)
+    fielding_log = log(fielding, {"POS": pos[fielding]}, FIELDING_LOG_STATS, innings=["INN"])
+    return batting_log, pitching_log, fielding_log
+
+def main():
+    # the build itself lives in build.py; this entry point is kept for existing callers
+    import build
+    build.main()
 
 if __name__ == "__main__":
-    gamelog_df, schedule_df, linescore_df = load_data("data/1999 Replay.xlsx")
-    fielding_by_pos = compute_fielding_by_position(gamelog_df)
-
-    with open("data/stats/fielding_by_position.json", "w") as f:
-        json.dump(clean_for_json(fielding_by_pos), f, indent=2)
-
-    print("fielding_by_position.json generated.")
-
-# --- START game logs generation ---
-
-batting_log = []
-pitching_log = []
-fielding_log = []
-
-for _, row in gamelog_df.iterrows():
-    pid = row.get("Player ID")
-    name = row.get("Player Name")
-    team = row.get("Team")
-    raw_game_num = row.get("Game#")
-    if pd.isna(raw_game_num):
-        continue  # skip this row
-    game_num = int(raw_game_num)
-    bop = row.get("BOP")
-    pos = str(row.get("POS")) if not pd.isna(row.get("POS")) else ""
-    game_id = schedule_df[schedule_df["Game#"] == game_num]["Game ID"].values[0] if game_num in schedule_df["Game#"].values else f"G{game_num}"
-
-    meta = {
-        "Player": name,
-        "Player ID": pid,
-        "Team": team,
-        "Game#": game_num,
-        "Game ID": game_id
-    }
-
-    # Batting log
-    if not pd.isna(bop) and bop > 0:
-        entry = meta.copy()
-        entry["POS"] = row.get("POS") 
-        for stat in [
-            "GS", "AB", "R", "H", "2B", "3B", "HR", "RBI", "BB", "IBB", "SO", "SB", "CS", "GDP",
-            "HBP", "SH", "SF"
-        ]:
-            val = row.get(stat)
-            if not pd.isna(val):
-                entry[stat] = int(val)
-        batting_log.append(entry)
-
-    # Pitching log
-    if pos == "1":
-        entry = meta.copy()
-        entry["IP"] = row.get("IP")
-        for stat in [
-            "GS", "W", "L", "SV", "H allowed", "R against", "ER", "HR allowed",
-            "BB against", "IBB against", "SO against", "HBP against", "BK", "WP"
-        ]:
-            if not pd.isna(row.get(stat)):
-                entry[stat] = int(row.get(stat))
-        pitching_log.append(entry)
-
-    # Fielding log
-    if pos.isdigit() and int(pos) in range(1, 10):
-        entry = meta.copy()
-        entry["POS"] = pos
-        for stat in ["GS", "INN", "PO", "A", "ERR", "DP", "PB", "SB against", "CS against", "Pko"]:
-            if not pd.isna(row.get(stat)):
-                entry[stat] = row.get(stat) if "INN" in stat else int(row.get(stat))
-        fielding_log.append(entry)
-
-save_json(batting_log, os.path.join(output_dir, "batting_log.json"))
-save_json(pitching_log, os.path.join(output_dir, "pitching_log.json"))
-save_json(fielding_log, os.path.join(output_dir, "fielding_log.json"))
-
-print("batting_log.json, pitching_log.json, fielding_log.json generated.")
-# --- END game logs generation ---
-
-save_json(batting_stats, os.path.join(output_dir, "batting.json"))
-save_json(pitching_stats, os.path.join(output_dir, "pitching.json"))
-save_json(fielding_stats, os.path.join(output_dir, "fielding.json"))
-
+    main()
@@ -0,0 +1,250 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds there don't share a cache between processes
+    fcntl = None
+
+# Parsing .xlsx/.xlsm through openpyxl is the slowest step of every build, so
+# each sheet is parsed once and kept as one .npy file per column under
+# data/.cache/. Numeric and date columns are memory-mapped back in; text
+# columns are stored as fixed-width unicode plus a null mask. The cache is
+# keyed on the workbook's mtime/size and SHA-256 and is thrown away as soon
+# as the workbook's contents change.
+#
+# Each workbook gets its own folder, named after the file and a hash of its
+# absolute path, so two seasons' "Replay.xlsx" in different folders don't
+# share (and keep invalidating) one cache. Processes that do open the same
+# workbook at once take turns on its folder through a lock file beside it.
+
+CACHE_DIR = "data/.cache"
+CACHE_VERSION = 1
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _sheet_key(sheet_name, parse_kwargs):
+    if not parse_kwargs:
+        return sheet_name
+    return sheet_name + "|" + json.dumps(parse_kwargs, sort_keys=True, default=str)
+
+def _write_column(values, path):
+    series = pd.Series(values)
+    dtype = str(series.dtype)
+    if series.dtype.kind in "biufcmM":
+        np.save(path, series.to_numpy())
+        return {"kind": "array", "dtype": dtype}
+    objects = series.to_numpy(dtype=object)
+    nulls = pd.isna(series).to_numpy()
+    if all(isinstance(v, str) for v in objects[~nulls]):
+        np.save(path, np.where(nulls, "", objects).astype(str))
+        np.save(path + ".nulls", nulls)
+        return {"kind": "text", "dtype": dtype}
+    # mixed cells (e.g. POS holding 1-9 and "DH"/"PH") keep their Python types
+    np.save(path, objects, allow_pickle=True)
+    return {"kind": "object", "dtype": dtype}
+
+def _read_column(path, spec):
+    if spec["kind"] == "array":
+        return np.load(path + ".npy", mmap_mode="c")
+    if spec["kind"] == "text":
+        text = np.load(path + ".npy", mmap_mode="r").astype(object)
+        text[np.load(path + ".nulls.npy")] = np.nan
+        return pd.array(text, dtype=spec["dtype"])
+    return np.load(path + ".npy", allow_pickle=True)
+
+
+class CachedWorkbook:
+    """Drop-in for ``pd.ExcelFile`` that serves sheets from the column cache.
+
+    The workbook itself is only opened when a sheet (or the sheet list) is
+    missing from the cache.
+    """
+
+    def __init__(self, path, cache_dir=CACHE_DIR, use_cache=True):
+        self.path = path
+        self.use_cache = use_cache
+        self._excel = None
+        stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+        where = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:12]
+        self.cache_dir = os.path.join(cache_dir, f"{stem}-{where}")
+        self.manifest = None
+        if use_cache:
+            with self._locked():
+                self.manifest = self._load_manifest()
+
+    @contextmanager
+    def _locked(self):
+        # beside the folder rather than in it, so clearing the folder keeps the lock
+        os.makedirs(os.path.dirname(self.cache_dir) or ".", exist_ok=True)
+        with open(self.cache_dir + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _excel_file(self):
+        if self._excel is None:
+            self._excel = pd.ExcelFile(self.path)
+        return self._excel
+
+    def _manifest_path(self):
+        return os.path.join(self.cache_dir, "manifest.json")
+
+    def _read_manifest(self):
+        if not os.path.exists(self._manifest_path()):
+            return None
+        with open(self._manifest_path()) as f:
+            return json.load(f)
+
+    def _load_manifest(self):
+        stat = os.stat(self.path)
+        manifest = self._read_manifest()
+        if manifest and manifest["version"] == CACHE_VERSION:
+            if manifest["mtime"] == stat.st_mtime and manifest["size"] == stat.st_size:
+                return manifest
+            # touched but maybe not edited: only the hash decides
+            sha = file_digest(self.path)
+            if manifest["sha256"] == sha:
+                manifest.update(mtime=stat.st_mtime, size=stat.st_size)
+                self._save_manifest(manifest)
+                return manifest
+        else:
+            sha = file_digest(self.path)
+
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        manifest = {
+            "version": CACHE_VERSION, "mtime": stat.st_mtime, "size": stat.st_size,
+            "sha256": sha, "sheet_names": None, "sheets": {}
+        }
+        self._save_manifest(manifest)
+        return manifest
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, self._manifest_path())
+
+    @property
+    def sheet_names(self):
+        if not self.use_cache:
+            return self._excel_file().sheet_names
+        if self.manifest["sheet_names"] is None:
+            names = self._excel_file().sheet_names
+            with self._locked():
+                self._refresh_manifest()
+                self.manifest["sheet_names"] = names
+                self._save_manifest(self.manifest)
+        return self.manifest["sheet_names"]
+
+    def parse(self, sheet_name, **parse_kwargs):
+        if not self.use_cache:
+            return self._excel_file().parse(sheet_name, **parse_kwargs)
+
+        key = _sheet_key(sheet_name, parse_kwargs)
+        entry = self.manifest["sheets"].get(key)
+        if entry is None:
+            df = self._excel_file().parse(sheet_name, **parse_kwargs)
+            entry = self._store(key, df)
+        return self._restore(entry)
+
+    def parse_sheets(self, sheet_names, workers=1, mp_context=None):
+        """{name: DataFrame} for several sheets, parsing the ones not cached yet ``workers`` at a time.
+
+        Sheets that fail to parse are left out; ``parse`` raises their error.
+        """
+        missing = [name for name in sheet_names
+                   if not self.use_cache or _sheet_key(name, {}) not in self.manifest["sheets"]]
+        parsed = {}
+        if workers > 1 and len(missing) > 1:
+            shards = [missing[i::workers] for i in range(min(workers, len(missing)))]
+            with ProcessPoolExecutor(max_workers=len(shards), mp_context=mp_context) as pool:
+                for frames in pool.map(_parse_sheets, [self.path] * len(shards), shards):
+                    parsed.update(frames)
+            if self.use_cache:
+                # cached from this process only, so the manifest has one writer
+                for name, df in parsed.items():
+                    self._store(_sheet_key(name, {}), df)
+                parsed = {}
+
+        frames = {}
+        for name in sheet_names:
+            try:
+                frames[name] = parsed[name] if name in parsed else self.parse(name)
+            except Exception:
+                pass
+        return frames
+
+    def _refresh_manifest(self):
+        # another process may have cached sheets of the same workbook since we loaded the manifest
+        current = self._read_manifest()
+        if current and current["sha256"] == self.manifest["sha256"]:
+            self.manifest = current
+
+    def _store(self, key, df):
+        with self._locked():
+            self._refresh_manifest()
+            if key in self.manifest["sheets"]:
+                return self.manifest["sheets"][key]
+            return self._store_locked(key, df)
+
+    def _store_locked(self, key, df):
+        folder = f"sheet{len(self.manifest['sheets'])}"
+        tmp = tempfile.mkdtemp(dir=self.cache_dir)
+        columns = []
+        for i, name in enumerate(df.columns):
+            spec = _write_column(df.iloc[:, i], os.path.join(tmp, str(i)))
+            if isinstance(name, np.generic):
+                name = name.item()
+            spec["name"] = name if isinstance(name, (int, float)) else str(name)
+            columns.append(spec)
+        target = os.path.join(self.cache_dir, folder)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+
+        entry = {"folder": folder, "rows": len(df), "columns": columns}
+        self.manifest["sheets"][key] = entry
+        self._save_manifest(self.manifest)
+        return entry
+
+    def _restore(self, entry):
+        folder = os.path.join(self.cache_dir, entry["folder"])
+        data = {
+            i: _read_column(os.path.join(folder, str(i)), spec)
+            for i, spec in enumerate(entry["columns"])
+        }
+        df = pd.DataFrame(data, index=pd.RangeIndex(entry["rows"]), copy=False)
+        df.columns = [spec["name"] for spec in entry["columns"]]
+        return df
+
+
+def _parse_sheets(path, sheet_names):
+    excel = pd.ExcelFile(path)
+    frames = {}
+    for name in sheet_names:
+        try:
+            frames[name] = excel.parse(name)
+        except Exception:
+            pass
+    return frames
+
+def open_workbook(path, cache_dir=CACHE_DIR, use_cache=True):
+    return CachedWorkbook(path, cache_dir=cache_dir, use_cache=use_cache)
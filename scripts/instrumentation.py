@@ -0,0 +1,101 @@
+import os
+import sys
+import json
+import time
+import cProfile
+import pstats
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Per-stage wall time, memory and row counts for a build, written as a JSON
+# report next to the outputs so slow stages can be spotted and tracked from
+# run to run. The report changes on every run, so git ignores it; the
+# workflow keeps each run's copy as a build artifact. With a profile
+# directory, every stage also gets its own cProfile dump (<stage>.prof,
+# readable with pstats or snakeviz).
+
+REPORT_FILE = "build_timings.json"
+
+
+def _peak_rss_mb(who):
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return round(peak / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / (1 << 20), 1)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class BuildTimer:
+    def __init__(self, profile_dir=None):
+        self.profile_dir = profile_dir
+        self.stages = []
+        self.started = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    @contextmanager
+    def stage(self, name):
+        """Time the body as one stage; set ``record["rows"]`` inside it to log a row count."""
+        record = {"stage": name, "rows": None}
+        peak_before = _peak_rss_mb(resource.RUSAGE_SELF) if resource else None
+        profiler = cProfile.Profile() if self.profile_dir else None
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler:
+                profiler.disable()
+            record["seconds"] = round(time.perf_counter() - start, 4)
+            record["rss_mb"] = _rss_mb()
+            if resource:
+                record["peak_rss_mb"] = _peak_rss_mb(resource.RUSAGE_SELF)
+                record["peak_rss_growth_mb"] = round(record["peak_rss_mb"] - peak_before, 1)
+                record["children_peak_rss_mb"] = _peak_rss_mb(resource.RUSAGE_CHILDREN)
+            if profiler:
+                path = os.path.join(self.profile_dir, f"{name}.prof")
+                profiler.dump_stats(path)
+                record["profile"] = path
+            self.stages.append(record)
+
+    def report(self, **context):
+        return {
+            "started": self.started.isoformat(timespec="seconds"),
+            "total_seconds": round(time.perf_counter() - self._start, 4),
+            "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+            **context,
+            "stages": self.stages,
+        }
+
+    def write_report(self, output_dir, **context):
+        path = os.path.join(output_dir, REPORT_FILE)
+        with open(path, "w") as f:
+            json.dump(self.report(**context), f, indent=2)
+        return path
+
+    def print_summary(self, top=8):
+        print(f"{'stage':24} {'seconds':>9} {'rows':>9} {'peak MB':>9}")
+        for record in self.stages:
+            rows = "" if record["rows"] is None else record["rows"]
+            peak = record.get("peak_rss_mb")
+            print(f"{record['stage']:24} {record['seconds']:>9.3f} {rows:>9} {'' if peak is None else peak:>9}")
+        print(f"{'total':24} {time.perf_counter() - self._start:>9.3f}")
+        if self.profile_dir:
+            slowest = max(self.stages, key=lambda r: r["seconds"])
+            print(f"\nTop {top} functions in the slowest stage ({slowest['stage']}), by cumulative time:")
+            pstats.Stats(slowest["profile"]).sort_stats("cumulative").print_stats(top)
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+from stat_format import FORMATS, format_value
+from stat_utils import exact_rate
+
+# Top-N leaderboards for every counting and rate stat, overall ("MLB") and
+# per league, so the site reads a few KB instead of shipping and sorting
+# the league-wide files. Rate stats only rank qualified players:
+#
+#   batting   3.1 plate appearances per team game
+#   pitching  1 inning pitched per team game
+#   fielding  games in 67% of team games
+#
+# (the same rules as components/getQualificationThresholds). Leaders are
+# ranked on the exact value, recomputed from the typed season records, with
+# ties broken by Player ID; each entry carries the value as it is displayed
+# in batting/pitching/fielding.json. A rate the records don't carry (WHIP)
+# is rounded from the same counts with stat_utils.exact_rate.
+
+TOP = 10
+SCOPES = ["MLB", "AL", "NL"]
+PA_PER_GAME = 3.1
+IP_PER_GAME = 1.0
+FIELDING_GAME_SHARE = 0.67
+
+BATTING_COUNTS = ["G", "PA", "AB", "R", "H", "2B", "3B", "HR", "RBI", "SB", "CS", "BB", "SO", "TB",
+                  "HBP", "SH", "SF", "IBB", "GDP"]
+PITCHING_COUNTS = ["W", "L", "G", "GS", "CG", "SHO", "SV", "IP", "H", "R", "ER", "HR", "BB", "IBB", "SO",
+                   "HBP", "BK", "WP"]
+FIELDING_COUNTS = ["G", "GS", "CG", "Ch", "PO", "A", "E", "DP"]
+
+
+def team_thresholds(team_games):
+    """{team: minimums to qualify} from {team: games played}."""
+    return {
+        team: {
+            "G": int(games),
+            "PA": round(PA_PER_GAME * games, 1),
+            "IP": round(IP_PER_GAME * games, 1),
+            "fielding_G": int(np.ceil(FIELDING_GAME_SHARE * games)),
+        }
+        for team, games in team_games.items()
+    }
+
+def _number(frame, col):
+    if col not in frame:
+        return pd.Series(0.0, index=frame.index)
+    return pd.to_numeric(frame[col], errors="coerce").fillna(0).astype(float)
+
+def _ratio(num, den):
+    return (num / den.where(den > 0)).astype(float)
+
+def _rate(num, den):
+    """(ranking key, (num, den) to round the shown value from) for a rate stat."""
+    return _ratio(num, den), (num, den)
+
+def _board(frame, key, shown, spec, mask, ascending, top):
+    """Top ``top`` rows of ``frame[mask]`` by ``key``, best first."""
+    rows = np.flatnonzero(mask.to_numpy() & key.notna().to_numpy())
+    order = np.lexsort((frame["Player ID"].to_numpy()[rows].astype(str),
+                        key.to_numpy()[rows] if ascending else -key.to_numpy()[rows]))
+    picked = rows[order[:top]]
+    return [
+        {"Player ID": pid, "Player": name, "team": team, "value": format_value(value, spec) if spec else value}
+        for pid, name, team, value in zip(*(col.to_numpy()[picked].tolist()
+                                            for col in (frame["Player ID"], frame["Player"], frame["team"], shown)))
+    ]
+
+def _boards(frame, section, counts, rates, leagues, top):
+    """{scope: {stat: [entries]}} for ``counts`` (higher is better, > 0 only) and ``rates``."""
+    formats = FORMATS[section]
+    result = {}
+    for scope in SCOPES:
+        in_scope = pd.Series(True, index=frame.index) if scope == "MLB" else leagues == scope
+        boards = {}
+        for stat in counts:
+            key = _number(frame, stat)
+            boards[stat] = _board(frame, key, frame[stat], formats.get(stat), in_scope & (key > 0), False, top)
+        for stat, ((key, parts), qualified, ascending) in rates.items():
+            if stat in frame:
+                shown = frame[stat]
+            else:
+                places = formats[stat]["decimals"]
+                shown = pd.Series([exact_rate(n, d, places) for n, d in zip(*parts)], index=frame.index, dtype=object)
+            boards[stat] = _board(frame, key, shown, formats[stat], in_scope & qualified, ascending, top)
+        result[scope] = boards
+    return result
+
+def build_leaders(batting, pitching, fielding, teams, team_games, top=TOP):
+    thresholds = team_thresholds(team_games)
+    league_of = {t["id"]: t["league"] for t in teams}
+
+    def games(frame):
+        return frame["team"].map(team_games).fillna(0).astype(float)
+
+    bat = pd.DataFrame(batting)
+    h, ab, pa = _number(bat, "H"), _number(bat, "AB"), _number(bat, "PA")
+    obp = _rate(h + _number(bat, "BB") + _number(bat, "HBP"), pa)
+    slg = _rate(_number(bat, "TB"), ab)
+    qualified = (pa >= PA_PER_GAME * games(bat)) & (games(bat) > 0)
+    batting_rates = {
+        "AVG": (_rate(h, ab), qualified, False), "OBP": (obp, qualified, False),
+        "SLG": (slg, qualified, False), "OPS": ((obp[0] + slg[0], None), qualified, False),
+    }
+
+    pit = pd.DataFrame(pitching)
+    outs = _number(pit, "IP")
+    qualified = (outs >= 3 * IP_PER_GAME * games(pit)) & (games(pit) > 0)
+    pitching_rates = {
+        "ERA": (_rate(_number(pit, "ER") * 27, outs), qualified, True),
+        "WHIP": (_rate((_number(pit, "H") + _number(pit, "BB")) * 3, outs), qualified, True),
+        "SO9": (_rate(_number(pit, "SO") * 27, outs), qualified, False),
+    }
+
+    leaders = {
+        "top": top,
+        "thresholds": thresholds,
+        "batting": _boards(bat, "batting", [s for s in BATTING_COUNTS if s in bat], batting_rates,
+                           bat["team"].map(league_of), top),
+        "pitching": _boards(pit, "pitching", [s for s in PITCHING_COUNTS if s in pit], pitching_rates,
+                            pit["team"].map(league_of), top),
+    }
+    # the game-window leaders (window_stats.py) have no fielding lines
+    if fielding is not None:
+        fld = pd.DataFrame(fielding)
+        qualified = (_number(fld, "G") >= np.ceil(FIELDING_GAME_SHARE * games(fld))) & (games(fld) > 0)
+        fielding_rates = {"Fld%": (_rate(_number(fld, "PO") + _number(fld, "A"), _number(fld, "Ch")), qualified, False)}
+        leaders["fielding"] = _boards(fld, "fielding", [s for s in FIELDING_COUNTS if s in fld], fielding_rates,
+                                      fld["team"].map(league_of), top)
+    return leaders
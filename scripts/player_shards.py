@@ -0,0 +1,75 @@
+import os
+import json
+from collections import defaultdict
+from stat_utils import save_json
+
+# One data/stats/players/<Player ID>.json per player so a player page (or a
+# client fetch) loads a few KB instead of the league-wide files, plus a slim
+# players/index.json of id/name/teams for search and links.
+#
+# Both generators write into the same shards, each owning its own sections:
+# generate_stats.py the replay season lines (with traded players' TOT lines)
+# and game logs, and stat_json_generator.py the per-team sheet lines with
+# their TOT rows ("combined").
+# Sections a run doesn't mention are left as they were.
+
+PLAYERS_DIR = "players"
+INDEX_FILE = "index.json"
+
+
+def group_by_player(records):
+    grouped = defaultdict(list)
+    for rec in records:
+        pid = rec.get("Player ID") or rec.get("player ID") or rec.get("PlayerID")
+        if pid:
+            grouped[pid].append(rec)
+    return grouped
+
+def _lines(shard):
+    for value in shard.values():
+        if isinstance(value, dict):
+            yield from _lines(value)
+        elif isinstance(value, list):
+            yield from (rec for rec in value if isinstance(rec, dict))
+
+def _summary(shard):
+    name = shard.get("name")
+    teams = set()
+    for rec in _lines(shard):
+        name = name or rec.get("Player") or rec.get("Players")
+        team = rec.get("team") or rec.get("Team")
+        if team and team != "TOT":
+            teams.add(team)
+    return {"id": shard["id"], "name": name, "teams": sorted(teams)}
+
+def _load(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+def write_player_shards(output_dir, sections, names=None):
+    """Update ``sections`` ({section: {pid: value}}) in every player's shard and refresh the index."""
+    folder = os.path.join(output_dir, PLAYERS_DIR)
+    os.makedirs(folder, exist_ok=True)
+    index = {p["id"]: p for p in _load(os.path.join(folder, INDEX_FILE), [])}
+    names = names or {}
+
+    pids = set().union(*(by_player.keys() for by_player in sections.values()))
+    for pid in sorted(pids):
+        path = os.path.join(folder, f"{pid}.json")
+        # this run's sections are rewritten in a fixed order, so a shard
+        # updated run by run comes out the same as one written from scratch
+        shard = {k: v for k, v in _load(path, {"id": pid}).items() if k not in sections}
+        if pid in names:
+            shard["name"] = names[pid]
+        for section, by_player in sections.items():
+            if pid in by_player:
+                shard[section] = by_player[pid]
+        summary = _summary(shard)
+        shard = {**summary, **{k: v for k, v in shard.items() if k not in summary}}
+        save_json(shard, path)
+        index[pid] = summary
+
+    save_json([index[pid] for pid in sorted(index)], os.path.join(folder, INDEX_FILE))
+    return len(pids)
@@ -0,0 +1,38 @@
+import pandas as pd
+
+# One pass over the Schedule sheet gives every generator constant-time
+# lookups: Game# -> Game ID for GameLog rows, and Game ID -> the schedule
+# fields a box score header needs. When a Game# or Game ID repeats, the first
+# schedule row wins, matching the old boolean-mask lookups.
+
+
+def _safe_str(val):
+    return str(val) if not pd.isna(val) else ""
+
+def build_schedule_index(schedule_df):
+    game_ids = {}
+    meta = {}
+    completed = set()
+    columns = [schedule_df[c] if c in schedule_df else pd.Series(None, index=schedule_df.index, dtype=object)
+               for c in ("Game#", "Game ID", "Date", "Home", "Away", "Home Score", "Away Score", "Played")]
+
+    for num, gid, date, home, away, home_score, away_score, played in zip(*columns):
+        if pd.isna(gid):
+            continue
+        if not pd.isna(num):
+            game_ids.setdefault(int(num), str(gid))
+        if str(played).strip().lower() == "yes":
+            completed.add(str(gid).strip())
+        meta.setdefault(str(gid), {
+            "date": _safe_str(date),
+            "home": _safe_str(home),
+            "away": _safe_str(away),
+            "home_score": _safe_str(home_score),
+            "away_score": _safe_str(away_score)
+        })
+
+    return {"game_ids": game_ids, "meta": meta, "completed": completed}
+
+def game_id_for(index, game_num):
+    # gamelog rows whose Game# is missing from the schedule still get a stable id
+    return index["game_ids"].get(game_num, f"G{game_num}")
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+# Standings for every date of the season from one pass over the completed
+# games. Each game adds a win, a loss and its runs to a (date x team) table;
+# cumulative sums down the dates give every team's record as of the end of
+# each day, and one sort per division ranks the teams on every date at once.
+#
+# standings.json is the last row of that table. standings_by_date.json is
+# the whole table, so the site can show the standings on any date without
+# recomputing them:
+#
+#     {"version": 1, "dates": [...], "teams": [...],
+#      "W": [[...per team] ...per date], "L": ..., "GB": ..., "rank": ...}
+#
+# Division order is win percentage, then run differential, then wins, then
+# teams.json order.
+
+FORMAT_VERSION = 1
+COUNTS = ["W", "L", "RS", "RA", "homeW", "homeL", "awayW", "awayL", "oneRunW", "oneRunL"]
+LEAGUE_ORDER = ["AL", "NL"]
+DIVISION_ORDER = ["East", "Central", "West"]
+
+
+def completed_games(schedule_data):
+    """Completed games with both scores, as a date/home/away/home_score/away_score frame."""
+    return pd.DataFrame(
+        [(g["date"], g["home_team"], g["away_team"], g["home_score"], g["away_score"])
+         for g in schedule_data
+         if g["completed"] and g["home_score"] is not None and g["away_score"] is not None],
+        columns=["date", "home", "away", "home_score", "away_score"],
+    )
+
+def cumulative_records(games, team_ids):
+    """(dates, {count: array[date, team]}) with each team's totals through the end of every date.
+
+    With no games yet there is a single all-zero row dated "".
+    """
+    if games.empty:
+        return np.array([""]), {name: np.zeros((1, len(team_ids)), dtype=np.int64) for name in COUNTS}
+    dates, day = np.unique(games["date"].to_numpy(dtype=str), return_inverse=True)
+    codes = pd.Index(team_ids).append(pd.Index(games["home"]).append(pd.Index(games["away"]))).unique()
+    home = codes.get_indexer(games["home"])
+    away = codes.get_indexer(games["away"])
+    home_score = games["home_score"].to_numpy(dtype=np.int64)
+    away_score = games["away_score"].to_numpy(dtype=np.int64)
+
+    # a tie score goes to the road team, as it always has
+    home_won = home_score > away_score
+    winner = np.where(home_won, home, away)
+    loser = np.where(home_won, away, home)
+    one_run = np.abs(home_score - away_score) == 1
+
+    size = len(dates) * len(codes)
+    def tally(team, weights=None, where=None):
+        cells = day * len(codes) + team
+        if where is not None:
+            cells = cells[where]
+            weights = None if weights is None else weights[where]
+        per_day = np.bincount(cells, weights=weights, minlength=size).astype(np.int64)
+        return per_day.reshape(len(dates), len(codes)).cumsum(axis=0)[:, :len(team_ids)]
+
+    counts = {
+        "W": tally(winner), "L": tally(loser),
+        "RS": tally(home, home_score) + tally(away, away_score),
+        "RA": tally(home, away_score) + tally(away, home_score),
+        "homeW": tally(home, where=home_won), "homeL": tally(home, where=~home_won),
+        "awayW": tally(away, where=~home_won), "awayL": tally(away, where=home_won),
+        "oneRunW": tally(winner, where=one_run), "oneRunL": tally(loser, where=one_run),
+    }
+    return dates, counts
+
+def _pct(wins, losses):
+    games = wins + losses
+    return np.divide(wins, games, out=np.zeros(wins.shape), where=games > 0)
+
+def divisions(teams):
+    """[(league, division, [team positions in teams.json order])] in display order."""
+    blocks = []
+    for league in LEAGUE_ORDER:
+        for division in DIVISION_ORDER:
+            members = [i for i, t in enumerate(teams) if t["league"] == league and t["division"] == division]
+            if members:
+                blocks.append((league, division, members))
+    return blocks
+
+def division_ranks(counts, teams):
+    """Per date and team: place in its division (1 = leader) and games behind the leader."""
+    wins, losses = counts["W"], counts["L"]
+    pct = _pct(wins, losses)
+    run_diff = counts["RS"] - counts["RA"]
+    rank = np.zeros(wins.shape, dtype=np.int64)
+    games_behind = np.zeros(wins.shape)
+
+    for _, _, members in divisions(teams):
+        members = np.array(members)
+        tiebreak = np.broadcast_to(np.arange(len(members)), (len(wins), len(members)))
+        order = np.lexsort((tiebreak, -wins[:, members], -run_diff[:, members], -pct[:, members]), axis=-1)
+        place = np.empty_like(order)
+        np.put_along_axis(place, order, np.arange(1, len(members) + 1)[None, :], axis=-1)
+        rank[:, members] = place
+
+        leader = members[order[:, 0]]
+        leader_w = wins[np.arange(len(wins)), leader][:, None]
+        leader_l = losses[np.arange(len(wins)), leader][:, None]
+        games_behind[:, members] = ((leader_w - wins[:, members]) + (losses[:, members] - leader_l)) / 2
+    return rank, games_behind
+
+def build_standings(schedule_data, teams):
+    """Everything standings.json and standings_by_date.json are made from."""
+    team_ids = [t["id"] for t in teams]
+    dates, counts = cumulative_records(completed_games(schedule_data), team_ids)
+    rank, games_behind = division_ranks(counts, teams)
+    return {"dates": dates, "teams": team_ids, "counts": counts, "rank": rank, "GB": games_behind}
+
+def format_standings(table, teams, day=-1):
+    """{league: {division: [team records, best first]}} as of ``table["dates"][day]``."""
+    wins, losses = table["counts"]["W"][day], table["counts"]["L"][day]
+    rank, games_behind = table["rank"][day], table["GB"][day]
+    ordered = {}
+    for league, division, members in divisions(teams):
+        members = sorted(members, key=lambda i: rank[i])
+        leader = members[0]
+        rows = []
+        for i in members:
+            w, l = int(wins[i]), int(losses[i])
+            pct = w / (w + l) if w + l > 0 else 0
+            rows.append({
+                "team": teams[i]["id"], "W": w, "L": l,
+                "W-L%": "1.000" if pct == 1 else f".{int(round(pct * 1000)):03d}",
+                "GB": "--" if (w, l) == (wins[leader], losses[leader]) else round(float(games_behind[i]), 1),
+            })
+        ordered.setdefault(league, {})[division] = rows
+    return ordered
+
+def standings_by_date(table):
+    artifact = {"version": FORMAT_VERSION, "dates": table["dates"].tolist(), "teams": table["teams"]}
+    for name in COUNTS:
+        artifact[name] = table["counts"][name].tolist()
+    artifact["pct"] = np.round(_pct(table["counts"]["W"], table["counts"]["L"]), 3).tolist()
+    artifact["GB"] = table["GB"].tolist()
+    artifact["rank"] = table["rank"].tolist()
+    return artifact
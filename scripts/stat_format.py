@@ -0,0 +1,70 @@
+# Stat lines are built and passed around with typed values: counts as ints,
+# rates as floats already rounded to the precision they are shown at,
+# innings as integer outs, and None where a rate is undefined (no innings,
+# no chances). Nothing downstream has to parse a string back into a number.
+#
+# Turning a line into what the site shows is the last step, done from the
+# schema below when a file is written. The same schema goes out as
+# stat_formats.json so the site can format the typed files
+# (<section>.typed.json) identically (lib/statFormat.js). Fields without an
+# entry are written as they are.
+#
+#   rate     .312 / 1.250, no leading zero
+#   fixed    fixed decimals (ERA 3.45)
+#   outs     16 outs -> "5.1"
+#   percent  whole percent -> "33%"
+#   count    an int, with a sentinel for zero
+#
+# "missing" is what None is shown as.
+
+from stat_utils import format_outs
+
+RATE = {"kind": "rate", "decimals": 3}
+ONE_PLACE = {"kind": "fixed", "decimals": 1}
+COUNT_OR_BLANK = {"kind": "count", "zero": ""}
+
+FIELDING = {
+    "Inn": {"kind": "outs"},
+    "Fld%": {**RATE, "missing": ""},
+    "PB": COUNT_OR_BLANK, "WP": COUNT_OR_BLANK, "SB": COUNT_OR_BLANK, "CS": COUNT_OR_BLANK,
+    "CS%": {"kind": "percent", "missing": ""},
+    "PkO": COUNT_OR_BLANK,
+}
+
+FORMATS = {
+    "batting": {"AVG": RATE, "OBP": RATE, "SLG": RATE, "OPS": RATE},
+    "pitching": {
+        "W-L%": RATE,
+        "ERA": {"kind": "fixed", "decimals": 2, "missing": "---"},
+        "WHIP": {"kind": "fixed", "decimals": 2, "missing": "---"},
+        "IP": {"kind": "outs"},
+        "H9": ONE_PLACE, "HR9": ONE_PLACE, "BB9": ONE_PLACE, "SO9": ONE_PLACE, "SO/BB": ONE_PLACE,
+    },
+    "fielding": FIELDING,
+    "fielding_by_position": FIELDING,
+}
+
+
+def format_value(value, spec):
+    if value is None:
+        return spec.get("missing", "")
+    kind = spec["kind"]
+    if kind == "rate":
+        return f"{value:.{spec['decimals']}f}".lstrip("0")
+    if kind == "fixed":
+        return f"{value:.{spec['decimals']}f}"
+    if kind == "outs":
+        return format_outs(value)
+    if kind == "percent":
+        return f"{value}%"
+    if kind == "count":
+        return value if value else spec["zero"]
+    raise ValueError(f"unknown stat format {kind!r}")
+
+def format_record(record, formats):
+    return {k: format_value(v, formats[k]) if k in formats else v for k, v in record.items()}
+
+def format_records(records, section, formats=FORMATS):
+    """Display copies of typed ``records`` using ``formats[section]``."""
+    fields = formats[section]
+    return [format_record(record, fields) for record in records]
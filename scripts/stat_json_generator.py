@@ -1,30 +1,29 @@
 import pandas as pd
 import numpy as np
-import json
 import os
 from collections import defaultdict
-
-def format_stat(value, fmt):
+from stat_utils import write_json, write_json_rows, notation_to_outs
+from stat_format import FORMATS, format_value
+from aggregation import batting_rates, pitching_rates, fielding_rates, whip
+
+# Sheet lines are kept typed (rates as numbers, innings pitched as integer
+# outs) until the team files are written, so TOT rows add numbers rather
+# than re-parsing display strings. The sheets name a few columns
+# differently from the build's records, hence their own schema.
+SHEET_FORMATS = {
+    "batting": FORMATS["batting"],
+    "pitching": FORMATS["pitching"],
+    "fielding": {"Fld Pct": FORMATS["fielding"]["Fld%"], "CS%": FORMATS["fielding"]["CS%"]},
+}
+
+def _number(value):
     try:
-        num = float(value)
-        if fmt == ".3f":
-            return f"{num:.3f}".lstrip("0") if num != 1 else "1.000"
-        elif fmt == ".2f":
-            return f"{num:.2f}"
-        elif fmt == ".1f":
-            return f"{num:.1f}"
-        elif fmt == "percent0":
-            return f"{int(round(num * 100))}%"
-        elif fmt == "ip":
-            whole = int(num)
-            frac = round((num - whole) * 3)
-            return f"{whole}.{frac}"
-        else:
-            return value
-    except:
+        return float(value)
+    except (TypeError, ValueError):
         return value
 
-def clean_and_format(rows, rules, team, drop_fields=[], ip_field=None, min_games_field="G"):
+def clean_rows(rows, section, team, drop_fields=[], ip_field=None, min_games_field="G"):
+    numeric = SHEET_FORMATS[section]
     cleaned = []
     for row in rows:
         if min_games_field and str(row.get(min_games_field, "0")) in ("0", "", "0.0"):
@@ -34,60 +33,102 @@ def clean_and_format(rows, rules, team, drop_fields=[], ip_field=None, min_games
             if k.upper() in (df.upper() for df in drop_fields):
                 continue
             key = "AVG" if k.upper() == "BA" else k
-            fmt = rules.get(key)
-            new_row[key] = format_stat(v, fmt) if fmt else v
+            new_row[key] = _number(v) if key in numeric else v
         if ip_field and ip_field in row:
             try:
-                float_ip = float(row[ip_field])
-                thirds = round((float_ip - int(float_ip)) * 10)
-                if thirds == 1:
-                    float_ip = int(float_ip) + 1/3
-                elif thirds == 2:
-                    float_ip = int(float_ip) + 2/3
-                new_row[ip_field] = format_stat(float_ip, "ip")
-            except:
-                pass
+                new_row[ip_field] = notation_to_outs(row[ip_field])
+            except (TypeError, ValueError):
+                new_row[ip_field] = row[ip_field]
         cleaned.append(new_row)
     return cleaned
 
-def group_by_player_id(records):
-    grouped = defaultdict(list)
-    for rec in records:
-        pid = rec.get("Player ID") or rec.get("player ID") or rec.get("PlayerID")
-        if pid:
-            grouped[pid].append(rec)
-    return grouped
-
-def merge_totals(records):
-    if not records:
-        return []
-    keys = set().union(*(r.keys() for r in records))
-    total = {"team": "TOT"}
-    for k in keys:
-        if k in {"team", "POS"}:
-            continue
-        vals = [float(r[k]) for r in records if k in r and isinstance(r[k], (int, float, str)) and str(r[k]).replace('.', '', 1).isdigit()]
-        if vals:
-            total[k] = round(sum(vals), 3)
-    return records + [total]
-
-def generate_stats_from_excel(excel_path, output_folder):
-    xls = pd.ExcelFile(excel_path)
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _formatted(value, spec):
+    # cells the sheet left blank or as text are written as they were; None is
+    # only formatted for rates that can be undefined (ERA, Fld Pct, CS%)
+    return _is_number(value) or (value is None and "missing" in spec)
+
+def format_rows(rows, section):
+    fields = SHEET_FORMATS[section]
+    return [
+        {k: format_value(v, fields[k]) if k in fields and _formatted(v, fields[k]) else v for k, v in row.items()}
+        for row in rows
+    ]
+
+# TOT lines for players who appear for more than one team: one groupby over
+# every such player's rows sums the counting columns, and the rates are
+# worked out again from those sums by the rate functions the season records
+# use (aggregation.py). WHIP is the one rate only the sheets carry.
+
+def _line_rates(line, section):
+    def n(name):
+        return line.get(name, 0)
+
+    if section == "batting":
+        tb = n("TB") if "TB" in line else n("H") + n("2B") + 2 * n("3B") + 3 * n("HR")
+        return batting_rates(n("AB"), n("H"), tb, n("BB"), n("HBP"), n("SF"), n("SH"))
+    if section == "pitching":
+        outs = n("IP")
+        return {
+            **pitching_rates(n("W"), n("L"), outs, n("ER"), n("H"), n("HR"), n("BB"), n("SO")),
+            "WHIP": whip(n("H"), n("BB"), outs),
+        }
+    rates = fielding_rates(n("PO"), n("A"), n("E"), n("SB"), n("CS"))
+    return {"Fld Pct": rates["Fld%"], "CS%": rates["CS%"]}
+
+def merge_totals(players, section):
+    """{Player ID: TOT line} for every player in ``players`` with ``section`` rows on more than one team."""
+    traded = [pid for pid, p in players.items() if len(set(row.get("team") for row in p[section])) > 1]
+    if not traded:
+        return {}
+    frame = pd.DataFrame([row for pid in traded for row in players[pid][section]])
+    owner = np.repeat(traded, [len(players[pid][section]) for pid in traded])
+
+    rates = {k for k, spec in SHEET_FORMATS[section].items() if spec["kind"] != "outs"}
+    columns = [c for c in frame.columns if c not in ("team", "POS") and c not in rates]
+    # text cells (names, "---") become NaN, and sum(min_count=1) leaves a
+    # column out of a TOT line when the player has no number in it
+    numbers = frame[columns].apply(pd.to_numeric, errors="coerce")
+    sums = numbers.groupby(owner, sort=False).sum(min_count=1).round(3)
+    recomputed = [_line_rates(line, section) for line in sums.fillna(0).to_dict("records")]
+    for name in recomputed[0]:
+        if name in frame.columns:
+            sums[name] = pd.Series([line[name] for line in recomputed], index=sums.index, dtype=object)
+
+    lines = sums[[c for c in frame.columns if c in sums.columns]].to_dict("records")
+    return {
+        pid: {"team": "TOT", **{k: v for k, v in line.items() if v == v}}  # v != v only for NaN
+        for pid, line in zip(sums.index, lines)
+    }
+
+def read_team_sheets(xls, workers=1, mp_context=None):
+    """Cleaned lines from every "<TEAM> B/P/F" sheet: ({team_id: team_data}, all_players).
+
+    Sheets are parsed ``workers`` at a time; the lines are collected in team
+    order afterwards, so the output doesn't depend on ``workers``.
+    """
     sheet_names = xls.sheet_names
     team_ids = sorted(set(name.split()[0] for name in sheet_names if " " in name and name.split()[1] in ["B", "P", "F"]))
-    os.makedirs(output_folder, exist_ok=True)
+    frames = xls.parse_sheets([f"{team_id} {kind}" for team_id in team_ids for kind in "BPF"
+                               if f"{team_id} {kind}" in sheet_names], workers=workers, mp_context=mp_context)
+
+    def sheet(name):
+        # a sheet that is missing or failed to parse raises here, as before
+        return frames[name] if name in frames else xls.parse(name)
 
     all_players = defaultdict(lambda: {"batting": [], "pitching": [], "fielding": []})
+    teams = {}
 
     for team_id in team_ids:
         team_data = {}
 
         # Batting
         try:
-            df = xls.parse(f"{team_id} B").replace({np.nan: None, pd.NA: None}).dropna(how="all")
-            batting = clean_and_format(df.to_dict(orient="records"), {
-                "AVG": ".3f", "OBP": ".3f", "SLG": ".3f", "OPS": ".3f"
-            }, team_id, drop_fields=["P/S", "MAX"], min_games_field="G")
+            df = sheet(f"{team_id} B").replace({np.nan: None, pd.NA: None}).dropna(how="all")
+            batting = clean_rows(df.to_dict(orient="records"), "batting", team_id,
+                                 drop_fields=["P/S", "MAX"], min_games_field="G")
             team_data["batting"] = batting
             for row in batting:
                 pid = row.get("Player ID") or row.get("player ID") or row.get("PlayerID")
@@ -102,11 +143,9 @@ def generate_stats_from_excel(excel_path, output_folder):
 
         # Pitching
         try:
-            df = xls.parse(f"{team_id} P").replace({np.nan: None, pd.NA: None}).dropna(how="all")
-            pitching = clean_and_format(df.to_dict(orient="records"), {
-                "ERA": ".2f", "WHIP": ".2f", "H9": ".1f", "HR9": ".1f",
-                "BB9": ".1f", "SO9": ".1f", "SO/BB": ".1f", "W-L%": ".3f"
-            }, team_id, drop_fields=["P/S", "MAX"], ip_field="IP", min_games_field="G")
+            df = sheet(f"{team_id} P").replace({np.nan: None, pd.NA: None}).dropna(how="all")
+            pitching = clean_rows(df.to_dict(orient="records"), "pitching", team_id,
+                                  drop_fields=["P/S", "MAX"], ip_field="IP", min_games_field="G")
             team_data["pitching"] = pitching
             for row in pitching:
                 pid = row.get("Player ID") or row.get("player ID") or row.get("PlayerID")
@@ -121,7 +160,7 @@ def generate_stats_from_excel(excel_path, output_folder):
 
         # Fielding
         try:
-            df = xls.parse(f"{team_id} F").replace({np.nan: None, pd.NA: None}).dropna(how="all")
+            df = sheet(f"{team_id} F").replace({np.nan: None, pd.NA: None}).dropna(how="all")
             raw_rows = df.to_dict(orient="records")
             cleaned = []
             for row in raw_rows:
@@ -132,15 +171,8 @@ def generate_stats_from_excel(excel_path, output_folder):
                     if k in ["P/S", "MAX"]:
                         continue
                     new_row[k] = v
-                po = float(row.get("PO") or 0)
-                a = float(row.get("A") or 0)
-                e = float(row.get("E") or 0)
-                fld_pct = (po + a) / (po + a + e) if (po + a + e) > 0 else 0
-                new_row["Fld Pct"] = format_stat(fld_pct, ".3f")
-                cs = float(row.get("CS") or 0)
-                sb = float(row.get("SB") or 0)
-                cs_pct = int(round(100 * cs / (cs + sb))) if (cs + sb) > 0 else 0
-                new_row["CS%"] = f"{cs_pct}%"
+                rates = fielding_rates(*(float(row.get(k) or 0) for k in ("PO", "A", "E", "SB", "CS")))
+                new_row["Fld Pct"], new_row["CS%"] = rates["Fld%"], rates["CS%"]
                 cleaned.append(new_row)
             team_data["fielding"] = cleaned
             for row in cleaned:
@@ -154,46 +186,33 @@ def generate_stats_from_excel(excel_path, output_folder):
         except Exception as e:
             team_data["fielding"] = f"Error: {str(e)}"
 
-        with open(os.path.join(output_folder, f"{team_id}.json"), "w") as f:
-            json.dump(team_data, f, indent=2)
+        teams[team_id] = team_data
 
-    for pid, p in all_players.items():
-        for section in ["batting", "pitching", "fielding"]:
-            teams = set(row.get("team") for row in p[section])
-            if len(teams) > 1:
-                p[section] = merge_totals(p[section])
+    return teams, all_players
 
-    with open(os.path.join(output_folder, "players_combined.json"), "w") as f:
-        json.dump(list(all_players.values()), f, indent=2)
+def write_team_files(teams, all_players, output_folder):
+    """<TEAM>.json and players_combined.json; returns the per-player sections for the player files."""
+    for team_id, team_data in teams.items():
+        team_data = {section: format_rows(rows, section) if isinstance(rows, list) else rows
+                     for section, rows in team_data.items()}
+        write_json(team_data, os.path.join(output_folder, f"{team_id}.json"))
 
-    print("players_combined.json created.")
+    for section in ["batting", "pitching", "fielding"]:
+        totals = merge_totals(all_players, section)
+        for pid, p in all_players.items():
+            lines = p[section] + [totals[pid]] if pid in totals else p[section]
+            p[section] = format_rows(lines, section)
 
-    # Write league-wide batting, pitching, and fielding JSON files
-    league_batting = []
-    league_pitching = []
-    league_fielding = []
+    write_json_rows(all_players.values(), os.path.join(output_folder, "players_combined.json"))
 
-    for team_file in os.listdir(output_folder):
-        if not team_file.endswith(".json"):
-            continue
-        with open(os.path.join(output_folder, team_file)) as tf:
-            team_data = json.load(tf)
-            if not isinstance(team_data, dict):
-                continue
+    print("players_combined.json created.")
+
+    combined = {pid: {section: p[section] for section in ["batting", "pitching", "fielding"]} for pid, p in all_players.items()}
+    names = {pid: p["name"] for pid, p in all_players.items() if "name" in p}
+    return combined, names
 
-        if isinstance(team_data.get("batting"), list):
-            league_batting.extend(team_data["batting"])
-        if isinstance(team_data.get("pitching"), list):
-            league_pitching.extend(team_data["pitching"])
-        if isinstance(team_data.get("fielding"), list):
-            league_fielding.extend(team_data["fielding"])
-
-    with open(os.path.join(output_folder, "batting.json"), "w") as f:
-        json.dump(league_batting, f, indent=2)
-    with open(os.path.join(output_folder, "pitching.json"), "w") as f:
-        json.dump(league_pitching, f, indent=2)
-    with open(os.path.join(output_folder, "fielding.json"), "w") as f:
-        json.dump(league_fielding, f, indent=2)
-    print("batting.json, pitching.json, fielding.json created.")
 if __name__ == "__main__":
-    generate_stats_from_excel("data/SOM 1999 Full Season Replay.xlsm", "data/stats")
+    # build.py is the one entry point now; this only rebuilds the per-team sheet files through it
+    import sys
+    import build
+    build.main(["--stages", "team_sheets", "player_shards"] + sys.argv[1:])
@@ -0,0 +1,208 @@
+import pandas as pd
+import numpy as np
+import os
+import zlib
+import json
+import math
+import time
+from fractions import Fraction
+
+try:
+    import brotli
+except ImportError:  # optional: only needed for --compress br
+    brotli = None
+
+# How JSON artifacts are written. "compact" is what the site ships;
+# "pretty" (indent=2) is for reading diffs while debugging.
+OUTPUT_OPTIONS = {"format": "compact", "compress": ()}
+OUTPUT_REPORT = []
+
+def safe_int(val):
+    try:
+        return int(val)
+    except:
+        return 0
+
+# Innings (pitched, or played in the field) are carried as integer outs from
+# the moment they are read until they are formatted for output, so sums and
+# rates are exact however many games are added up.
+
+_FRACTION = r"^\s*(?:(?P<whole>\d+)\s+)?(?P<num>\d+)/(?P<den>\d+)\s*$"
+
+def innings_to_outs(values):
+    """Integer outs for a column of innings: numbers (5.333... = 5 1/3) or text like "5 1/3" and "2/3".
+
+    Blank or unreadable cells count as 0.
+    """
+    values = pd.Series(values)
+    numeric = pd.to_numeric(values, errors="coerce")
+    outs = np.rint(numeric.to_numpy(dtype=float) * 3)
+    text = numeric.isna().to_numpy() & values.notna().to_numpy()
+    if text.any():
+        parts = values[text].astype(str).str.extract(_FRACTION).apply(pd.to_numeric)
+        den = parts["den"].where(parts["den"] > 0)
+        outs[text] = (parts["whole"].fillna(0) * 3 + np.rint(parts["num"] * 3 / den)).to_numpy(dtype=float)
+    return pd.Series(np.nan_to_num(outs).astype(np.int64), index=values.index)
+
+def notation_to_outs(value):
+    """Integer outs for one innings value in box-score notation ("6.1" = 6 1/3); true thirds (6.333...) also work."""
+    num = float(value)
+    whole = int(num)
+    tenths = round((num - whole) * 10)
+    return whole * 3 + (tenths if tenths in (1, 2) else round((num - whole) * 3))
+
+# Rates are worked out from the integer counts as exact fractions and rounded
+# half up at the places they are shown at, so a tie (H9 6.25, ERA 3.375)
+# always rounds the same way instead of wherever a binary float lands.
+
+def exact_rate(num, den, places, default=None):
+    """``num / den`` rounded half up to ``places`` decimals (an int for 0 places); ``default`` when ``den`` is 0."""
+    if not den:
+        return default
+    units = math.floor(Fraction(int(num), int(den)) * 10 ** places + Fraction(1, 2))
+    return units if places == 0 else units / 10 ** places
+
+def format_outs(outs):
+    """Innings in box-score notation: 16 outs -> "5.1"."""
+    outs = int(outs)
+    return f"{outs // 3}.{outs % 3}"
+
+
+def convert_sets_to_lists(obj):
+    """Recursively convert sets in a nested dict or list to lists for JSON serialization."""
+    if isinstance(obj, dict):
+        return {k: convert_sets_to_lists(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_sets_to_lists(v) for v in obj]
+    elif isinstance(obj, set):
+        return list(obj)
+    else:
+        return obj
+
+def clean_for_json(obj):
+    if isinstance(obj, float) and (np.isnan(obj) or np.isinf(obj)):
+        return None
+    if isinstance(obj, dict):
+        return {k: clean_for_json(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [clean_for_json(v) for v in obj]
+    return obj
+
+def set_output_options(format="compact", compress=()):
+    if "br" in compress and brotli is None:
+        print("brotli is not installed; skipping .br output (pip install brotli).")
+        compress = tuple(c for c in compress if c != "br")
+    OUTPUT_OPTIONS.update(format=format, compress=tuple(compress))
+
+def add_output_arguments(parser):
+    parser.add_argument("--format", choices=["compact", "pretty"], default="compact",
+                        help="minified JSON (default) or indent=2 for debugging")
+    parser.add_argument("--compress", nargs="*", choices=["gz", "br"], default=[],
+                        help="also write pre-compressed .gz/.br siblings of every JSON file")
+    parser.add_argument("--report", action="store_true", help="print size and write time per artifact")
+
+def dump_json(obj):
+    if OUTPUT_OPTIONS["format"] == "pretty":
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+class _JsonSink:
+    """The file at ``path`` plus its .gz/.br siblings, fed the same bytes chunk by chunk."""
+
+    def __init__(self, path):
+        self.path = path
+        self.start = time.perf_counter()
+        self.sizes = {"json": 0}
+        self.files = {"json": open(path, "wb")}
+        self.packers = {}
+        if "gz" in OUTPUT_OPTIONS["compress"]:
+            # the same stream gzip.compress(data, 9, mtime=0) produces in one go
+            self.packers["gz"] = zlib.compressobj(9, zlib.DEFLATED, 31)
+        if "br" in OUTPUT_OPTIONS["compress"]:
+            self.packers["br"] = brotli.Compressor(quality=11)
+        for kind in self.packers:
+            self.files[kind] = open(f"{path}.{kind}", "wb")
+            self.sizes[kind] = 0
+
+    def _put(self, kind, data):
+        self.files[kind].write(data)
+        self.sizes[kind] += len(data)
+
+    def write(self, data):
+        self._put("json", data)
+        for kind, packer in self.packers.items():
+            self._put(kind, packer.compress(data) if kind == "gz" else packer.process(data))
+
+    def close(self):
+        for kind, packer in self.packers.items():
+            self._put(kind, packer.flush() if kind == "gz" else packer.finish())
+        for f in self.files.values():
+            f.close()
+        OUTPUT_REPORT.append((self.path, self.sizes, time.perf_counter() - self.start))
+
+def write_json(obj, path):
+    sink = _JsonSink(path)
+    sink.write(dump_json(obj).encode("utf-8"))
+    sink.close()
+
+def write_json_rows(rows, path, chunk_rows=1000):
+    """Write an iterable of rows as a JSON array, encoding ``chunk_rows`` rows at a time.
+
+    The bytes are the same as write_json(list(rows), path), but neither the
+    list nor the whole document has to be held in memory.
+    """
+    pretty = OUTPUT_OPTIONS["format"] == "pretty"
+    if pretty:
+        encode = json.JSONEncoder(indent=2).encode
+        open_, sep, close = "[\n  ", ",\n  ", "\n]"
+    else:
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        open_, sep, close = "[", ",", "]"
+
+    sink = _JsonSink(path)
+    chunk = []
+    started = False
+    for row in rows:
+        text = encode(row)
+        chunk.append(text.replace("\n", "\n  ") if pretty else text)
+        if len(chunk) == chunk_rows:
+            sink.write(((sep if started else open_) + sep.join(chunk)).encode("utf-8"))
+            chunk, started = [], True
+    if chunk:
+        sink.write(((sep if started else open_) + sep.join(chunk)).encode("utf-8"))
+        started = True
+    sink.write(close.encode("utf-8") if started else b"[]")
+    sink.close()
+
+def save_json(data, path):
+    write_json(clean_for_json(data), path)
+
+def save_json_rows(rows, path):
+    write_json_rows((clean_for_json(row) for row in rows), path)
+
+def drain_output_report():
+    report = list(OUTPUT_REPORT)
+    OUTPUT_REPORT.clear()
+    return report
+
+def print_output_report(report=None, collapse=10):
+    """Size/time table; directories with more than ``collapse`` files are summed into one line."""
+    report = OUTPUT_REPORT if report is None else report
+    per_dir = {}
+    for path, _, _ in report:
+        per_dir[os.path.dirname(path)] = per_dir.get(os.path.dirname(path), 0) + 1
+
+    lines = {}
+    for path, sizes, seconds in report:
+        folder = os.path.dirname(path)
+        key = os.path.join(folder, "*.json") if per_dir[folder] > collapse else path
+        line = lines.setdefault(key, {"files": 0, "seconds": 0.0, "json": 0, "gz": 0, "br": 0})
+        line["files"] += 1
+        line["seconds"] += seconds
+        for kind, size in sizes.items():
+            line[kind] += size
+
+    print(f"{'artifact':52} {'files':>6} {'json':>11} {'gz':>11} {'br':>11} {'time':>8}")
+    for key, line in lines.items():
+        sizes = [f"{line[k]:>11,}" if line[k] else f"{'-':>11}" for k in ("json", "gz", "br")]
+        print(f"{key:52} {line['files']:>6} {' '.join(sizes)} {line['seconds']:>7.2f}s")
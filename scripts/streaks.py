@@ -0,0 +1,79 @@
+import pandas as pd
+from standings import completed_games
+
+# Streaks and recent form, precomputed so pages read one small lookup
+# instead of scanning the schedule or the game logs on every render:
+#
+#   team_streaks.json     {team: {"G", "W", "L", "streak": "W3", "last10": "6-4"}}
+#   hitting_streaks.json  {Player ID: {"name", "current", "longest"}}
+#
+# Both come from one ordered pass: rows are sorted by (key, game order),
+# consecutive rows with the same key and outcome form a run, and the last
+# and longest runs per key are the streaks. A team's results follow
+# schedule order (as lib/teamStreakUtils.js did). A hitting streak counts
+# games with a hit; games without an official at-bat neither extend nor end
+# it.
+
+
+def _runs(keys, flags):
+    """Runs of equal ``flags`` within each key, in row order: key, flag and length per run."""
+    keys, flags = keys.reset_index(drop=True), flags.reset_index(drop=True)
+    run = ((keys != keys.shift()) | (flags != flags.shift())).cumsum()
+    return pd.DataFrame({"key": keys, "flag": flags, "run": run}).groupby("run", sort=True).agg(
+        key=("key", "first"), flag=("flag", "first"), length=("flag", "size")
+    )
+
+def team_results(schedule_data):
+    """One row per team per completed game, in schedule order within each team."""
+    games = completed_games(schedule_data)
+    home_won = games["home_score"] > games["away_score"]
+    results = pd.concat([
+        pd.DataFrame({"team": games["home"], "order": games.index, "won": home_won}),
+        pd.DataFrame({"team": games["away"], "order": games.index, "won": ~home_won}),
+    ])
+    return results.sort_values(["team", "order"], kind="stable").reset_index(drop=True)
+
+def team_streaks(schedule_data, teams):
+    results = team_results(schedule_data)
+    runs = _runs(results["team"], results["won"])
+    last_run = runs.groupby("key").tail(1).set_index("key")
+    last10 = results.groupby("team").tail(10).groupby("team")["won"].agg(["sum", "size"])
+    totals = results.groupby("team")["won"].agg(["sum", "size"])
+
+    streaks = {}
+    for team in (t["id"] for t in teams):
+        if team not in totals.index:
+            streaks[team] = {"G": 0, "W": 0, "L": 0, "streak": "", "last10": "0-0"}
+            continue
+        wins, games = int(totals.at[team, "sum"]), int(totals.at[team, "size"])
+        recent_wins, recent = int(last10.at[team, "sum"]), int(last10.at[team, "size"])
+        run = last_run.loc[team]
+        streaks[team] = {
+            "G": games, "W": wins, "L": games - wins,
+            "streak": f"{'W' if run['flag'] else 'L'}{int(run['length'])}",
+            "last10": f"{recent_wins}-{recent - recent_wins}",
+        }
+    return streaks
+
+def hitting_streaks(batting_log):
+    """Current and longest hitting streak for every player in the batting log (rows or a DataFrame)."""
+    log = pd.DataFrame(batting_log)
+    if log.empty:
+        return {}
+    for col in ("AB", "H"):
+        log[col] = pd.to_numeric(log[col], errors="coerce").fillna(0) if col in log else 0
+    games = log.groupby(["Player ID", "Game#"], sort=True).agg(AB=("AB", "sum"), H=("H", "sum"))
+    games = games[(games["AB"] > 0) | (games["H"] > 0)].reset_index()
+
+    runs = _runs(games["Player ID"], games["H"] > 0)
+    last_run = runs.groupby("key").tail(1).set_index("key")
+    longest = runs[runs["flag"]].groupby("key")["length"].max()
+    names = log.groupby("Player ID")["Player"].first()
+
+    streaks = {}
+    for pid in names.index:
+        current = 0
+        if pid in last_run.index and last_run.at[pid, "flag"]:
+            current = int(last_run.at[pid, "length"])
+        streaks[pid] = {"name": names[pid], "current": current, "longest": int(longest.get(pid, 0))}
+    return streaks
@@ -0,0 +1,217 @@
+"""Player stats over a window of games: the last N, a date range or a Game# range.
+
+    python scripts/window_stats.py --last 10 --min-pa 30
+    python scripts/window_stats.py --dates 1999-05-01 1999-05-31 --output data/stats/may.json
+    python scripts/window_stats.py --games 100 400 --player griffke02
+
+Reads the game logs and schedule.json that build.py writes. The build's
+own "windows" stage writes the standard windows (the last 7 and 15 days and
+each month) into data/stats/windows with their leaderboards.
+"""
+import os
+import sys
+import json
+import argparse
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+
+import columnar_log
+from leaders import build_leaders
+from stat_format import format_records
+from aggregation import batting_rates, pitching_rates, whip
+from stat_utils import add_output_arguments, set_output_options, save_json, innings_to_outs
+
+# Each log is reduced to one row per (player, game), sorted by player and
+# Game#, and every counting stat is replaced by its running total over that
+# order (with a leading 0). A player's games are one contiguous slice, so
+# the totals over any run of their games are sums[hi] - sums[lo]; finding
+# lo/hi for a window is a binary search, done for every player at once.
+# Date windows rely on Game# following the calendar, as it does in the
+# replay schedule.
+
+BATTING_SUMS = {"AB": "AB", "H": "H", "2B": "2B", "3B": "3B", "HR": "HR", "BB": "BB", "HBP": "HBP",
+                "SF": "SF", "SH": "SH", "R": "R", "RBI": "RBI", "SO": "SO", "SB": "SB", "CS": "CS"}
+PITCHING_SUMS = {"outs": "IP", "ER": "ER", "H": "H allowed", "HR": "HR allowed", "BB": "BB against",
+                 "SO": "SO against", "W": "W", "L": "L", "SV": "SV"}
+
+# The windows the build writes: the last LAST_DAYS days up to the latest
+# game played, and each calendar month with a game in it.
+LAST_DAYS = [7, 15]
+
+
+def _date_ordinals(dates):
+    return pd.to_datetime(pd.Series(dates), errors="coerce").map(
+        lambda d: d.toordinal() if not pd.isna(d) else 0
+    ).to_numpy(dtype=np.int64)
+
+def prefix_sums(log, sums, dates_by_game):
+    """Running totals of ``sums`` ({name: log column}) over each player's games, in Game# order."""
+    frame = log.dropna(subset=["Player ID", "Game#"]).copy()
+    for name, col in sums.items():
+        values = pd.to_numeric(frame[col], errors="coerce").fillna(0) if col in frame else pd.Series(0.0, index=frame.index)
+        frame[name] = innings_to_outs(frame[col]) if name == "outs" and col in frame else values
+    frame["Game#"] = frame["Game#"].astype(int)
+    games = frame.groupby(["Player ID", "Game#"], sort=True).agg(
+        Player=("Player", "first"), Team=("Team", "last"), **{name: (name, "sum") for name in sums}
+    ).reset_index()
+
+    players, starts = np.unique(games["Player ID"].to_numpy(dtype=str), return_index=True)
+    counts = np.zeros((len(games) + 1, len(sums) + 1), dtype=np.int64)
+    counts[1:, 0] = 1  # G
+    counts[1:, 1:] = games[list(sums)].to_numpy(dtype=np.int64)
+    return {
+        "columns": ["G"] + list(sums),
+        "players": players,
+        "start": starts,
+        "end": np.append(starts[1:], len(games)),
+        "code": np.repeat(np.arange(len(players)), np.diff(np.append(starts, len(games)))),
+        "game": games["Game#"].to_numpy(dtype=np.int64),
+        "date": _date_ordinals(games["Game#"].map(dates_by_game)),
+        "sums": counts.cumsum(axis=0),
+        "name": games["Player"].to_numpy(dtype=object),
+        "team": games["Team"].to_numpy(dtype=object),
+    }
+
+def _bounds(prefix, key, first, last):
+    # rows are sorted by (player, key), so one combined search key finds every player's slice
+    span = int(max(key.max(initial=0), first, last)) + 1
+    combined = prefix["code"] * span + key
+    codes = np.arange(len(prefix["players"]))
+    return (np.searchsorted(combined, codes * span + first, side="left"),
+            np.searchsorted(combined, codes * span + last, side="right"))
+
+def window_totals(prefix, last=None, games=None, dates=None):
+    """DataFrame of each player's totals over the window (players without a game in it are dropped)."""
+    start, end = prefix["start"], prefix["end"]
+    if last is not None:
+        lo, hi = np.maximum(start, end - last), end
+    elif games is not None:
+        lo, hi = _bounds(prefix, prefix["game"], *games)
+    elif dates is not None:
+        lo, hi = _bounds(prefix, prefix["date"], *_date_ordinals(dates))
+    else:
+        lo, hi = start, end
+
+    totals = pd.DataFrame(prefix["sums"][hi] - prefix["sums"][lo], columns=prefix["columns"])
+    totals.insert(0, "Player ID", prefix["players"])
+    totals.insert(1, "Player", prefix["name"][np.maximum(hi - 1, 0)] if len(prefix["name"]) else [])
+    totals.insert(2, "team", prefix["team"][np.maximum(hi - 1, 0)] if len(prefix["team"]) else [])
+    return totals[totals["G"] > 0].reset_index(drop=True)
+
+def _ints(stats):
+    return {k: int(v) if isinstance(v, np.integer) else v for k, v in stats.items()}
+
+def batting_lines(totals):
+    result = []
+    for stats in totals.to_dict("records"):
+        ab, h, bb, hbp, sf, sh = stats["AB"], stats["H"], stats["BB"], stats["HBP"], stats["SF"], stats["SH"]
+        tb = h + stats["2B"] + 2 * stats["3B"] + 3 * stats["HR"]
+        result.append({
+            **_ints(stats), "PA": int(ab + bb + hbp + sf + sh), "TB": int(tb),
+            **batting_rates(ab, h, tb, bb, hbp, sf, sh),
+        })
+    return result
+
+def pitching_lines(totals):
+    result = []
+    for stats in totals.to_dict("records"):
+        outs = int(stats["outs"])
+        result.append({
+            **_ints(stats), "IP": outs,
+            **pitching_rates(stats["W"], stats["L"], outs, stats["ER"], stats["H"], stats["HR"], stats["BB"], stats["SO"]),
+            "WHIP": whip(stats["H"], stats["BB"], outs),
+        })
+    return result
+
+def standard_windows(schedule):
+    """[{key, label, dates: [first, last]}] for the build's windows, from the completed games' dates."""
+    played = sorted({g["date"] for g in schedule if g.get("completed") and g.get("date")})
+    if not played:
+        return []
+    latest = date.fromisoformat(played[-1])
+    windows = [
+        {"key": f"last{days}", "label": f"Last {days} days",
+         "dates": [(latest - timedelta(days=days - 1)).isoformat(), played[-1]]}
+        for days in LAST_DAYS
+    ]
+    for month in sorted({d[:7] for d in played}):
+        first = date.fromisoformat(f"{month}-01")
+        last = (first + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+        windows.append({"key": month, "label": first.strftime("%B"), "dates": [first.isoformat(), last.isoformat()]})
+    return windows
+
+def team_games(schedule, first, last):
+    """{team: completed games dated FIRST..LAST}, for the leaderboards' qualifying minimums."""
+    games = {}
+    for g in schedule:
+        if g.get("completed") and first <= (g.get("date") or "") <= last:
+            for team in (g["home_team"], g["away_team"]):
+                games[team] = games.get(team, 0) + 1
+    return games
+
+def window_sections(logs, schedule, teams):
+    """Yield (window, {"batting": lines, "pitching": lines, "leaders": boards}) for each standard window.
+
+    ``logs`` are the columnar batting and pitching logs; lines are typed, as
+    the season records are, and the leaderboards are ranked like leaders.json.
+    """
+    prefixes = {}
+    for section, sums in [("batting", BATTING_SUMS), ("pitching", PITCHING_SUMS)]:
+        log = columnar_log.to_frame(logs[f"{section}_log"])
+        prefixes[section] = prefix_sums(log, sums, dates_by_game(schedule, log))
+    for window in standard_windows(schedule):
+        batting = batting_lines(window_totals(prefixes["batting"], dates=window["dates"]))
+        pitching = pitching_lines(window_totals(prefixes["pitching"], dates=window["dates"]))
+        leaders = build_leaders(batting, pitching, None, teams, team_games(schedule, *window["dates"]))
+        yield window, {"batting": batting, "pitching": pitching, "leaders": leaders}
+
+def _load_log(stats_dir, name):
+    path = os.path.join(stats_dir, f"{name}.columnar.json")
+    if os.path.exists(path):
+        return columnar_log.to_frame(columnar_log.load(path))
+    with open(os.path.join(stats_dir, f"{name}.json")) as f:
+        return pd.DataFrame(json.load(f))
+
+def dates_by_game(schedule, log):
+    dates = {g["id"]: g["date"] for g in schedule}
+    return log.groupby("Game#")["Game ID"].first().map(dates).to_dict()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument("--last", type=int, metavar="N", help="each player's last N games")
+    window.add_argument("--dates", nargs=2, metavar=("FIRST", "LAST"), help="games dated FIRST..LAST (inclusive)")
+    window.add_argument("--games", nargs=2, type=int, metavar=("FIRST", "LAST"), help="Game# FIRST..LAST (inclusive)")
+    parser.add_argument("--player", nargs="+", help="only these Player IDs")
+    parser.add_argument("--min-pa", type=int, default=0)
+    parser.add_argument("--min-ip", type=float, default=0, help="minimum innings pitched")
+    parser.add_argument("--stats-dir", default="data/stats")
+    parser.add_argument("--output", help="write here instead of printing")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    set_output_options(args.format, args.compress)
+
+    with open(os.path.join(args.stats_dir, "schedule.json")) as f:
+        schedule = json.load(f)
+    result = {"window": {"last": args.last, "dates": args.dates, "games": args.games}}
+    for section, sums, lines in [("batting", BATTING_SUMS, batting_lines), ("pitching", PITCHING_SUMS, pitching_lines)]:
+        log = _load_log(args.stats_dir, f"{section}_log")
+        prefix = prefix_sums(log, sums, dates_by_game(schedule, log))
+        totals = window_totals(prefix, last=args.last, games=args.games, dates=args.dates)
+        if args.player:
+            totals = totals[totals["Player ID"].isin(args.player)]
+        if section == "batting":
+            totals = totals[totals[["AB", "BB", "HBP", "SF", "SH"]].sum(axis=1) >= args.min_pa]
+        else:
+            totals = totals[totals["outs"] >= round(args.min_ip * 3)]
+        result[section] = format_records(lines(totals), section)
+
+    if args.output:
+        save_json(result, args.output)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+
+if __name__ == "__main__":
+    main()
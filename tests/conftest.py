@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# the build scripts import each other as top-level modules, as they do when run from scripts/
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, os.path.join(ROOT, "scripts", "benchmarks"))
+
+from synthetic import synthetic_schedule, synthetic_gamelog, synthetic_linescores
+
+# The fixture workbook is a short synthetic season (benchmarks/synthetic.py)
+# in the column layout of "data/1999 Replay.xlsx": 90 games, so every team
+# plays a handful, with a few hitters traded halfway through.
+FIXTURE_GAMES = 90
+FIXTURE_SEED = 1999
+# the partial workbook stops this many games short, for --incremental runs
+HELD_BACK_GAMES = 15
+
+
+@pytest.fixture(scope="session")
+def sheets():
+    schedule = synthetic_schedule(1, FIXTURE_SEED, games_per_season=FIXTURE_GAMES)
+    gamelog = synthetic_gamelog(1, FIXTURE_SEED, games_per_season=FIXTURE_GAMES, schedule=schedule)
+    return {"Schedule": schedule, "GameLog": gamelog, "Linescores": synthetic_linescores(schedule, FIXTURE_SEED)}
+
+def _write_workbook(path, sheets):
+    with pd.ExcelWriter(path) as writer:
+        for name, frame in sheets.items():
+            frame.to_excel(writer, sheet_name=name, index=False)
+    return path
+
+@pytest.fixture(scope="session")
+def workbook(sheets, tmp_path_factory):
+    return _write_workbook(str(tmp_path_factory.mktemp("workbook") / "Replay.xlsx"), sheets)
+
+@pytest.fixture(scope="session")
+def partial_workbook(sheets, tmp_path_factory):
+    """The same season with its last HELD_BACK_GAMES games not played yet."""
+    held_back = sheets["Schedule"]["Game#"].nlargest(HELD_BACK_GAMES)
+    schedule = sheets["Schedule"].copy()
+    unplayed = schedule["Game#"].isin(held_back)
+    # as in the workbook: unplayed games score 0-0 and have no GameLog or Linescores rows
+    schedule.loc[unplayed, ["Away Score", "Home Score", "Played", "Played On"]] = [0, 0, "No", None]
+    partial = {
+        "Schedule": schedule,
+        "GameLog": sheets["GameLog"][~sheets["GameLog"]["Game#"].isin(held_back)],
+        "Linescores": sheets["Linescores"][~sheets["Linescores"]["Game#"].isin(held_back)],
+    }
+    return _write_workbook(str(tmp_path_factory.mktemp("workbook") / "Partial.xlsx"), partial)
+
+@pytest.fixture
+def repo_root(monkeypatch):
+    # the build reads data/teams.json relative to the working directory
+    monkeypatch.chdir(ROOT)
+    return ROOT
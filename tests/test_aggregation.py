@@ -0,0 +1,97 @@
+from fractions import Fraction
+
+import pytest
+
+import legacy
+from ingest import open_workbook
+from stat_format import format_records
+from aggregation import (
+    aggregate_gamelog, batting_records, pitching_records, fielding_records, fielding_by_position_records
+)
+
+# every rate: (numerator, denominator, decimal places) from a typed record
+RATES = {
+    "batting": {
+        "AVG": (lambda r: r["H"], lambda r: r["AB"], 3),
+        "OBP": (lambda r: r["H"] + r["BB"] + r["HBP"], lambda r: r["PA"], 3),
+        "SLG": (lambda r: r["TB"], lambda r: r["AB"], 3),
+    },
+    "pitching": {
+        "W-L%": (lambda r: r["W"], lambda r: r["W"] + r["L"], 3),
+        "ERA": (lambda r: r["ER"] * 27, lambda r: r["IP"], 2),
+        "H9": (lambda r: r["H"] * 27, lambda r: r["IP"], 1),
+        "HR9": (lambda r: r["HR"] * 27, lambda r: r["IP"], 1),
+        "BB9": (lambda r: r["BB"] * 27, lambda r: r["IP"], 1),
+        "SO9": (lambda r: r["SO"] * 27, lambda r: r["IP"], 1),
+        "SO/BB": (lambda r: r["SO"], lambda r: r["BB"], 1),
+    },
+    "fielding": {
+        "Fld%": (lambda r: r["PO"] + r["A"], lambda r: r["Ch"], 3),
+        "CS%": (lambda r: r["CS"] * 100, lambda r: r["SB"] + r["CS"], 0),
+    },
+}
+RATES["fielding_by_position"] = RATES["fielding"]
+# OPS is OBP + SLG as shown, so it moves when either of them does
+DERIVED = {"batting": ["OPS"]}
+COMPLETE_GAMES = {"pitching": ["CG", "SHO"], "fielding": ["CG"]}
+
+
+@pytest.fixture(scope="module")
+def gamelog(workbook):
+    return open_workbook(workbook, use_cache=False).parse("GameLog")
+
+@pytest.fixture(scope="module")
+def typed(gamelog):
+    totals = aggregate_gamelog(gamelog)
+    return {
+        "batting": batting_records(totals),
+        "pitching": pitching_records(totals),
+        "fielding": fielding_records(totals),
+        "fielding_by_position": fielding_by_position_records(totals),
+    }
+
+@pytest.fixture(scope="module")
+def old(gamelog):
+    return {
+        "batting": legacy.group_stats(gamelog),
+        "pitching": legacy.group_pitching_stats(gamelog, None),
+        "fielding": legacy.group_fielding_stats(gamelog),
+        "fielding_by_position": legacy.compute_fielding_by_position(gamelog),
+    }
+
+def _is_tie(numerator, denominator, places):
+    # the exact rate sits halfway between two values shown at ``places``
+    return denominator and (Fraction(int(numerator), int(denominator)) * 10 ** places).denominator == 2
+
+def _shown(value):
+    return float(str(value).rstrip("%"))
+
+def _without(records, fields):
+    return [{k: v for k, v in record.items() if k not in fields} for record in records]
+
+
+@pytest.mark.parametrize("section", ["batting", "pitching", "fielding", "fielding_by_position"])
+def test_matches_legacy_but_for_ties_and_complete_games(section, old, typed):
+    # complete games are counted per team now (tests/test_complete_games.py)
+    new = format_records(typed[section], section)
+    differs = list(RATES[section]) + DERIVED.get(section, []) + COMPLETE_GAMES.get(section, [])
+    assert _without(new, differs) == _without(old[section], differs)
+
+    for before, after, record in zip(old[section], new, typed[section]):
+        moved = set()
+        for rate, (numerator, denominator, places) in RATES[section].items():
+            if before[rate] != after[rate]:
+                # a rounding tie: the old float division rounded it down, exact counts round it half up
+                assert _is_tie(numerator(record), denominator(record), places), (record["Player ID"], rate)
+                assert _shown(after[rate]) - _shown(before[rate]) == pytest.approx(10 ** -places)
+                moved.add(rate)
+        for rate in DERIVED.get(section, []):
+            if before[rate] != after[rate]:
+                assert moved & {"OBP", "SLG"}, (record["Player ID"], rate)
+
+@pytest.mark.parametrize("section", ["batting", "pitching", "fielding", "fielding_by_position"])
+def test_counting_stats_are_ints(section, typed):
+    # rates are the only floats in the typed files ("AB": 25, not 25.0)
+    for record in typed[section]:
+        floats = {k for k, v in record.items() if isinstance(v, float)}
+        assert floats <= set(RATES[section]) | set(DERIVED.get(section, [])), record["Player ID"]
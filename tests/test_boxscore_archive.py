@@ -0,0 +1,73 @@
+import os
+import json
+
+import pytest
+
+from schedule_index import build_schedule_index
+from generate_stats import write_boxscores
+from boxscore_archive import (
+    BoxscoreArchive, archive_paths, encode_boxscore, load_index, read_boxscore, write_archive
+)
+
+GAMES = {
+    "19990404_COL@SDP": {"meta": {"home": "SDP", "away": "COL"}, "batting": {"SDP": {"Tony Gwynn": {"H": 2}}}},
+    "19990405_ARI@LAD": {"meta": {"home": "LAD", "away": "ARI"}, "note": "café, ñ"},
+    "19990405_G3": {},
+}
+
+
+def test_round_trip(tmp_path):
+    box_dir = str(tmp_path / "boxscores")
+    assert write_archive(((gid, encode_boxscore(box)) for gid, box in GAMES.items()), box_dir) == 3
+
+    index = load_index(archive_paths(box_dir)[1])
+    assert list(index) == list(GAMES)
+    for gid, box in GAMES.items():
+        assert read_boxscore(box_dir, gid) == box
+        assert read_boxscore(box_dir, gid, index=index) == box
+    with BoxscoreArchive(box_dir) as archive:
+        assert len(archive) == 3 and "19990405_G3" in archive
+        assert {gid: archive[gid] for gid in archive} == GAMES
+
+def test_lines_hold_one_box_score_each(tmp_path):
+    box_dir = str(tmp_path / "boxscores")
+    write_archive(((gid, encode_boxscore(box)) for gid, box in GAMES.items()), box_dir)
+    with open(archive_paths(box_dir)[0], "rb") as f:
+        assert [json.loads(line) for line in f] == list(GAMES.values())
+
+def test_append_adds_to_the_index(tmp_path):
+    box_dir = str(tmp_path / "boxscores")
+    games = list(GAMES.items())
+    write_archive(((gid, encode_boxscore(box)) for gid, box in games[:2]), box_dir)
+    assert write_archive(((gid, encode_boxscore(box)) for gid, box in games[2:]), box_dir, append=True) == 3
+    with BoxscoreArchive(box_dir) as archive:
+        assert {gid: archive[gid] for gid in archive} == GAMES
+
+    # without append the archive starts over
+    assert write_archive([(games[0][0], encode_boxscore(games[0][1]))], box_dir) == 1
+
+def test_empty_archive(tmp_path):
+    box_dir = str(tmp_path / "boxscores")
+    assert write_archive([], box_dir) == 0
+    with BoxscoreArchive(box_dir) as archive:
+        assert len(archive) == 0
+
+def test_unknown_index_version_is_refused(tmp_path):
+    box_dir = str(tmp_path / "boxscores")
+    write_archive([], box_dir)
+    with open(archive_paths(box_dir)[1], "w") as f:
+        json.dump({"version": 0, "games": {}}, f)
+    with pytest.raises(ValueError, match="unsupported box-score index version"):
+        load_index(archive_paths(box_dir)[1])
+
+def test_archive_holds_what_the_game_files_hold(sheets, tmp_path):
+    box_dir = str(tmp_path / "boxscores")
+    index = build_schedule_index(sheets["Schedule"])
+    assert write_boxscores(sheets["GameLog"], index, boxscore_dir=box_dir, workers=1, layout="both") == 90
+
+    files = sorted(os.listdir(box_dir))
+    with BoxscoreArchive(box_dir) as archive:
+        assert sorted(f"{gid}.json" for gid in archive) == files
+        for name in files:
+            with open(os.path.join(box_dir, name)) as f:
+                assert archive[name[:-len(".json")]] == json.load(f)
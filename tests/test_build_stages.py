@@ -0,0 +1,62 @@
+import os
+import json
+import shutil
+
+import pytest
+
+import build
+from conftest import ROOT
+
+
+def _run(workbook, tmp_path):
+    out = str(tmp_path / "stats")
+    build.main(["--input", workbook, "--team-workbook", "", "--output-dir", out,
+                "--boxscore-dir", str(tmp_path / "boxscores"), "--jobs", "2", "--workers", "1", "--no-cache"])
+    with open(os.path.join(out, "build_timings.json")) as f:
+        report = json.load(f)
+    return set(report["skipped"]), {record["stage"] for record in report["stages"]}
+
+def _downstream(name):
+    """Every stage that reads ``name``, directly or through another stage."""
+    found = set()
+    for stage in build.STAGES:
+        if name in build._ancestors([stage]) and stage != name:
+            found.add(stage)
+    return found
+
+
+@pytest.fixture
+def season_dir(tmp_path, monkeypatch):
+    # the build reads data/teams.json from the working directory; this one may be edited
+    (tmp_path / "data").mkdir()
+    shutil.copy(os.path.join(ROOT, "data", "teams.json"), tmp_path / "data" / "teams.json")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_unchanged_stages_are_skipped(workbook, season_dir):
+    stages = set(build.STAGES) - set(build.INPUTS)
+    skipped, ran = _run(workbook, season_dir)
+    assert skipped == set() and stages <= ran
+
+    # nothing changed: only the inputs load again
+    skipped, ran = _run(workbook, season_dir)
+    assert skipped == stages
+    assert ran == set(build.INPUTS)
+
+    # teams.json changed: the stages that read it run, the rest stay skipped
+    teams_path = season_dir / "data" / "teams.json"
+    teams = json.loads(teams_path.read_text())
+    teams[0]["name"] += " (renamed)"
+    teams_path.write_text(json.dumps(teams))
+    rerun = _downstream("teams")
+    assert {"standings", "leaders"} <= rerun and "boxscores" not in rerun
+    skipped, ran = _run(workbook, season_dir)
+    assert rerun <= ran
+    # an unchanged stage still runs when a changed one needs its value
+    assert skipped == stages - build._ancestors(rerun)
+
+    # a stage whose files were deleted runs again even though its inputs didn't change
+    os.remove(season_dir / "stats" / "standings.json")
+    skipped, ran = _run(workbook, season_dir)
+    assert "standings" in ran and "boxscores" in skipped
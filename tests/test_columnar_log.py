@@ -0,0 +1,54 @@
+import os
+import json
+
+import numpy as np
+import pytest
+
+import build
+import columnar_log
+from stat_utils import save_json
+
+LOG_NAMES = ["batting_log", "pitching_log", "fielding_log"]
+
+
+def test_encode_round_trips_dictionaries_and_sparse_columns(tmp_path):
+    rows = [
+        {"Player ID": "ruthba01", "Team": "NYY", "Game#": 1, "AB": 4, "HR": 1},
+        {"Player ID": "gehrilo01", "Team": "NYY", "Game#": 1, "AB": 3},
+        {"Player ID": "ruthba01", "Team": "NYY", "Game#": 2},
+        {"Player ID": "gehrilo01", "Team": "NYY", "Game#": 2, "AB": 5},
+    ]
+    columns = {name: [row.get(name, np.nan) for row in rows] for name in ["Player ID", "Team", "Game#", "AB", "HR"]}
+    log = columnar_log.encode(columns, dictionary=["Player ID", "Team"], sparse=["AB", "HR"])
+
+    assert log["dictionaries"] == {"Player ID": ["ruthba01", "gehrilo01"], "Team": ["NYY"]}
+    # HR is blank in most rows, so only its one value is kept, with its gap
+    assert log["values"][4] == {"gaps": [1], "values": [1.0]}
+
+    path = str(tmp_path / "log.json")
+    save_json(log, path)
+    loaded = columnar_log.load(path)
+    assert list(columnar_log.expand_rows(loaded)) == rows
+    frame = columnar_log.to_frame(loaded)
+    assert frame["Player ID"].tolist() == [row["Player ID"] for row in rows]
+    assert frame["HR"].fillna(0).tolist() == [1, 0, 0, 0]
+
+def test_load_rejects_other_versions(tmp_path):
+    path = str(tmp_path / "log.json")
+    with open(path, "w") as f:
+        json.dump({"version": columnar_log.FORMAT_VERSION + 1}, f)
+    with pytest.raises(ValueError):
+        columnar_log.load(path)
+
+def test_columnar_logs_expand_to_the_row_logs(workbook, repo_root, tmp_path):
+    out = str(tmp_path / "stats")
+    build.main(["--input", workbook, "--team-workbook", "", "--output-dir", out, "--stages", "game_logs",
+                "--log-format", "both", "--jobs", "1", "--workers", "1", "--no-cache"])
+    for name in LOG_NAMES:
+        log = columnar_log.load(os.path.join(out, f"{name}.columnar.json"))
+        with open(os.path.join(out, f"{name}.json")) as f:
+            rows = json.load(f)
+        assert log["rows"] == len(rows) > 0
+        assert list(columnar_log.expand_rows(log)) == rows
+        # the columnar file is the smaller one
+        assert os.path.getsize(os.path.join(out, f"{name}.columnar.json")) < os.path.getsize(os.path.join(out, f"{name}.json"))
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+import legacy
+from ingest import open_workbook
+from aggregation import aggregate_gamelog, pitching_records, fielding_records
+
+
+@pytest.fixture(scope="module")
+def gamelog(workbook):
+    return open_workbook(workbook, use_cache=False).parse("GameLog")
+
+def _lone_at_position(gamelog):
+    """(Player ID, Team, pos, scoreless) rows for players alone at a position 1-9 in a game."""
+    rows = gamelog[gamelog["Player ID"].notna()].assign(pos=pd.to_numeric(gamelog["POS"], errors="coerce"))
+    rows = rows[rows["pos"].isin(range(1, 10))]
+    alone = rows.groupby(["Game#", "Team", "pos"])["Player ID"].transform("size") == 1
+    return rows[alone].assign(scoreless=pd.to_numeric(rows["R against"], errors="coerce").eq(0))
+
+
+def test_complete_games_are_per_player_and_team(gamelog):
+    totals = aggregate_gamelog(gamelog)
+    pitching, fielding = pitching_records(totals), fielding_records(totals)
+
+    lone = _lone_at_position(gamelog)
+    pitchers = lone[lone["pos"] == 1]
+    cg = pitchers.groupby(["Player ID", "Team"]).size()
+    sho = pitchers[pitchers["scoreless"]].groupby(["Player ID", "Team"]).size()
+    for record in pitching:
+        key = (record["Player ID"], record["team"])
+        assert record["CG"] == cg.get(key, 0)
+        assert record["SHO"] == sho.get(key, 0)
+
+    fielding_cg = lone.groupby(["Player ID", "Team"]).size()
+    for record in fielding:
+        assert record["CG"] == fielding_cg.get((record["Player ID"], record["team"]), 0)
+
+    # the old per-player counts agree wherever a pitcher stayed with one team
+    teams = gamelog.groupby("Player ID")["Team"].nunique()
+    for before, record in zip(legacy.group_pitching_stats(gamelog, None), pitching):
+        if teams[record["Player ID"]] == 1:
+            assert (before["CG"], before["SHO"]) == (record["CG"], record["SHO"])
@@ -0,0 +1,57 @@
+import os
+import filecmp
+
+import pytest
+
+import build
+from build_state import load_state
+from conftest import ROOT
+
+# written on every run and expected to differ
+RUN_FILES = {"build_manifest.json", "build_timings.json"}
+
+
+def _build(workbook, out, *extra):
+    build.main([
+        "--input", workbook, "--team-workbook", "", "--output-dir", os.path.join(out, "stats"),
+        "--boxscore-dir", os.path.join(out, "boxscores"), "--boxscore-layout", "both",
+        "--jobs", "1", "--workers", "1", "--no-cache", *extra,
+    ])
+
+def _differences(a, b):
+    found = []
+    compare = filecmp.dircmp(a, b, ignore=list(RUN_FILES))
+    stack = [("", compare)]
+    while stack:
+        prefix, cmp = stack.pop()
+        found += [os.path.join(prefix, name) for name in cmp.left_only + cmp.right_only + cmp.funny_files]
+        _, mismatch, errors = filecmp.cmpfiles(cmp.left, cmp.right, cmp.common_files, shallow=False)
+        found += [os.path.join(prefix, name) for name in mismatch + errors]
+        stack += [(os.path.join(prefix, name), sub) for name, sub in cmp.subdirs.items()]
+    return sorted(found)
+
+
+@pytest.fixture(scope="module")
+def full_build(workbook, tmp_path_factory):
+    out = str(tmp_path_factory.mktemp("full"))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(ROOT)
+        _build(workbook, out)
+    return out
+
+def test_incremental_build_matches_full_build(full_build, workbook, partial_workbook, tmp_path, repo_root, capsys):
+    out = str(tmp_path)
+    _build(partial_workbook, out)
+    _build(workbook, out, "--incremental")
+    assert "Incremental build: 15 new game(s)." in capsys.readouterr().out
+    assert _differences(full_build, out) == []
+
+def test_changed_games_rebuild_everything(workbook, partial_workbook, tmp_path, repo_root, capsys):
+    # games folded in earlier that have since changed or gone can't be taken back out
+    out = str(tmp_path)
+    _build(workbook, out)
+    state = load_state(os.path.join(out, "stats"))
+    assert len(state["games"]) == 90
+    _build(partial_workbook, out, "--incremental")
+    assert "rebuilding everything" in capsys.readouterr().out
+    assert len(load_state(os.path.join(out, "stats"))["games"]) == 75
@@ -0,0 +1,42 @@
+import os
+
+import pandas as pd
+
+from ingest import open_workbook
+
+
+def _write(path, frame):
+    with pd.ExcelWriter(path) as writer:
+        frame.to_excel(writer, sheet_name="GameLog", index=False)
+
+def _cached_sheets(workbook, cache_dir):
+    book = open_workbook(workbook, cache_dir=cache_dir)
+    return book, book.manifest["sheets"]
+
+
+def test_cache_serves_sheets_until_the_workbook_changes(tmp_path):
+    workbook, cache_dir = str(tmp_path / "Replay.xlsx"), str(tmp_path / "cache")
+    _write(workbook, pd.DataFrame({"Player ID": ["ruthba01", None], "Game#": [1, 2], "AB": [4.0, 3.0]}))
+
+    book, sheets = _cached_sheets(workbook, cache_dir)
+    assert sheets == {}
+    first = book.parse("GameLog")
+    assert list(first["AB"]) == [4.0, 3.0]
+
+    # a second open reads the cache; opening the workbook would now raise
+    book, sheets = _cached_sheets(workbook, cache_dir)
+    assert list(sheets) == ["GameLog"]
+    book._excel_file = None
+    pd.testing.assert_frame_equal(book.parse("GameLog"), first)
+
+    # touched but not edited: the hash matches and the cache stays
+    os.utime(workbook, (1, 1))
+    book, sheets = _cached_sheets(workbook, cache_dir)
+    assert list(sheets) == ["GameLog"]
+
+    # edited: the cache is thrown away and the new values are read
+    _write(workbook, pd.DataFrame({"Player ID": ["ruthba01"], "Game#": [1], "AB": [5.0]}))
+    book, sheets = _cached_sheets(workbook, cache_dir)
+    assert sheets == {}
+    assert list(book.parse("GameLog")["AB"]) == [5.0]
+    assert list(open_workbook(workbook, cache_dir=cache_dir).manifest["sheets"]) == ["GameLog"]
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import legacy
+from synthetic import GAMELOG_COLUMNS
+from stat_format import format_records
+from aggregation import aggregate_gamelog, pitching_records
+from stat_utils import innings_to_outs, notation_to_outs, format_outs, exact_rate
+
+
+def test_innings_to_outs_reads_numbers_and_fractions():
+    values = [5 + 1 / 3, "5 1/3", "2/3", 6.0, " 7 2/3 ", 1 / 3, 0]
+    assert innings_to_outs(values).tolist() == [16, 16, 2, 18, 23, 1, 0]
+
+def test_innings_to_outs_counts_blank_and_junk_as_zero():
+    values = [None, np.nan, "", "junk", "1/0"]
+    outs = innings_to_outs(values)
+    assert outs.tolist() == [0, 0, 0, 0, 0]
+    assert outs.dtype == np.int64
+
+def test_innings_to_outs_is_exact_when_summed():
+    # 0.1 + 0.2-style drift would make 27 one-third innings 8.999...
+    assert innings_to_outs([1 / 3] * 27).sum() == 27
+
+@pytest.mark.parametrize("value, outs", [
+    ("6.1", 19), ("6.2", 20), ("6.0", 18), (6, 18), ("0.2", 2), (6 + 1 / 3, 19), (6 + 2 / 3, 20), (6.1, 19),
+])
+def test_notation_to_outs(value, outs):
+    assert notation_to_outs(value) == outs
+
+@pytest.mark.parametrize("value", ["5 1/3", "2/3", None])
+def test_notation_to_outs_rejects_fractions(value):
+    # the team sheets only hold box-score notation; callers keep such cells as they are
+    with pytest.raises((TypeError, ValueError)):
+        notation_to_outs(value)
+
+@pytest.mark.parametrize("outs, shown", [(0, "0.0"), (1, "0.1"), (2, "0.2"), (16, "5.1"), (27, "9.0"), (np.int64(20), "6.2")])
+def test_format_outs(outs, shown):
+    assert format_outs(outs) == shown
+
+def test_format_outs_round_trips_through_notation():
+    for outs in range(60):
+        assert notation_to_outs(format_outs(outs)) == outs
+
+@pytest.mark.parametrize("num, den, places, rate", [
+    # ties that binary floats rounded both ways
+    (27, 4, 1, 6.8), (81, 4, 1, 20.3), (9, 4, 1, 2.3), (81, 20, 1, 4.1), (27, 20, 1, 1.4), (27, 8, 2, 3.38),
+    (5, 16, 3, 0.313), (1, 3, 3, 0.333), (2, 3, 1, 0.7), (1, 2, 0, 1), (0, 5, 2, 0.0),
+])
+def test_exact_rate_rounds_ties_half_up(num, den, places, rate):
+    assert exact_rate(num, den, places) == rate
+
+def test_exact_rate_without_a_denominator():
+    assert exact_rate(3, 0, 2) is None
+    assert exact_rate(3, 0, 1, 0.0) == 0.0
+
+def test_tied_rate_rounds_half_up_from_exact_outs():
+    # 108 one-out relief outings (36 IP) and 25 hits: H9 is exactly 6.25.
+    # The old float innings summed to just under 36, which only happened to
+    # round it up as well
+    rows = pd.DataFrame(np.nan, index=range(108), columns=GAMELOG_COLUMNS)
+    rows = rows.assign(**{
+        "Game#": np.arange(1, 109), "Team": "SD", "Player ID": "relief01", "Player Name": "Reliever", "POS": 1,
+        "IP": 1 / 3, "H allowed": np.where(np.arange(108) < 25, 1.0, np.nan),
+    })
+    rows["POS"] = rows["POS"].astype(object)
+
+    before = legacy.group_pitching_stats(rows, None)[0]
+    after = format_records(pitching_records(aggregate_gamelog(rows, ("pitching",))), "pitching")[0]
+    assert (before["IP"], after["IP"]) == ("36.0", "36.0")
+    assert (before["H9"], after["H9"]) == ("6.3", "6.3")
@@ -0,0 +1,69 @@
+from aggregation import batting_rates, pitching_rates
+from leaders import build_leaders, team_thresholds
+
+TEAMS = [{"id": "AAA", "league": "AL"}, {"id": "BBB", "league": "NL"}]
+# 10 games each: 31 PA and 30 outs to qualify for the rate boards
+TEAM_GAMES = {"AAA": 10, "BBB": 10}
+
+
+def _hitter(pid, team, pa, ab, h, hr=0):
+    bb = pa - ab
+    return {"Player ID": pid, "Player": pid.upper(), "team": team, "G": 10, "PA": pa, "AB": ab, "H": h, "HR": hr,
+            "BB": bb, "HBP": 0, "TB": h + 3 * hr, **batting_rates(ab, h, h + 3 * hr, bb, 0, 0, 0)}
+
+def _pitcher(pid, team, outs, er, h=0, bb=0):
+    return {"Player ID": pid, "Player": pid.upper(), "team": team, "G": 3, "IP": outs, "ER": er, "H": h, "BB": bb,
+            "SO": 0, "W": 0, "L": 0, **pitching_rates(0, 0, outs, er, h, 0, bb, 0)}
+
+# a line for the section a test doesn't look at
+NO_PITCHING = [_pitcher("zz", "AAA", 3, 0)]
+NO_BATTING = [_hitter("zz", "AAA", 1, 1, 0)]
+
+def _board(board):
+    return [(entry["Player ID"], entry["value"]) for entry in board]
+
+
+def test_team_thresholds():
+    assert team_thresholds({"AAA": 10, "BBB": 0}) == {
+        "AAA": {"G": 10, "PA": 31.0, "IP": 10.0, "fielding_G": 7},
+        "BBB": {"G": 0, "PA": 0.0, "IP": 0.0, "fielding_G": 0},
+    }
+
+def test_rate_boards_rank_qualified_lines_on_the_exact_value():
+    batting = [
+        # both show .333: 12/36 is the higher exact average
+        _hitter("b", "AAA", 1000, 1000, 333, hr=2),
+        _hitter("a", "AAA", 36, 36, 12, hr=2),
+        # the same line twice: Player ID breaks the tie
+        _hitter("d", "BBB", 40, 40, 10, hr=1),
+        _hitter("c", "BBB", 40, 40, 10, hr=1),
+        # .900 but 30 PA, one short of qualifying; no home run, so on no counting board either
+        _hitter("e", "AAA", 30, 10, 9),
+    ]
+    leaders = build_leaders(batting, NO_PITCHING, None, TEAMS, TEAM_GAMES)
+
+    assert leaders["thresholds"] == team_thresholds(TEAM_GAMES)
+    assert _board(leaders["batting"]["MLB"]["AVG"]) == [("a", ".333"), ("b", ".333"), ("c", ".250"), ("d", ".250")]
+    assert _board(leaders["batting"]["AL"]["AVG"]) == [("a", ".333"), ("b", ".333")]
+    assert _board(leaders["batting"]["NL"]["AVG"]) == [("c", ".250"), ("d", ".250")]
+    # counting boards: every line with one, no qualifying minimum, ties by Player ID
+    assert _board(leaders["batting"]["MLB"]["HR"]) == [("a", 2), ("b", 2), ("c", 1), ("d", 1)]
+    assert "fielding" not in leaders
+
+def test_lower_is_better_for_era_and_whip():
+    pitching = [
+        _pitcher("p1", "AAA", 30, 3, h=8, bb=2),
+        # 2.00 but 27 outs, one inning short
+        _pitcher("p2", "AAA", 27, 2, h=5, bb=1),
+        _pitcher("p3", "BBB", 45, 5, h=9, bb=3),
+        _pitcher("p4", "BBB", 45, 0, h=30, bb=15),
+    ]
+    leaders = build_leaders(NO_BATTING, pitching, None, TEAMS, TEAM_GAMES)["pitching"]["MLB"]
+    assert _board(leaders["ERA"]) == [("p4", "0.00"), ("p1", "2.70"), ("p3", "3.00")]
+    # WHIP isn't in the pitching records; it is worked out from H, BB and outs
+    assert _board(leaders["WHIP"]) == [("p3", "0.80"), ("p1", "1.00"), ("p4", "3.00")]
+
+def test_the_top_n_only():
+    batting = [_hitter(f"h{i:02d}", "AAA", 40, 40, i) for i in range(1, 16)]
+    board = build_leaders(batting, NO_PITCHING, None, TEAMS, TEAM_GAMES, top=3)["batting"]["MLB"]["H"]
+    assert _board(board) == [("h15", 15), ("h14", 14), ("h13", 13)]
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from generate_stats import build_linescores
+from schedule_index import build_schedule_index
+
+INNINGS = list(range(1, 21))
+
+
+def _schedule(*games):
+    return pd.DataFrame([
+        {"Game#": num, "Game ID": gid, "Date": "1999-04-05", "Away": gid[9:12], "Home": gid[13:16],
+         "Away Score": 0, "Home Score": 0, "Played": played}
+        for num, gid, played in games
+    ])
+
+def _linescores(*lines):
+    rows = []
+    for num, gid, team, runs in lines:
+        cells = dict(zip(INNINGS, runs + [np.nan] * (len(INNINGS) - len(runs))))
+        rows.append({"Game#": num, "Game ID": gid, "Team": team, "SCORE": np.nansum(runs), **cells})
+    return pd.DataFrame(rows)
+
+def _gamelog(*rows):
+    return pd.DataFrame(rows, columns=["Game#", "Team", "BOP", "POS", "H", "ERR"])
+
+
+def test_line_scores_carry_r_h_e_and_stop_after_each_teams_last_inning():
+    schedule = _schedule((1, "19990405_AWY@HOM", "Yes"), (2, "19990406_AWY@HOM", "Yes"),
+                         (3, "19990407_AWY@HOM", "No"))
+    linescores = _linescores(
+        # the home team led after 8½ and didn't bat in the 9th (the page shows an "X")
+        (1, "19990405_AWY@HOM", "AWY", [0, 1, 0, 0, 0, 0, 0, 0, 1]),
+        (1, "19990405_AWY@HOM", "HOM", [2, 0, 0, 0, 1, 0, 0, 0]),
+        # a walk-off in the 10th; a blank cell mid-game stays blank
+        (2, "19990406_AWY@HOM", "AWY", [0, 0, 0, 2, 0, 0, 0, 0, 0, 0]),
+        (2, "19990406_AWY@HOM", "HOM", [0, np.nan, 0, 0, 0, 0, 1, 1, 0, 1]),
+        # not played yet
+        (3, "19990407_AWY@HOM", "AWY", [0] * 9),
+    )
+    gamelog = _gamelog(
+        (1, "AWY", 1, 8, 2, 0), (1, "AWY", 2, 6, 3, 1), (1, "AWY", 0, 1, 0, 1),
+        (1, "HOM", 1, 4, 1, 0), (1, "HOM", 2, 2, 4, 0),
+        # a DH's ERR and a non-batter's H don't count
+        (1, "HOM", 3, "DH", 1, 1), (1, "HOM", 0, 1, 1, 0),
+        (2, "AWY", 1, 7, 5, 0), (2, "HOM", 1, 3, 6, 2),
+    )
+    result = build_linescores(linescores, build_schedule_index(schedule), gamelog)
+
+    assert result == {
+        "19990405_AWY@HOM": {"innings": 9, "AWY": [2, 5, 2, 0, 1, 0, 0, 0, 0, 0, 0, 1],
+                             "HOM": [3, 6, 0, 2, 0, 0, 0, 1, 0, 0, 0]},
+        "19990406_AWY@HOM": {"innings": 10, "AWY": [2, 5, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0],
+                             "HOM": [3, 6, 2, 0, None, 0, 0, 0, 0, 1, 1, 0, 1]},
+    }
+
+def test_without_a_gamelog_hits_and_errors_are_zero():
+    schedule = _schedule((1, "19990405_AWY@HOM", "Yes"))
+    linescores = _linescores((1, "19990405_AWY@HOM", "AWY", [1] * 9), (1, "19990405_AWY@HOM", "HOM", [0] * 9))
+    assert build_linescores(linescores, build_schedule_index(schedule)) == {
+        "19990405_AWY@HOM": {"innings": 9, "AWY": [9, 0, 0] + [1] * 9, "HOM": [0, 0, 0] + [0] * 9},
+    }
@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+from aggregation import PITCHING_STATS, FIELDING_STATS, batting_records, pitching_records, fielding_records
+from stat_json_generator import merge_totals, format_rows
+
+
+def _players(section, *lines):
+    return {"p1": {section: [{"team": team, "Player ID": "p1", "Player": "One", **line} for team, line in lines]}}
+
+def _totals(section, counts):
+    """One aggregation totals row holding ``counts`` (GameLog column names)."""
+    return {section: pd.DataFrame([{"Player ID": "p1", "Team": "TOT", "Player": "One", "G": 2, **counts}])}
+
+
+def test_batting_tot_sums_counts_and_uses_season_obp():
+    players = _players(
+        "batting",
+        ("ARI", {"G": 10, "AB": 40, "H": 12, "2B": 3, "3B": 1, "HR": 2, "BB": 5, "HBP": 1, "SF": 1, "SH": 2,
+                 "AVG": 0.3, "OBP": 0.0, "SLG": 0.0, "OPS": 0.0}),
+        ("COL", {"G": 5, "AB": 17, "H": 4, "2B": 0, "3B": 0, "HR": 1, "BB": 2, "HBP": 0, "SF": 0, "SH": 1,
+                 "AVG": 0.235, "OBP": 0.0, "SLG": 0.0, "OPS": 0.0}),
+    )
+    tot = merge_totals(players, "batting")["p1"]
+    assert tot["team"] == "TOT"
+    assert (tot["G"], tot["AB"], tot["H"], tot["SH"]) == (15, 57, 16, 3)
+
+    counts = {"AB": 57, "H": 16, "2B": 3, "3B": 1, "HR": 3, "BB": 7, "HBP": 1, "SF": 1, "SH": 3}
+    counts.update({k: 0 for k in ("IBB", "SO", "R", "RBI", "GDP", "SB", "CS")})
+    season = batting_records(_totals("batting", counts))[0]
+    for rate in ("AVG", "OBP", "SLG", "OPS"):
+        assert tot[rate] == season[rate], rate
+    # sacrifice hits are plate appearances, as in the season records
+    assert tot["OBP"] == round(24 / 69, 3)
+
+def test_pitching_tot_rates_match_season_records():
+    players = _players(
+        "pitching",
+        ("SD", {"G": 3, "W": 1, "L": 1, "IP": 20, "H": 9, "ER": 4, "HR": 1, "BB": 3, "SO": 8,
+                "W-L%": 0.5, "ERA": 5.4, "WHIP": 1.8, "H9": 0.0, "HR9": 0.0, "BB9": 0.0, "SO9": 0.0, "SO/BB": 0.0}),
+        ("LA", {"G": 2, "W": 1, "L": 0, "IP": 7, "H": 2, "ER": 0, "HR": 0, "BB": 1, "SO": 2,
+                "W-L%": 1.0, "ERA": 0.0, "WHIP": 1.29, "H9": 0.0, "HR9": 0.0, "BB9": 0.0, "SO9": 0.0, "SO/BB": 0.0}),
+    )
+    tot = merge_totals(players, "pitching")["p1"]
+    assert tot["IP"] == 27
+
+    counts = {PITCHING_STATS[k]: v for k, v in {"W": 2, "L": 1, "H": 11, "ER": 4, "HR": 1, "BB": 4, "SO": 10}.items()}
+    counts.update({col: 0 for col in PITCHING_STATS.values() if col not in counts})
+    counts.update({"IP outs": 27, "complete": 0, "shutout": 0})
+    season = pitching_records(_totals("pitching", counts))[0]
+    for rate in ("W-L%", "ERA", "H9", "HR9", "BB9", "SO9", "SO/BB"):
+        assert tot[rate] == season[rate], rate
+    assert tot["WHIP"] == round(15 / 9, 2)
+
+def test_pitching_tot_without_outs_has_no_era():
+    players = _players("pitching", ("SD", {"G": 1, "IP": 0, "ER": 2, "ERA": None}), ("LA", {"G": 1, "IP": 0, "ER": 1, "ERA": None}))
+    tot = merge_totals(players, "pitching")["p1"]
+    assert tot["ERA"] is None
+    assert format_rows([tot], "pitching")[0]["ERA"] == "---"
+
+@pytest.mark.parametrize("sb, cs", [(0, 0), (3, 1)])
+def test_fielding_tot_rates_match_season_records(sb, cs):
+    players = _players(
+        "fielding",
+        ("SEA", {"POS": "2", "G": 4, "PO": 30, "A": 2, "E": 1, "SB": sb, "CS": cs, "Fld Pct": 0.0, "CS%": 0}),
+        ("TEX", {"POS": "2", "G": 2, "PO": 11, "A": 0, "E": 0, "SB": 0, "CS": 0, "Fld Pct": 0.0, "CS%": 0}),
+    )
+    tot = merge_totals(players, "fielding")["p1"]
+
+    counts = {FIELDING_STATS[k]: v for k, v in {"PO": 41, "A": 2, "E": 1, "SB": sb, "CS": cs}.items()}
+    counts.update({col: 0 for col in FIELDING_STATS.values() if col not in counts})
+    counts.update({"INN outs": 0, "complete": 0})
+    season = fielding_records(_totals("fielding", counts))[0]
+    assert tot["Fld Pct"] == season["Fld%"]
+    assert tot["CS%"] == season["CS%"]
+    if sb + cs == 0:
+        # undefined, as in fielding.json, and shown blank
+        assert tot["CS%"] is None
+        assert format_rows([tot], "fielding")[0]["CS%"] == ""
+
+def test_players_on_one_team_get_no_tot_line():
+    assert merge_totals(_players("batting", ("ARI", {"G": 3, "AB": 9, "H": 2})), "batting") == {}
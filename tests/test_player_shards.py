@@ -0,0 +1,41 @@
+import os
+import json
+
+import build
+from stat_utils import exact_rate
+
+COUNTS = {
+    "batting": ["G", "PA", "AB", "H", "HR", "BB", "SO", "TB"],
+    "fielding": ["G", "GS", "PO", "A", "E"],
+}
+
+
+def test_traded_players_get_tot_lines_without_the_team_workbook(workbook, repo_root, tmp_path):
+    out = str(tmp_path / "stats")
+    build.main(["--input", workbook, "--team-workbook", "", "--output-dir", out,
+                "--boxscore-dir", str(tmp_path / "boxscores"), "--jobs", "1", "--workers", "1", "--no-cache"])
+    with open(os.path.join(out, "players", "index.json")) as f:
+        index = json.load(f)
+    traded = [p["id"] for p in index if len(p["teams"]) > 1]
+    assert traded  # the fixture trades a few hitters
+
+    for pid in traded:
+        with open(os.path.join(out, "players", f"{pid}.json")) as f:
+            shard = json.load(f)
+        for section, counts in COUNTS.items():
+            teams = [line for line in shard.get(section, []) if line["team"] != "TOT"]
+            totals = [line for line in shard.get(section, []) if line["team"] == "TOT"]
+            if len(teams) < 2:
+                assert totals == [], (pid, section)
+                continue
+            # after the team lines
+            assert shard[section][-1] == totals[0] and len(totals) == 1, (pid, section)
+            for stat in counts:
+                assert totals[0][stat] == sum(line[stat] for line in teams), (pid, section, stat)
+        batting = shard["batting"][-1]
+        assert float(batting["AVG"]) == exact_rate(batting["H"], batting["AB"], 3)
+
+    # players who stayed put have no TOT line
+    stayed = next(p["id"] for p in index if len(p["teams"]) == 1)
+    with open(os.path.join(out, "players", f"{stayed}.json")) as f:
+        assert all(line["team"] != "TOT" for line in json.load(f)["batting"])
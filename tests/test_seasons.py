@@ -0,0 +1,84 @@
+import os
+import json
+import shutil
+
+import pytest
+
+import build
+from build_state import load_state
+from career import load_season_totals
+from stat_utils import exact_rate
+from conftest import ROOT, FIXTURE_GAMES, HELD_BACK_GAMES
+
+
+def _season_build(tmp_path, *seasons, workers=2):
+    argv = ["--data-dir", str(tmp_path / "out"), "--season-workers", str(workers), "--jobs", "4", "--workers", "1"]
+    for season, workbook in seasons:
+        argv += ["--season", season, workbook]
+    build.main(argv)
+
+
+@pytest.fixture
+def working_dir(tmp_path, monkeypatch):
+    # builds read data/teams.json and cache workbooks under data/.cache, relative to the working directory
+    (tmp_path / "data").mkdir()
+    shutil.copy(os.path.join(ROOT, "data", "teams.json"), tmp_path / "data" / "teams.json")
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.usefixtures("working_dir")
+def test_same_named_workbooks_build_in_parallel(workbook, partial_workbook, tmp_path):
+    # each season's workbook is called Replay.xlsx, in its own folder
+    for folder, source in [("s1", workbook), ("s2", partial_workbook)]:
+        (tmp_path / folder).mkdir()
+        shutil.copy(source, tmp_path / folder / "Replay.xlsx")
+
+    seasons = [("1999", os.path.join("s1", "Replay.xlsx")), ("2000", os.path.join("s2", "Replay.xlsx"))]
+    _season_build(tmp_path, *seasons)
+    played = {season: len(load_state(str(tmp_path / "out" / season / "stats"))["games"]) for season, _ in seasons}
+    assert played == {"1999": FIXTURE_GAMES, "2000": FIXTURE_GAMES - HELD_BACK_GAMES}
+
+    # one cache per workbook, and neither season's build threw the other's away
+    caches = sorted(name for name in os.listdir(tmp_path / "data" / ".cache") if not name.endswith(".lock"))
+    assert len(caches) == 2 and all(name.startswith("Replay-") for name in caches)
+    manifests = {}
+    for name in caches:
+        with open(tmp_path / "data" / ".cache" / name / "manifest.json") as f:
+            manifests[name] = json.load(f)
+    _season_build(tmp_path, *seasons)
+    for name, manifest in manifests.items():
+        with open(tmp_path / "data" / ".cache" / name / "manifest.json") as f:
+            assert json.load(f) == manifest
+
+@pytest.mark.usefixtures("working_dir")
+def test_career_totals_sum_the_season_states(workbook, partial_workbook, tmp_path):
+    _season_build(tmp_path, ("1999", workbook), ("2000", partial_workbook))
+
+    def typed(folder, section):
+        with open(tmp_path / "out" / folder / f"{section}.typed.json") as f:
+            return json.load(f)
+
+    for section, counts in [("batting", ["G", "PA", "AB", "H", "HR", "BB", "TB"]),
+                            ("pitching", ["G", "GS", "IP", "ER", "H", "BB", "SO", "W", "L"]),
+                            ("fielding", ["G", "Inn", "PO", "A", "E"])]:
+        expected = {}
+        for season in ["1999", "2000"]:
+            for line in typed(os.path.join(season, "stats"), section):
+                totals = expected.setdefault(line["Player ID"], dict.fromkeys(counts, 0))
+                for stat in counts:
+                    totals[stat] += line[stat]
+        career = {line["Player ID"]: line for line in typed("career", section)}
+        assert set(career) == set(expected)
+        for pid, line in career.items():
+            assert line["team"] == "TOT"
+            assert {stat: line[stat] for stat in counts} == expected[pid], (section, pid)
+
+    # rates come from the summed counts, not from the seasons' rates
+    for line in typed("career", "batting"):
+        assert line["AVG"] == exact_rate(line["H"], line["AB"], 3, 0)
+    for line in typed("career", "pitching"):
+        assert line["ERA"] == exact_rate(line["ER"] * 27, line["IP"], 2)
+
+    # a season without a build state is left out rather than failing the career totals
+    seasons = [("1999", str(tmp_path / "out" / "1999" / "stats")), ("1998", str(tmp_path / "missing"))]
+    assert [season for season, _ in load_season_totals(seasons)] == ["1999"]
@@ -0,0 +1,61 @@
+from standings import build_standings, format_standings, standings_by_date
+
+# one five-team division in teams.json order, and an opponent from elsewhere
+TEAMS = [{"id": team, "league": "NL", "division": "West"} for team in ["AAA", "BBB", "CCC", "DDD", "EEE"]] + \
+        [{"id": "XXX", "league": "AL", "division": "East"}]
+
+
+def _game(date, home, away, home_score, away_score, completed=True):
+    return {"id": f"{date}_{away}@{home}", "date": date, "home_team": home, "away_team": away,
+            "home_score": home_score, "away_score": away_score, "simDate": "", "completed": completed}
+
+def _division(schedule):
+    standings = format_standings(build_standings(schedule, TEAMS), TEAMS)
+    return [(row["team"], row["W"], row["L"], row["GB"]) for row in standings["NL"]["West"]]
+
+
+def test_order_is_pct_then_run_differential_then_wins_then_teams_json():
+    schedule = [
+        # AAA and BBB 1-0: BBB won by more
+        _game("1999-04-05", "AAA", "XXX", 3, 2),
+        _game("1999-04-05", "BBB", "XXX", 9, 0),
+        # CCC 2-2 and DDD 1-1, both with run differential 0: CCC has more wins
+        _game("1999-04-05", "CCC", "XXX", 5, 4),
+        _game("1999-04-06", "CCC", "XXX", 5, 4),
+        _game("1999-04-07", "CCC", "XXX", 4, 5),
+        _game("1999-04-08", "CCC", "XXX", 4, 5),
+        _game("1999-04-05", "DDD", "XXX", 2, 1),
+        _game("1999-04-06", "DDD", "XXX", 1, 2),
+        # EEE hasn't played: .000, behind everyone with a game
+        _game("1999-04-09", "EEE", "XXX", 0, 0, completed=False),
+    ]
+    assert _division(schedule) == [
+        ("BBB", 1, 0, "--"), ("AAA", 1, 0, "--"), ("CCC", 2, 2, 0.5), ("DDD", 1, 1, 0.5), ("EEE", 0, 0, 0.5),
+    ]
+
+def test_identical_records_keep_teams_json_order():
+    schedule = [_game("1999-04-05", team, "XXX", 4, 2) for team in ["EEE", "CCC", "AAA", "DDD", "BBB"]]
+    assert [row[0] for row in _division(schedule)] == ["AAA", "BBB", "CCC", "DDD", "EEE"]
+
+def test_tie_score_goes_to_the_road_team():
+    assert _division([_game("1999-04-05", "AAA", "BBB", 3, 3)])[:2] == [("BBB", 1, 0, "--"), ("AAA", 0, 1, 1.0)]
+
+def test_no_games_yet():
+    table = build_standings([], TEAMS)
+    assert table["dates"].tolist() == [""]
+    assert _division([]) == [(team, 0, 0, "--") for team in ["AAA", "BBB", "CCC", "DDD", "EEE"]]
+
+def test_standings_on_every_date():
+    schedule = [
+        _game("1999-04-05", "AAA", "BBB", 1, 0),
+        _game("1999-04-06", "BBB", "AAA", 5, 0),
+        _game("1999-04-07", "BBB", "AAA", 5, 0),
+    ]
+    by_date = standings_by_date(build_standings(schedule, TEAMS))
+    aaa, bbb = by_date["teams"].index("AAA"), by_date["teams"].index("BBB")
+    assert by_date["dates"] == ["1999-04-05", "1999-04-06", "1999-04-07"]
+    assert [(day[aaa], day[bbb]) for day in by_date["W"]] == [(1, 0), (1, 1), (1, 2)]
+    # on the first day BBB's -1 run differential puts it behind the teams that haven't played
+    assert [(day[aaa], day[bbb]) for day in by_date["rank"]] == [(1, 5), (2, 1), (2, 1)]
+    assert [(day[aaa], day[bbb]) for day in by_date["GB"]] == [(0, 1), (0.0, 0.0), (1.0, 0.0)]
+    assert by_date["pct"][-1][bbb] == 0.667
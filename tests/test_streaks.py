@@ -0,0 +1,54 @@
+from streaks import team_streaks, hitting_streaks
+
+TEAMS = [{"id": team} for team in ["AAA", "BBB", "CCC"]]
+
+
+def _game(date, home, away, home_score, away_score, completed=True):
+    return {"id": f"{date}_{away}@{home}", "date": date, "home_team": home, "away_team": away,
+            "home_score": home_score, "away_score": away_score, "completed": completed}
+
+def _line(pid, game, ab, h):
+    return {"Player ID": pid, "Player": pid.title(), "Game#": game, "AB": ab, "H": h}
+
+
+def test_team_streaks_run_to_the_last_completed_game():
+    # AAA: W W L W W W W W W W W W, BBB loses every game to AAA; an unfinished game counts for no one
+    results = [True, True, False] + [True] * 9
+    schedule = [_game(f"1999-04-{day:02d}", "AAA", "BBB", 5 if won else 1, 3)
+                for day, won in enumerate(results, start=1)]
+    schedule.append(_game("1999-04-20", "AAA", "BBB", 0, 0, completed=False))
+    streaks = team_streaks(schedule, TEAMS)
+
+    assert streaks["AAA"] == {"G": 12, "W": 11, "L": 1, "streak": "W9", "last10": "9-1"}
+    # BBB's only win is the first of its last 10
+    assert streaks["BBB"] == {"G": 12, "W": 1, "L": 11, "streak": "L9", "last10": "1-9"}
+    assert streaks["CCC"] == {"G": 0, "W": 0, "L": 0, "streak": "", "last10": "0-0"}
+
+def test_a_streak_of_one_after_the_other_result():
+    schedule = [_game("1999-04-01", "AAA", "BBB", 2, 1), _game("1999-04-02", "BBB", "AAA", 4, 3)]
+    streaks = team_streaks(schedule, TEAMS)
+    assert (streaks["AAA"]["streak"], streaks["BBB"]["streak"]) == ("L1", "W1")
+
+def test_hitting_streaks_skip_games_without_an_at_bat():
+    log = [
+        _line("aaa", 1, 4, 1), _line("aaa", 2, 3, 2),
+        # walked every time: neither extends nor ends the streak
+        _line("aaa", 3, 0, 0),
+        _line("aaa", 4, 4, 1),
+        # 0 for 4: the streak ends at 3
+        _line("aaa", 5, 4, 0),
+        # two lines in one game count as one game, here with a hit
+        _line("aaa", 6, 1, 0), _line("aaa", 6, 2, 1),
+    ]
+    assert hitting_streaks(log) == {"aaa": {"name": "Aaa", "current": 1, "longest": 3}}
+
+def test_hitting_streaks_do_not_run_across_players():
+    log = [_line("aaa", 1, 4, 1), _line("aaa", 2, 4, 1), _line("bbb", 1, 4, 1), _line("bbb", 2, 4, 0),
+           _line("ccc", 1, 0, 0)]
+    assert hitting_streaks(log) == {
+        "aaa": {"name": "Aaa", "current": 2, "longest": 2},
+        "bbb": {"name": "Bbb", "current": 0, "longest": 1},
+        # only walks: no streak either way
+        "ccc": {"name": "Ccc", "current": 0, "longest": 0},
+    }
+    assert hitting_streaks([]) == {}
@@ -0,0 +1,57 @@
+import os
+import json
+
+from aggregation import aggregate_gamelog, batting_records, pitching_records
+from generate_stats import build_game_logs, build_schedule
+from schedule_index import build_schedule_index
+from window_stats import standard_windows, team_games, window_sections
+from conftest import ROOT
+
+
+def _game(date, home="AAA", away="BBB", completed=True):
+    return {"id": f"{date}_{away}@{home}", "date": date, "home_team": home, "away_team": away, "completed": completed}
+
+
+def test_standard_windows_end_at_the_latest_game_played():
+    schedule = [_game("1999-04-05"), _game("1999-05-03"), _game("1999-05-20"), _game("1999-06-02", completed=False)]
+    assert standard_windows(schedule) == [
+        {"key": "last7", "label": "Last 7 days", "dates": ["1999-05-14", "1999-05-20"]},
+        {"key": "last15", "label": "Last 15 days", "dates": ["1999-05-06", "1999-05-20"]},
+        {"key": "1999-04", "label": "April", "dates": ["1999-04-01", "1999-04-30"]},
+        {"key": "1999-05", "label": "May", "dates": ["1999-05-01", "1999-05-31"]},
+    ]
+    assert standard_windows([_game("1999-04-05", completed=False)]) == []
+
+def test_team_games_count_completed_games_in_the_window():
+    schedule = [_game("1999-04-05"), _game("1999-04-06", home="CCC"), _game("1999-04-09"),
+                _game("1999-04-07", completed=False)]
+    assert team_games(schedule, "1999-04-05", "1999-04-08") == {"AAA": 1, "BBB": 2, "CCC": 1}
+
+def test_a_window_over_the_whole_season_matches_the_season_records(sheets):
+    logs = dict(zip(["batting_log", "pitching_log", "fielding_log"],
+                    build_game_logs(sheets["GameLog"], build_schedule_index(sheets["Schedule"]))))
+    schedule = build_schedule(sheets["Schedule"])
+    with open(os.path.join(ROOT, "data", "teams.json")) as f:
+        teams = json.load(f)
+    windows = {window["key"]: sections for window, sections in window_sections(logs, schedule, teams)}
+    # the fixture season is a week or so of April
+    season = windows["1999-04"]
+    assert season == windows["last15"]
+
+    totals = aggregate_gamelog(sheets["GameLog"])
+    for section, records, stats in [
+        ("batting", batting_records(totals), ["G", "PA", "AB", "H", "HR", "SB", "AVG", "OBP", "SLG", "OPS"]),
+        ("pitching", pitching_records(totals), ["IP", "ER", "HR", "W", "L", "SV", "W-L%", "ERA", "H9", "SO9", "SO/BB"]),
+    ]:
+        # traded players' lines are split by team in the season records
+        lines = {}
+        for rec in records:
+            lines.setdefault(rec["Player ID"], []).append(rec)
+        expected = {pid: recs[0] for pid, recs in lines.items() if len(recs) == 1}
+        got = {line["Player ID"]: line for line in season[section] if line["Player ID"] in expected}
+        assert len(got) == len(expected) > 0
+        for pid, line in got.items():
+            assert {k: line[k] for k in stats} == {k: expected[pid][k] for k in stats}, pid
+
+    assert season["leaders"]["batting"]["MLB"]["HR"][0]["value"] == max(line["HR"] for line in season["batting"])
+    assert "fielding" not in season["leaders"]